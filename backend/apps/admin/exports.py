@@ -0,0 +1,140 @@
+"""
+Streaming CSV / NDJSON exports.
+
+Rows are read with ``values_list(...).iterator(chunk_size)``. Related
+columns (``cohort__name`` ...) are joined into the same query and no model
+instances are built, so memory use depends on ``chunk_size``, not on the
+size of the table. Output is produced one chunk at a time as bytes,
+optionally gzip-compressed on the fly, for StreamingHttpResponse or a file.
+"""
+
+import csv
+import io
+import zlib
+from dataclasses import dataclass
+
+from django.contrib.auth import get_user_model
+from django.core.serializers.json import DjangoJSONEncoder
+
+from apps.common.models import Course
+from apps.students.models import StudentProfile
+
+DEFAULT_CHUNK_SIZE = 2000
+FORMATS = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+
+@dataclass(frozen=True)
+class ExportSpec:
+    """A named export: ``columns`` maps output header -> ORM lookup path"""
+
+    model: type
+    columns: dict
+
+    def rows(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        return (
+            self.model.objects.order_by("pk")
+            .values_list(*self.columns.values())
+            .iterator(chunk_size=chunk_size)
+        )
+
+
+EXPORTS = {
+    "users": ExportSpec(
+        get_user_model(),
+        {
+            "id": "id",
+            "email": "email",
+            "username": "username",
+            "first_name": "first_name",
+            "last_name": "last_name",
+            "role": "role",
+            "is_active": "is_active",
+            "date_joined": "date_joined",
+            "last_login": "last_login",
+        },
+    ),
+    "students": ExportSpec(
+        StudentProfile,
+        {
+            "id": "id",
+            "student_id": "student_id",
+            "user_id": "user_id",
+            "email": "user__email",
+            "first_name": "user__first_name",
+            "last_name": "user__last_name",
+            "cohort_id": "cohort_id",
+            "cohort": "cohort__name",
+            "team_id": "team_id",
+            "team": "team__name",
+            "enrollment_date": "enrollment_date",
+            "graduation_year": "graduation_year",
+        },
+    ),
+    "courses": ExportSpec(
+        Course,
+        {
+            "id": "id",
+            "code": "code",
+            "name": "name",
+            "description": "description",
+            "cohort_id": "cohort_id",
+            "cohort": "cohort__name",
+            "created_at": "created_at",
+        },
+    ),
+}
+
+
+def _csv_chunks(spec, chunk_size):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(spec.columns)
+    for count, row in enumerate(spec.rows(chunk_size), start=1):
+        writer.writerow(row)
+        if count % chunk_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _ndjson_chunks(spec, chunk_size):
+    headers = list(spec.columns)
+    encoder = DjangoJSONEncoder(separators=(",", ":"))
+    lines = []
+    for row in spec.rows(chunk_size):
+        lines.append(encoder.encode(dict(zip(headers, row))))
+        if len(lines) >= chunk_size:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def stream_export(name, fmt="csv", compress=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield the export ``name`` as bytes, one chunk of ``chunk_size`` rows at
+    a time. Raises KeyError/ValueError for unknown exports or formats
+    before any query runs.
+    """
+    spec = EXPORTS[name]
+    if fmt == "csv":
+        chunks = _csv_chunks(spec, chunk_size)
+    elif fmt == "ndjson":
+        chunks = _ndjson_chunks(spec, chunk_size)
+    else:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    return _encode(chunks, compress)
+
+
+def _encode(chunks, compress):
+    # wbits=31 writes a gzip header/trailer rather than a raw zlib stream
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+    for chunk in chunks:
+        data = chunk.encode()
+        if compressor is not None:
+            data = compressor.compress(data)
+        if data:
+            yield data
+    if compressor is not None:
+        yield compressor.flush()
@@ -0,0 +1,24 @@
+"""Background tasks for the admin app (discovered by apps.jobs)"""
+
+import tempfile
+
+from django.core.files import File
+from django.core.files.storage import storages
+from django.utils import timezone
+
+from apps.jobs.tasks import task
+from .exports import stream_export
+
+
+@task("admin.export", max_attempts=2)
+def export(name, fmt="csv", compress=False):
+    """Write an export to job storage; the job's download link serves it"""
+    suffix = ".gz" if compress else ""
+    filename = f"exports/{name}-{timezone.now():%Y%m%d-%H%M%S}.{fmt}{suffix}"
+    size = 0
+    with tempfile.TemporaryFile() as spool:
+        for chunk in stream_export(name, fmt, compress=compress):
+            size += spool.write(chunk)
+        spool.seek(0)
+        saved = storages["jobs"].save(filename, File(spool))
+    return {"file": saved, "bytes": size, "export": name, "format": fmt}
@@ -0,0 +1,43 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.admin.exports import DEFAULT_CHUNK_SIZE, EXPORTS, FORMATS, stream_export
+
+
+class Command(BaseCommand):
+    help = "Stream a users/students/courses export to a file or stdout"
+
+    def add_arguments(self, parser):
+        parser.add_argument("name", choices=sorted(EXPORTS))
+        parser.add_argument("--format", choices=sorted(FORMATS), default="csv")
+        parser.add_argument("--gzip", action="store_true", help="Gzip the output")
+        parser.add_argument(
+            "--output", "-o", default="-", help="Output file, or '-' for stdout"
+        )
+        parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        chunks = stream_export(
+            options["name"],
+            options["format"],
+            compress=options["gzip"],
+            chunk_size=options["chunk_size"],
+        )
+        if options["output"] == "-":
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+            return
+
+        try:
+            output = open(options["output"], "wb")
+        except OSError as exc:
+            raise CommandError(f"Cannot open output: {exc}")
+        written = 0
+        with output:
+            for chunk in chunks:
+                written += output.write(chunk)
+        self.stdout.write(
+            self.style.SUCCESS(f"Wrote {written} bytes to {options['output']}")
+        )
@@ -0,0 +1,94 @@
+import datetime
+import gzip
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models.query import QuerySet
+from django.http import StreamingHttpResponse
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.students.models import Cohort, StudentProfile
+from .exports import DEFAULT_CHUNK_SIZE
+
+User = get_user_model()
+
+
+class ExportTests(TestCase):
+    def setUp(self):
+        admin = User.objects.create_user(
+            username="admin", email="admin@example.com", password="x", role="admin"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(admin)
+        today = datetime.date.today()
+        self.cohort = Cohort.objects.create(
+            name="Cohort", start_date=today, end_date=today
+        )
+        self.created = 0
+
+    def add_students(self, count):
+        users = User.objects.bulk_create(
+            User(
+                username=f"s{index}",
+                email=f"s{index}@example.com",
+                password="!",
+                role="student",
+            )
+            for index in range(self.created, self.created + count)
+        )
+        StudentProfile.objects.bulk_create(
+            StudentProfile(
+                user=user,
+                student_id=f"S{self.created + offset}",
+                enrollment_date=self.cohort.start_date,
+                cohort=self.cohort if offset % 2 else None,
+            )
+            for offset, user in enumerate(users)
+        )
+        self.created += count
+
+    def export(self, url="/api/admin/exports/students.csv"):
+        """Response, its body chunks and the queries run while streaming"""
+        response = self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            chunks = list(response.streaming_content)
+        return response, chunks, len(queries)
+
+    def test_streams_rows_through_iterator(self):
+        self.add_students(5)
+        with mock.patch.object(
+            QuerySet, "iterator", autospec=True, side_effect=QuerySet.iterator
+        ) as iterator:
+            response, chunks, _ = self.export()
+
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        iterator.assert_called_once_with(mock.ANY, chunk_size=DEFAULT_CHUNK_SIZE)
+        lines = b"".join(chunks).decode().splitlines()
+        self.assertEqual(lines[0].split(",")[:3], ["id", "student_id", "user_id"])
+        self.assertEqual(len(lines), 6)
+
+    def test_query_count_flat_as_rows_grow(self):
+        self.add_students(10)
+        _, small, small_queries = self.export()
+        self.add_students(3 * DEFAULT_CHUNK_SIZE // 2)
+        _, large, large_queries = self.export()
+
+        self.assertEqual(len(b"".join(small).splitlines()), 11)
+        self.assertEqual(
+            len(b"".join(large).splitlines()), 11 + 3 * DEFAULT_CHUNK_SIZE // 2
+        )
+        # One chunk per DEFAULT_CHUNK_SIZE rows, not one body
+        self.assertEqual(len(large), 2)
+        self.assertEqual(large_queries, small_queries)
+        self.assertEqual(small_queries, 1)
+
+    def test_gzip_and_ndjson(self):
+        self.add_students(3)
+        response, chunks, _ = self.export("/api/admin/exports/students.ndjson.gz")
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        self.assertEqual(len(gzip.decompress(b"".join(chunks)).splitlines()), 3)
@@ -0,0 +1,13 @@
+from django.urls import re_path
+from .exports import EXPORTS, FORMATS
+from .views import ExportView
+
+urlpatterns = [
+    re_path(
+        r"^exports/(?P<name>{})\.(?P<fmt>{})(?P<gz>\.gz)?$".format(
+            "|".join(EXPORTS), "|".join(FORMATS)
+        ),
+        ExportView.as_view(),
+        name="export",
+    ),
+]
@@ -0,0 +1,38 @@
+from django.http import StreamingHttpResponse
+from rest_framework.views import APIView
+
+from apps.common.negotiation import IgnoreAcceptNegotiation
+from apps.common.permissions import IsAdmin
+from apps.jobs.tasks import enqueue
+from apps.jobs.views import job_accepted
+from .exports import FORMATS, stream_export
+
+
+class ExportView(APIView):
+    """
+    Stream a full export (admin only)
+    GET /api/admin/exports/<users|students|courses>.<csv|ndjson>[.gz]
+
+    POST to the same URL writes the export in a background job instead and
+    returns 202; the finished job links to the file.
+    """
+
+    permission_classes = [IsAdmin]
+    content_negotiation_class = IgnoreAcceptNegotiation
+
+    def get(self, request, name, fmt, gz=None):
+        filename = f"{name}.{fmt}{gz or ''}"
+        response = StreamingHttpResponse(
+            stream_export(name, fmt, compress=bool(gz)),
+            content_type="application/gzip" if gz else FORMATS[fmt],
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    def post(self, request, name, fmt, gz=None):
+        job = enqueue(
+            "admin.export",
+            {"name": name, "fmt": fmt, "compress": bool(gz)},
+            user=request.user,
+        )
+        return job_accepted(request, job)
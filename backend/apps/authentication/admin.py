@@ -1,6 +1,8 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from apps.search.backends import search_entries
 from .models import User
+from .revocation import revoke_user_tokens
 
 
 @admin.register(User)
@@ -14,16 +16,25 @@ class UserAdmin(BaseUserAdmin):
         "is_active",
         "date_joined",
     ]
-    list_filter = ["role", "auth_provider", "is_verified", "is_active", "is_staff"]
+    list_filter = [
+        "role",
+        "auth_provider",
+        "is_verified",
+        "is_active",
+        "is_staff",
+        "student_profile__cohort",
+    ]
     search_fields = ["email", "username", "first_name", "last_name"]
     ordering = ["-date_joined"]
+    readonly_fields = ["token_version"]
+    actions = ["revoke_tokens", "deactivate_and_revoke"]
 
     fieldsets = (
         (None, {"fields": ("email", "password")}),
         ("Personal Info", {"fields": ("first_name", "last_name", "username")}),
         (
             "Role & Authentication",
-            {"fields": ("role", "auth_provider", "is_verified")},
+            {"fields": ("role", "auth_provider", "is_verified", "token_version")},
         ),
         (
             "Permissions",
@@ -49,3 +60,27 @@ class UserAdmin(BaseUserAdmin):
             },
         ),
     )
+
+    def get_search_results(self, request, queryset, search_term):
+        # Served from the full-text index instead of icontains over
+        # search_fields (which stays set so the changelist shows a search box)
+        if not search_term.strip():
+            return queryset, False
+        matches = search_entries(search_term, kinds=["user"]).values("user_id")
+        return queryset.filter(pk__in=matches), False
+
+    @admin.action(description="Revoke all tokens (log out everywhere)")
+    def revoke_tokens(self, request, queryset):
+        count = revoke_user_tokens(queryset)
+        self.message_user(
+            request, f"Revoked all tokens for {count} users.", messages.SUCCESS
+        )
+
+    @admin.action(description="Deactivate and revoke all tokens")
+    def deactivate_and_revoke(self, request, queryset):
+        count = revoke_user_tokens(queryset, is_active=False)
+        self.message_user(
+            request,
+            f"Deactivated {count} users and revoked their tokens.",
+            messages.SUCCESS,
+        )
@@ -5,3 +5,19 @@ class AuthenticationConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.authentication"
     label = "authentication"
+
+    def ready(self):
+        from apps.common.metrics import registry
+        from .blacklist import get_blacklist
+        from .last_login import get_last_login_buffer
+
+        registry.register_stats(
+            "last_login_buffer",
+            "last_login write-behind buffer",
+            lambda: get_last_login_buffer().stats(),
+        )
+        registry.register_stats(
+            "token_blacklist",
+            "Refresh token blacklist",
+            lambda: get_blacklist().stats(),
+        )
@@ -0,0 +1,264 @@
+import json
+import math
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.http import HttpResponseNotModified, JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotAuthenticated
+from rest_framework.settings import api_settings as drf_settings
+from rest_framework_simplejwt.exceptions import (
+    AuthenticationFailed,
+    InvalidToken,
+    TokenError,
+)
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.common.mixins import (
+    build_conditional_entry,
+    conditional_cache_key,
+    conditional_headers,
+    is_not_modified,
+)
+from .authentication import ClaimsUser, aget_cached_user
+from .hashing import HashPoolSaturated, get_password_verifier
+from .last_login import get_last_login_buffer
+from .serializers import LoginSerializer, UserSerializer
+from .throttles import LOGIN_THROTTLES, check_throttles
+from .tokens import PlatformRefreshToken, averify_refresh_token
+from .views import CurrentUserView
+
+User = get_user_model()
+
+
+def _error(message, status_code, **headers):
+    response = JsonResponse({"error": message}, status=status_code)
+    for name, value in headers.items():
+        response[name] = value
+    return response
+
+
+def _api_error(exc):
+    """Response for a DRF APIException, shaped like DRF's exception handler"""
+    data = exc.detail if isinstance(exc.detail, dict) else {"detail": exc.detail}
+    response = JsonResponse(data, status=exc.status_code)
+    if exc.status_code == status.HTTP_401_UNAUTHORIZED:
+        response["WWW-Authenticate"] = (
+            f'{api_settings.AUTH_HEADER_TYPES[0]} realm="api"'
+        )
+    return response
+
+
+async def _authenticate(request):
+    """
+    Run the configured DRF authentication classes that have an async path
+    (``aauthenticate``); raises NotAuthenticated when none accepts the request
+    """
+    for auth_class in drf_settings.DEFAULT_AUTHENTICATION_CLASSES:
+        authenticator = auth_class()
+        if not hasattr(authenticator, "aauthenticate"):
+            continue
+        result = await authenticator.aauthenticate(request)
+        if result is not None:
+            return result[0]
+    raise NotAuthenticated()
+
+
+class AsyncAuthenticatedView(View):
+    """Async view base: sets request.user from the JWT or answers 401"""
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            request.user = await _authenticate(request)
+        except APIException as exc:
+            return _api_error(exc)
+        return await super().dispatch(request, *args, **kwargs)
+
+
+def _rotate(refresh):
+    """Access token (and rotated refresh token) data, as TokenRefreshView"""
+    data = {"access": str(refresh.access_token)}
+    if api_settings.ROTATE_REFRESH_TOKENS:
+        refresh.set_jti()
+        refresh.set_exp()
+        refresh.set_iat()
+        data["refresh"] = str(refresh)
+    return data
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncLoginView(View):
+    """
+    Async JWT Login for the ASGI deployment
+    POST /api/auth/login/async/
+
+    Same contract as LoginView, but password verification runs on the
+    bounded pool from hashing.py and the event loop stays free for other
+    requests. Returns 503 with Retry-After when the pool is saturated, and
+    429 with Retry-After when the LoginView throttles reject the attempt.
+    """
+
+    http_method_names = ["post"]
+
+    async def post(self, request):
+        try:
+            payload = json.loads(request.body or b"{}")
+        except ValueError:
+            return _error("Malformed JSON", status.HTTP_400_BAD_REQUEST)
+
+        wait = check_throttles(LOGIN_THROTTLES, request, payload)
+        if wait is not None:
+            return _error(
+                "Too many login attempts, please retry later",
+                status.HTTP_429_TOO_MANY_REQUESTS,
+                **{"Retry-After": str(math.ceil(wait))},
+            )
+
+        serializer = LoginSerializer(data=payload)
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        email = serializer.validated_data["email"]
+        password = serializer.validated_data["password"]
+        verifier = get_password_verifier()
+
+        try:
+            user = await User._default_manager.aget(**{User.USERNAME_FIELD: email})
+        except User.DoesNotExist:
+            user = None
+
+        try:
+            if user is None:
+                await verifier.burn(password)
+                valid = False
+            else:
+                valid = await verifier.verify(password, user.password)
+        except HashPoolSaturated:
+            return _error(
+                "Too many concurrent logins, please retry",
+                status.HTTP_503_SERVICE_UNAVAILABLE,
+                **{"Retry-After": str(settings.AUTH_HASH_RETRY_AFTER)},
+            )
+
+        # Mirrors ModelBackend: inactive users fail authentication outright
+        if not valid or not user.is_active:
+            return _error("Invalid credentials", status.HTTP_401_UNAUTHORIZED)
+
+        if api_settings.UPDATE_LAST_LOGIN:
+            get_last_login_buffer().record(user.pk)
+
+        refresh = PlatformRefreshToken.for_user(user)
+
+        return JsonResponse(
+            {
+                "user": UserSerializer(user).data,
+                "tokens": {
+                    "refresh": str(refresh),
+                    "access": str(refresh.access_token),
+                },
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class AsyncCurrentUserView(AsyncAuthenticatedView):
+    """
+    Async current user profile for the ASGI deployment
+    GET /api/auth/me/async/
+
+    Same payload, cache entry and ETag/Last-Modified handling as
+    CurrentUserView. With stateless JWT auth and warm caches the request
+    runs no query at all; otherwise the User load is awaited.
+    """
+
+    http_method_names = ["get"]
+
+    async def get(self, request):
+        user = request.user
+        if isinstance(user, ClaimsUser):
+            # The token's version may be older than the row's
+            try:
+                user = await aget_cached_user(user.pk, user.version)
+            except User.DoesNotExist:
+                return _api_error(
+                    AuthenticationFailed("User not found", code="user_not_found")
+                )
+        key = conditional_cache_key("current-user", user.pk, user.version)
+        entry = cache.get(key)
+        if entry is None:
+            entry = build_conditional_entry(
+                key, UserSerializer(user).data, user.updated_at
+            )
+            cache.set(key, entry, CurrentUserView.conditional_cache_timeout)
+
+        headers = conditional_headers(entry)
+        if is_not_modified(request, entry):
+            return HttpResponseNotModified(headers=headers)
+        return JsonResponse(entry["data"], headers=headers)
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncLogoutView(AsyncAuthenticatedView):
+    """
+    Async logout for the ASGI deployment
+    POST /api/auth/logout/async/
+
+    Revokes the posted refresh token through the blacklist backend's async
+    path; with the buffered Bloom backend that is an in-memory write.
+    """
+
+    http_method_names = ["post"]
+
+    async def post(self, request):
+        try:
+            raw_token = json.loads(request.body or b"{}").get("refresh_token")
+        except (ValueError, AttributeError):
+            raw_token = None
+        if not isinstance(raw_token, str) or not raw_token:
+            return _error("Invalid token", status.HTTP_400_BAD_REQUEST)
+        try:
+            token = await averify_refresh_token(raw_token)
+        except TokenError:
+            return _error("Invalid token", status.HTTP_400_BAD_REQUEST)
+        await token.ablacklist()
+        return JsonResponse(
+            {"message": "Successfully logged out"}, status=status.HTTP_200_OK
+        )
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncTokenRefreshView(View):
+    """
+    Async token refresh for the ASGI deployment
+    POST /api/auth/token/refresh/async/
+
+    Same contract as the token/refresh/ endpoint, including rotation and
+    blacklisting of the used refresh token.
+    """
+
+    http_method_names = ["post"]
+
+    async def post(self, request):
+        try:
+            payload = json.loads(request.body or b"{}")
+        except ValueError:
+            return _error("Malformed JSON", status.HTTP_400_BAD_REQUEST)
+        raw_token = payload.get("refresh") if isinstance(payload, dict) else None
+        if not isinstance(raw_token, str) or not raw_token:
+            return JsonResponse(
+                {"refresh": ["This field is required."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            refresh = await averify_refresh_token(raw_token)
+            await refresh.areload_user_claims()
+        except TokenError as exc:
+            return _api_error(InvalidToken(exc.args[0]))
+        if api_settings.ROTATE_REFRESH_TOKENS and api_settings.BLACKLIST_AFTER_ROTATION:
+            await refresh.ablacklist()
+        return JsonResponse(_rotate(refresh), status=status.HTTP_200_OK)
@@ -0,0 +1,171 @@
+import uuid
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.common.utils import LRUTTLCache
+from .revocation import TOKEN_VERSION_CLAIM, ais_token_current, is_token_current
+
+User = get_user_model()
+
+# Full User rows for ClaimsUser, keyed by pk -> (version, user).
+# Evicted from the post_save hook in apps/users/signals.py; the TTL bounds
+# staleness for changes made by other worker processes.
+user_cache = LRUTTLCache(
+    maxsize=settings.JWT_USER_CACHE_SIZE, ttl=settings.JWT_USER_CACHE_TTL
+)
+
+
+def get_cached_user(user_id, min_version=0):
+    """
+    Return the User for ``user_id`` from the in-process cache, loading it
+    when missing or older than the version the caller's token was issued at.
+    """
+    entry = user_cache.get(user_id)
+    if entry is not None and entry[0] >= min_version:
+        return entry[1]
+    user = User.objects.get(pk=user_id)
+    user_cache.set(user_id, (user.version, user))
+    return user
+
+
+async def aget_cached_user(user_id, min_version=0):
+    entry = user_cache.get(user_id)
+    if entry is not None and entry[0] >= min_version:
+        return entry[1]
+    user = await User.objects.aget(pk=user_id)
+    user_cache.set(user_id, (user.version, user))
+    return user
+
+
+class ClaimsUser:
+    """
+    Lightweight request.user built from access token claims.
+
+    ``id``, ``role`` and ``is_active`` come straight from the token, which is
+    all the permission classes in apps/common/permissions.py read. Any other
+    attribute is served from the full User, fetched through the cache the
+    first time a view actually needs it.
+    """
+
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, token):
+        self.token = token
+        self.id = self.pk = uuid.UUID(str(token[api_settings.USER_ID_CLAIM]))
+        self.role = token["role"]
+        self.is_active = token["is_active"]
+        self.version = token.get("user_version", 0)
+
+    @cached_property
+    def full_user(self):
+        try:
+            return get_cached_user(self.pk, self.version)
+        except User.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+    def __getattr__(self, name):
+        # Only reached for attributes not set from the claims above
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.full_user, name)
+
+    def __eq__(self, other):
+        if isinstance(other, (ClaimsUser, User)):
+            return self.pk == other.pk
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.pk)
+
+    def __str__(self):
+        return f"ClaimsUser {self.pk} ({self.role})"
+
+
+def user_row(user):
+    """The User behind ``request.user``; a ClaimsUser loads it through the cache"""
+    return user.full_user if isinstance(user, ClaimsUser) else user
+
+
+class VersionedJWTAuthentication(JWTAuthentication):
+    """
+    Default JWT authentication plus the per-user token_version check, so a
+    single counter bump revokes every access token a user holds.
+    """
+
+    def get_user(self, validated_token):
+        user = super().get_user(validated_token)
+        if validated_token.get(TOKEN_VERSION_CLAIM, 0) != user.token_version:
+            raise AuthenticationFailed(_("Token has been revoked"), code="token_revoked")
+        return user
+
+    async def aauthenticate(self, request):
+        """
+        ``authenticate`` for plain Django async views. Header parsing and
+        token validation are CPU-only; the user lookup is awaited.
+        """
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+        try:
+            user = await self.user_model.objects.aget(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        if validated_token.get(TOKEN_VERSION_CLAIM, 0) != user.token_version:
+            raise AuthenticationFailed(_("Token has been revoked"), code="token_revoked")
+        return user
+
+
+class StatelessJWTAuthentication(VersionedJWTAuthentication):
+    """
+    JWT authentication that skips the per-request User SELECT by trusting
+    the role/is_active claims added by PlatformRefreshToken. Revocation and
+    deactivation are enforced through the cached token version instead:
+    User.save bumps it when either claim changes, and refresh re-reads the
+    claims from the database.
+    Tokens issued before those claims existed fall back to the regular
+    database lookup.
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+        if "role" not in validated_token or "is_active" not in validated_token:
+            return super().get_user(validated_token)
+        if not validated_token["is_active"]:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        if not is_token_current(validated_token):
+            raise AuthenticationFailed(_("Token has been revoked"), code="token_revoked")
+        return ClaimsUser(validated_token)
+
+    async def aget_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+        if "role" not in validated_token or "is_active" not in validated_token:
+            return await super().aget_user(validated_token)
+        if not validated_token["is_active"]:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        if not await ais_token_current(validated_token):
+            raise AuthenticationFailed(_("Token has been revoked"), code="token_revoked")
+        return ClaimsUser(validated_token)
@@ -0,0 +1,282 @@
+"""
+Pluggable refresh-token blacklist.
+
+``TOKEN_BLACKLIST["BACKEND"]`` selects the implementation:
+
+* ``DatabaseBlacklist`` writes each revocation straight to ``RevokedToken``
+  and checks every refresh against the table.
+* ``BufferedBloomBlacklist`` keeps the revoked JTIs of this process in a Bloom
+  filter backed by an exact set, so the common "never revoked" answer costs
+  no query. Revocations are queued and written in batches by a background
+  flusher, and revocations made by other workers are pulled in every
+  ``sync_interval`` seconds. A token revoked in one worker can therefore still
+  be refreshed in another for up to ``flush_interval + sync_interval`` seconds.
+  ``revoked_at`` is stamped by the writing worker's clock before its insert
+  commits, so each sync re-reads the last ``sync_overlap`` seconds as well:
+  rows committed late or written under clock skew within that margin are
+  still picked up.
+
+Only one ``RevokedToken`` row is kept per revoked token (there is no
+per-issued-token table) and ``manage.py purge_revoked_tokens`` drops rows
+whose token has expired anyway.
+"""
+
+import atexit
+import datetime
+import hashlib
+import math
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings; no false negatives"""
+
+    def __init__(self, capacity, error_rate):
+        capacity = max(capacity, 1)
+        bits = -capacity * math.log(error_rate) / (math.log(2) ** 2)
+        self.size = max(int(bits), 8)
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, item):
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item):
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class BaseBlacklist:
+    """Interface every blacklist backend implements"""
+
+    def revoke(self, jti, expires_at):
+        raise NotImplementedError
+
+    def is_revoked(self, jti):
+        raise NotImplementedError
+
+    async def arevoke(self, jti, expires_at):
+        await sync_to_async(self.revoke)(jti, expires_at)
+
+    async def ais_revoked(self, jti):
+        return await sync_to_async(self.is_revoked)(jti)
+
+    def flush(self):
+        """Persist any buffered revocations"""
+
+    def stats(self):
+        return {}
+
+
+class DatabaseBlacklist(BaseBlacklist):
+    """Synchronous, query-per-call backend"""
+
+    def revoke(self, jti, expires_at):
+        from .models import RevokedToken
+
+        RevokedToken.objects.bulk_create(
+            [RevokedToken(jti=jti, expires_at=expires_at)], ignore_conflicts=True
+        )
+
+    def is_revoked(self, jti):
+        from .models import RevokedToken
+
+        return RevokedToken.objects.filter(jti=jti).exists()
+
+    async def arevoke(self, jti, expires_at):
+        from .models import RevokedToken
+
+        await RevokedToken.objects.abulk_create(
+            [RevokedToken(jti=jti, expires_at=expires_at)], ignore_conflicts=True
+        )
+
+    async def ais_revoked(self, jti):
+        from .models import RevokedToken
+
+        return await RevokedToken.objects.filter(jti=jti).aexists()
+
+
+class BufferedBloomBlacklist(BaseBlacklist):
+    """Bloom filter + exact set in memory, batched background persistence"""
+
+    def __init__(
+        self,
+        flush_interval=2.0,
+        flush_batch=500,
+        sync_interval=5.0,
+        sync_overlap=60.0,
+        bloom_capacity=100_000,
+        bloom_error_rate=0.001,
+    ):
+        self.flush_interval = flush_interval
+        self.flush_batch = flush_batch
+        self.sync_interval = sync_interval
+        self.sync_overlap = datetime.timedelta(seconds=sync_overlap)
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._revoked = {}  # jti -> expires_at
+        self._bloom = BloomFilter(bloom_capacity, bloom_error_rate)
+        self._pending = []
+        self._loaded = False
+        self._last_sync = None
+        self._next_sync = 0.0
+        self._thread = None
+        self._flushes = 0
+        self._bloom_hits = 0
+        self._bloom_misses = 0
+
+    # Public API
+
+    def revoke(self, jti, expires_at):
+        self._ensure_started()
+        with self._lock:
+            self._remember(jti, expires_at)
+            self._pending.append((jti, expires_at))
+            pending = len(self._pending)
+        if pending >= self.flush_batch:
+            self._wakeup.set()
+
+    def is_revoked(self, jti):
+        self._ensure_started()
+        if jti not in self._bloom:
+            self._bloom_misses += 1
+            return False
+        self._bloom_hits += 1
+        return jti in self._revoked
+
+    # Both only touch memory once the initial load from the table is done
+
+    async def arevoke(self, jti, expires_at):
+        if not self._loaded:
+            await sync_to_async(self._ensure_started)()
+        self.revoke(jti, expires_at)
+
+    async def ais_revoked(self, jti):
+        if not self._loaded:
+            await sync_to_async(self._ensure_started)()
+        return self.is_revoked(jti)
+
+    def flush(self):
+        # Serialize flushers so a caller never returns while another thread
+        # still holds (and may hand back) part of the queue
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return
+            from .models import RevokedToken
+
+            try:
+                RevokedToken.objects.bulk_create(
+                    [RevokedToken(jti=jti, expires_at=exp) for jti, exp in batch],
+                    batch_size=self.flush_batch,
+                    ignore_conflicts=True,
+                )
+            except DatabaseError:
+                # Keep the batch for the next attempt rather than losing revocations
+                with self._lock:
+                    self._pending[:0] = batch
+                raise
+            self._flushes += 1
+
+    def stats(self):
+        return {
+            "revoked": len(self._revoked),
+            "pending": len(self._pending),
+            "flushes": self._flushes,
+            "bloom_hits": self._bloom_hits,
+            "bloom_misses": self._bloom_misses,
+        }
+
+    # Internals
+
+    def _remember(self, jti, expires_at):
+        self._revoked[jti] = expires_at
+        self._bloom.add(jti)
+
+    def _ensure_started(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._sync()
+            self._loaded = True
+            self._thread = threading.Thread(
+                target=self._run, name="token-blacklist-flusher", daemon=True
+            )
+            self._thread.start()
+            atexit.register(self.flush)
+
+    def _sync(self):
+        """Pull revocations written by other workers since the last sync"""
+        from .models import RevokedToken
+
+        now = timezone.now()
+        rows = RevokedToken.objects.filter(expires_at__gt=now)
+        if self._last_sync is not None:
+            rows = rows.filter(revoked_at__gte=self._last_sync - self.sync_overlap)
+        for jti, expires_at in rows.values_list("jti", "expires_at").iterator():
+            self._remember(jti, expires_at)
+        self._last_sync = now
+        self._next_sync = time.monotonic() + self.sync_interval
+
+    def _prune(self):
+        """Forget expired entries; rebuild the filter so it doesn't saturate"""
+        now = timezone.now()
+        live = {jti: exp for jti, exp in self._revoked.items() if exp > now}
+        if len(live) == len(self._revoked):
+            return
+        bloom = BloomFilter(max(self.bloom_capacity, len(live)), self.bloom_error_rate)
+        for jti in live:
+            bloom.add(jti)
+        self._revoked, self._bloom = live, bloom
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            close_old_connections()
+            try:
+                self.flush()
+                if time.monotonic() >= self._next_sync:
+                    with self._lock:
+                        self._sync()
+                        self._prune()
+            except DatabaseError:
+                continue
+
+
+_blacklist = None
+_blacklist_lock = threading.Lock()
+
+
+def get_blacklist():
+    """Return the configured blacklist backend (one instance per process)"""
+    global _blacklist
+    if _blacklist is None:
+        with _blacklist_lock:
+            if _blacklist is None:
+                backend = import_string(settings.TOKEN_BLACKLIST["BACKEND"])
+                _blacklist = backend(**settings.TOKEN_BLACKLIST.get("OPTIONS", {}))
+    return _blacklist
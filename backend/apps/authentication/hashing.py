@@ -0,0 +1,97 @@
+"""
+Bounded executor for password hash verification.
+
+PBKDF2 is deliberately slow, so running it inline ties up the request worker
+for the whole computation. The async login view hands verification to this
+pool instead, and refuses new work once ``AUTH_HASH_WORKERS`` hashes are
+running and ``AUTH_HASH_MAX_PENDING`` more are queued, so a login burst sheds
+load with a 503 rather than starving every other endpoint.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+
+
+class HashPoolSaturated(Exception):
+    """Raised when the verification pool has no capacity left"""
+
+
+def _verify(raw_password, encoded):
+    # Module-level so a process pool can pickle it; never rehashes
+    return check_password(raw_password, encoded)
+
+
+def _hash(raw_password):
+    return make_password(raw_password)
+
+
+class PasswordVerifier:
+    """Runs hash work on a fixed-size pool with a cap on queued jobs"""
+
+    def __init__(self, workers, max_pending, executor="thread"):
+        self.workers = workers
+        self.max_pending = max_pending
+        executor_class = (
+            ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        )
+        self._executor = executor_class(max_workers=workers)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    @property
+    def in_flight(self):
+        return self._in_flight
+
+    def _acquire(self):
+        with self._lock:
+            if self._in_flight >= self.workers + self.max_pending:
+                raise HashPoolSaturated()
+            self._in_flight += 1
+
+    def _release(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    async def _run(self, func, *args):
+        self._acquire()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._release()
+
+    async def verify(self, raw_password, encoded):
+        """Return True if ``raw_password`` matches the stored hash"""
+        return await self._run(_verify, raw_password, encoded)
+
+    async def burn(self, raw_password):
+        """
+        Hash a password and discard the result. Used for unknown users so
+        the response time doesn't reveal whether an email is registered.
+        """
+        await self._run(_hash, raw_password)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+
+_verifier = None
+_verifier_lock = threading.Lock()
+
+
+def get_password_verifier():
+    """Return the process-wide verifier, creating it from settings on first use"""
+    global _verifier
+    if _verifier is None:
+        with _verifier_lock:
+            if _verifier is None:
+                _verifier = PasswordVerifier(
+                    workers=settings.AUTH_HASH_WORKERS,
+                    max_pending=settings.AUTH_HASH_MAX_PENDING,
+                    executor=settings.AUTH_HASH_EXECUTOR,
+                )
+    return _verifier
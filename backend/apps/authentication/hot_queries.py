@@ -0,0 +1,55 @@
+"""User and token queries audited by ``manage.py queryplans``"""
+
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from apps.common.queryplans import register
+from .models import RevokedToken
+
+User = get_user_model()
+
+
+@register("users.newest")
+def users_newest():
+    """Admin changelist: users newest first"""
+    return User.objects.all()[:100]
+
+
+@register("users.by_role")
+def users_by_role():
+    """Admin changelist filtered by role"""
+    return User.objects.filter(role="student")[:100]
+
+
+@register("users.inactive")
+def users_inactive():
+    """Admin changelist filtered to deactivated accounts"""
+    return User.objects.filter(is_active=False)[:100]
+
+
+@register("users.login")
+def users_login():
+    """Login: user by email"""
+    return User.objects.filter(email="someone@example.com")
+
+
+@register("users.token_version")
+def users_token_version():
+    """Token revocation check on every authenticated request (cache miss)"""
+    return User.objects.filter(pk=uuid.uuid4()).values_list(
+        "token_version", "is_active"
+    )
+
+
+@register("revoked_tokens.lookup")
+def revoked_tokens_lookup():
+    """Blacklist check for a refresh token"""
+    return RevokedToken.objects.filter(jti="jti")
+
+
+@register("revoked_tokens.expired")
+def revoked_tokens_expired():
+    """purge_revoked_tokens"""
+    return RevokedToken.objects.filter(expires_at__lte=timezone.now())
@@ -0,0 +1,121 @@
+"""
+Write-behind buffer for User.last_login.
+
+Logins record a timestamp in memory; a background thread writes everything
+collected as one UPDATE ... CASE statement every ``LAST_LOGIN_FLUSH_INTERVAL``
+seconds, or sooner once ``LAST_LOGIN_FLUSH_MAX`` users are waiting. The
+queryset update sends no post_save, so the profile signals never run for it,
+and the buffer is flushed from atexit so a graceful worker shutdown loses
+nothing.
+"""
+
+import atexit
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import DatabaseError, close_old_connections
+from django.db.models import Case, DateTimeField, Value, When
+from django.utils import timezone
+
+
+class LastLoginBuffer:
+    def __init__(self, flush_interval, max_entries):
+        self.flush_interval = flush_interval
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pending = {}  # user pk -> latest login time
+        self._thread = None
+        self._flushes = 0
+        self._written = 0
+        self._last_flush_seconds = 0.0
+        self._max_flush_seconds = 0.0
+
+    def record(self, user_id, when=None):
+        self._ensure_started()
+        with self._lock:
+            self._pending[user_id] = when or timezone.now()
+            depth = len(self._pending)
+        if depth >= self.max_entries:
+            self._wakeup.set()
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return
+            started = time.perf_counter()
+            User = get_user_model()
+            items = list(batch.items())
+            try:
+                for offset in range(0, len(items), self.max_entries):
+                    chunk = items[offset : offset + self.max_entries]
+                    User.objects.filter(pk__in=[pk for pk, _ in chunk]).update(
+                        last_login=Case(
+                            *[When(pk=pk, then=Value(when)) for pk, when in chunk],
+                            output_field=DateTimeField(),
+                        )
+                    )
+            except DatabaseError:
+                # Requeue without clobbering logins recorded in the meantime
+                with self._lock:
+                    for pk, when in items:
+                        self._pending.setdefault(pk, when)
+                raise
+            elapsed = time.perf_counter() - started
+            self._flushes += 1
+            self._written += len(items)
+            self._last_flush_seconds = elapsed
+            self._max_flush_seconds = max(self._max_flush_seconds, elapsed)
+
+    def stats(self):
+        return {
+            "depth": len(self._pending),
+            "flushes": self._flushes,
+            "written": self._written,
+            "last_flush_seconds": self._last_flush_seconds,
+            "max_flush_seconds": self._max_flush_seconds,
+        }
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="last-login-flusher", daemon=True
+            )
+            self._thread.start()
+            atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            close_old_connections()
+            try:
+                self.flush()
+            except DatabaseError:
+                continue
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_last_login_buffer():
+    """Return the process-wide buffer, creating it from settings on first use"""
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = LastLoginBuffer(
+                    flush_interval=settings.LAST_LOGIN_FLUSH_INTERVAL,
+                    max_entries=settings.LAST_LOGIN_FLUSH_MAX,
+                )
+    return _buffer
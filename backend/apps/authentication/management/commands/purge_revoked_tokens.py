@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.authentication.models import RevokedToken
+
+
+class Command(BaseCommand):
+    help = "Delete revoked-token rows whose token has already expired"
+
+    def handle(self, *args, **options):
+        # No relations or signals on RevokedToken, so this is a single DELETE
+        deleted, _ = RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
+        self.stdout.write(self.style.SUCCESS(f"Purged {deleted} expired revoked tokens"))
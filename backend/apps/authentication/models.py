@@ -2,8 +2,10 @@ import uuid
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 
+from apps.common.utils import TrackedFieldsMixin
 
-class User(AbstractUser):
+
+class User(TrackedFieldsMixin, AbstractUser):
     """
     Custom User model with role-based authentication.
     Supports three user types: Admin, Student, Professor
@@ -27,6 +29,12 @@ class User(AbstractUser):
     )
     is_verified = models.BooleanField(default=False)
     is_verified = models.BooleanField(default=False)
+    # Bumped on every save; lets caches keyed on token claims detect stale rows
+    version = models.PositiveIntegerField(default=0, editable=False)
+    # Set with version; the Last-Modified of the /me/ payload
+    updated_at = models.DateTimeField(auto_now=True)
+    # Embedded in every JWT; bumping it revokes all of the user's tokens
+    token_version = models.PositiveIntegerField(default=0, editable=False)
 
     # Override username to make it optional for Google OAuth users (No longer needed strictly for Google but good for flexibility)
     username = models.CharField(max_length=150, unique=True, blank=True, null=True)
@@ -35,16 +43,84 @@ class User(AbstractUser):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["username"]
 
+    # Database values remembered so save() hooks can tell what changed
+    TRACKED_FIELDS = (
+        "role",
+        "is_active",
+        "email",
+        "username",
+        "first_name",
+        "last_name",
+    )
+
+    # Copied into every token (apps/authentication/tokens.py)
+    CLAIM_FIELDS = ("role", "is_active")
+
     class Meta:
         verbose_name = "User"
         verbose_name_plural = "Users"
         ordering = ["-date_joined"]
+        indexes = [
+            # Default ordering: admin changelist, newest users first
+            models.Index(fields=["-date_joined"], name="user_joined_idx"),
+            models.Index(fields=["role", "-date_joined"], name="user_role_joined_idx"),
+            # Deactivated accounts are few; active ones use the indexes above
+            models.Index(
+                fields=["-date_joined"],
+                condition=models.Q(is_active=False),
+                name="user_inactive_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.email} ({self.get_role_display()})"
 
+    @staticmethod
+    def generate_username(email):
+        """Derive a unique-enough username from the local part of an email"""
+        return email.split("@")[0] + str(uuid.uuid4())[:8]
+
+    def claims_changed(self, update_fields=None):
+        """Whether saving ``update_fields`` (None: all) changes a CLAIM_FIELDS value"""
+        if self._state.adding:
+            return False
+        return any(
+            name in self.changed_fields
+            and self.loaded_value(name) is not None
+            and (update_fields is None or name in update_fields)
+            for name in self.CLAIM_FIELDS
+        )
+
     def save(self, *args, **kwargs):
         # Auto-generate username from email if not provided
         if not self.username:
-            self.username = self.email.split("@")[0] + str(uuid.uuid4())[:8]
+            self.username = self.generate_username(self.email)
+        self.version += 1
+        update_fields = kwargs.get("update_fields")
+        written = {"version", "updated_at"}
+        if self.claims_changed(update_fields):
+            # Tokens carry role and is_active as claims: changing either
+            # revokes every token the user holds
+            self.token_version += 1
+            written.add("token_version")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, *written}
         super().save(*args, **kwargs)
+
+
+class RevokedToken(models.Model):
+    """
+    A refresh token that may no longer be used. Rows are only needed until
+    the token would have expired anyway; see purge_revoked_tokens.
+    """
+
+    jti = models.CharField(max_length=255, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+    revoked_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        verbose_name = "Revoked Token"
+        verbose_name_plural = "Revoked Tokens"
+
+    def __str__(self):
+        return self.jti
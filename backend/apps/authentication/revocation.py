@@ -0,0 +1,95 @@
+"""
+Per-user token revocation.
+
+Every token carries the user's ``token_version`` at issue time. Bumping the
+counter on the User row invalidates all of that user's outstanding tokens at
+once, with no per-token bookkeeping. The current version is read through the
+Django cache so checking a token is a single cache lookup; inactive or
+deleted users are cached as ``None`` and fail every check.
+
+The ``a``-prefixed variants serve the async views. They read the cache
+inline and await only the database fallback: the built-in backends
+implement ``cache.aget``/``aset`` as ``sync_to_async`` wrappers around the
+sync calls, and that thread hop would cost more than the lookup.
+"""
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import F
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+
+TOKEN_VERSION_CLAIM = "token_version"
+
+User = get_user_model()
+
+
+def _cache_key(user_id):
+    return f"token-version:{user_id}"
+
+
+def get_token_version(user_id):
+    """Current token version for a user, or None if they can't hold tokens"""
+    key = _cache_key(user_id)
+    version = cache.get(key, -1)
+    if version != -1:
+        return version
+    row = User.objects.filter(pk=user_id).values_list("token_version", "is_active").first()
+    version = row[0] if row and row[1] else None
+    cache.set(key, version, settings.TOKEN_VERSION_CACHE_TTL)
+    return version
+
+
+def is_token_current(token):
+    """True if ``token`` was issued at the user's current token version"""
+    current = get_token_version(token[api_settings.USER_ID_CLAIM])
+    return current is not None and token.get(TOKEN_VERSION_CLAIM, 0) == current
+
+
+async def aget_token_version(user_id):
+    key = _cache_key(user_id)
+    version = cache.get(key, -1)
+    if version != -1:
+        return version
+    row = await (
+        User.objects.filter(pk=user_id)
+        .values_list("token_version", "is_active")
+        .afirst()
+    )
+    version = row[0] if row and row[1] else None
+    cache.set(key, version, settings.TOKEN_VERSION_CACHE_TTL)
+    return version
+
+
+async def ais_token_current(token):
+    current = await aget_token_version(token[api_settings.USER_ID_CLAIM])
+    return current is not None and token.get(TOKEN_VERSION_CLAIM, 0) == current
+
+
+def forget_token_version(user_ids):
+    """Drop cached versions so the next check reads the database"""
+    cache.delete_many([_cache_key(user_id) for user_id in user_ids])
+
+
+def revoke_user_tokens(users, **fields):
+    """
+    Invalidate every token held by ``users`` (a User queryset) with one
+    UPDATE, which also writes any other ``fields`` (``is_active=False``).
+    Returns the number of users affected.
+    """
+    from .authentication import user_cache
+
+    user_ids = list(users.values_list("pk", flat=True))
+    count = User.objects.filter(pk__in=user_ids).update(
+        token_version=F("token_version") + 1,
+        # What User.save() would bump; keys the /me/ conditional cache
+        version=F("version") + 1,
+        updated_at=timezone.now(),
+        **fields,
+    )
+    # update() sends no post_save, so evict what evict_cached_user would
+    forget_token_version(user_ids)
+    for user_id in user_ids:
+        user_cache.delete(user_id)
+    return count
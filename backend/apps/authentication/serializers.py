@@ -1,12 +1,17 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.common.serializers import SparseFieldsSerializerMixin
+from .tokens import PlatformRefreshToken
 
 User = get_user_model()
 
 
-class UserSerializer(serializers.ModelSerializer):
-    """Serializer for User model"""
+class UserSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    """Serializer for User model; accepts ``fields``/``exclude``"""
 
     class Meta:
         model = User
@@ -149,3 +154,27 @@ class LoginSerializer(serializers.Serializer):
 
     email = serializers.EmailField(required=True)
     password = serializers.CharField(required=True, write_only=True)
+
+
+class PlatformTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Token refresh that checks and rotates through the TOKEN_BLACKLIST
+    backend. The user claims are read again from the database rather than
+    copied forward from the old token.
+    """
+
+    token_class = PlatformRefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        refresh.reload_user_claims()
+
+        data = {"access": str(refresh.access_token)}
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                refresh.blacklist()
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data["refresh"] = str(refresh)
+        return data
@@ -0,0 +1,184 @@
+import datetime
+from unittest import mock
+
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import F
+from django.conf import settings
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from . import blacklist
+from .admin import UserAdmin
+from .authentication import StatelessJWTAuthentication, get_cached_user, user_cache
+from .models import RevokedToken
+from .revocation import get_token_version
+from .throttles import LoginIPThrottle
+from .tokens import PlatformRefreshToken
+
+User = get_user_model()
+
+
+class TokenClaimsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        # The buffered backend flushes from a thread that outlives the test
+        # database
+        patcher = mock.patch.object(
+            blacklist, "_blacklist", blacklist.DatabaseBlacklist()
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.user = User.objects.create_user(
+            username="student",
+            email="student@example.com",
+            password="x",
+            role="student",
+        )
+        self.client = APIClient()
+
+    def refresh(self, token):
+        return self.client.post(
+            "/api/auth/token/refresh/", {"refresh": str(token)}, format="json"
+        )
+
+    def test_role_change_revokes_tokens(self):
+        token = PlatformRefreshToken.for_user(self.user)
+        access = token.access_token
+        self.user.role = "professor"
+        self.user.save()
+
+        self.assertEqual(self.user.token_version, 1)
+        with self.assertRaises(AuthenticationFailed):
+            StatelessJWTAuthentication().get_user(access)
+        self.assertEqual(self.refresh(token).status_code, 401)
+
+    def test_deactivation_revokes_tokens(self):
+        token = PlatformRefreshToken.for_user(self.user)
+        self.user.is_active = False
+        self.user.save(update_fields=["is_active"])
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.token_version, 1)
+        self.assertEqual(self.refresh(token).status_code, 401)
+
+    def test_other_changes_keep_tokens(self):
+        token = PlatformRefreshToken.for_user(self.user)
+        self.user.first_name = "Ada"
+        self.user.save()
+        self.user.save(update_fields=["last_login"])
+
+        self.assertEqual(self.user.token_version, 0)
+        self.assertEqual(self.refresh(token).status_code, 200)
+
+    def test_refresh_reads_claims_from_database(self):
+        token = PlatformRefreshToken.for_user(self.user)
+        # A queryset update changes the row without bumping token_version
+        User.objects.filter(pk=self.user.pk).update(role="professor", version=7)
+
+        response = self.refresh(token)
+        self.assertEqual(response.status_code, 200)
+        access = AccessToken(response.data["access"])
+        self.assertEqual(access["role"], "professor")
+        self.assertEqual(access["user_version"], 7)
+        rotated = PlatformRefreshToken(response.data["refresh"])
+        self.assertEqual(rotated["role"], "professor")
+
+    def test_refresh_rejects_deactivated_user(self):
+        token = PlatformRefreshToken.for_user(self.user)
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        cache.clear()
+
+        self.assertEqual(self.refresh(token).status_code, 401)
+
+    def test_admin_deactivation_evicts_cached_user(self):
+        get_cached_user(self.user.pk)
+        get_token_version(self.user.pk)
+        model_admin = UserAdmin(User, admin.site)
+        with mock.patch.object(model_admin, "message_user"):
+            model_admin.deactivate_and_revoke(
+                None, User.objects.filter(pk=self.user.pk)
+            )
+
+        self.assertIsNone(user_cache.get(self.user.pk))
+        self.assertIsNone(get_token_version(self.user.pk))
+        user = get_cached_user(self.user.pk)
+        self.assertFalse(user.is_active)
+        self.assertEqual((user.token_version, user.version), (1, 2))
+
+
+class CurrentUserConditionalTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="ada", email="ada@example.com", password="x", role="student"
+        )
+        token = PlatformRefreshToken.for_user(self.user).access_token
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_validators_come_from_the_row(self):
+        response = self.client.get("/api/auth/me/")
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual(
+            response["Last-Modified"], http_date(self.user.updated_at.timestamp())
+        )
+        again = self.client.get("/api/auth/me/", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(again.status_code, 304)
+        async_response = self.client.get("/api/auth/me/async/")
+        self.assertEqual(async_response["ETag"], response["ETag"])
+        self.assertEqual(async_response["Last-Modified"], response["Last-Modified"])
+
+    def test_change_from_another_process(self):
+        etag = self.client.get("/api/auth/me/")["ETag"]
+        # A save elsewhere bumps the version without touching this cache
+        User.objects.filter(pk=self.user.pk).update(
+            first_name="Ada", version=F("version") + 1
+        )
+
+        response = self.client.get("/api/auth/me/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["first_name"], "Ada")
+        self.assertNotEqual(response["ETag"], etag)
+
+
+class IPThrottleTests(TestCase):
+    def ident(self, **meta):
+        request = RequestFactory().post(
+            "/api/auth/login/", REMOTE_ADDR="10.0.0.9", **meta
+        )
+        return LoginIPThrottle().get_ident_for(request, {})
+
+    def test_forwarded_for_ignored_without_proxies(self):
+        self.assertEqual(self.ident(HTTP_X_FORWARDED_FOR="1.2.3.4"), "10.0.0.9")
+
+    @override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, "NUM_PROXIES": 1})
+    def test_forwarded_for_behind_one_proxy(self):
+        # The proxy appends the address it saw; anything before it is spoofable
+        self.assertEqual(self.ident(HTTP_X_FORWARDED_FOR="6.6.6.6, 1.2.3.4"), "1.2.3.4")
+        self.assertEqual(self.ident(), "10.0.0.9")
+
+
+class BufferedBlacklistSyncTests(TestCase):
+    def setUp(self):
+        self.blacklist = blacklist.BufferedBloomBlacklist(sync_overlap=60.0)
+        # Sync by hand; no flusher thread
+        self.blacklist._sync()
+        self.blacklist._loaded = True
+
+    def write(self, jti, revoked_at):
+        expires_at = timezone.now() + datetime.timedelta(days=1)
+        RevokedToken.objects.create(jti=jti, expires_at=expires_at)
+        RevokedToken.objects.filter(jti=jti).update(revoked_at=revoked_at)
+
+    def test_row_stamped_before_last_sync(self):
+        # Committed after our sync, but stamped earlier by the writer's clock
+        self.write("late", self.blacklist._last_sync - datetime.timedelta(seconds=30))
+        self.blacklist._sync()
+        self.assertTrue(self.blacklist.is_revoked("late"))
@@ -0,0 +1,145 @@
+"""
+Token-bucket throttles for the unauthenticated endpoints that hash passwords.
+
+Each bucket holds up to ``num_requests`` tokens of the scope's rate (from
+``REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"]``) and refills continuously at
+``num_requests / duration`` per second. A bucket is a single
+``(tokens, timestamp)`` entry in the ``AUTH_THROTTLE_CACHE`` cache, so a
+check is one get and one set no matter how hot the key is, unlike DRF's
+sliding-window throttles, which keep the full request history.
+
+DRF runs throttles in ``APIView.initial()``, before the handler, so a
+rejected attempt never reaches the password hasher. Per-process caches
+(the default LocMemCache) give per-worker buckets; point
+``AUTH_THROTTLE_CACHE`` at a shared cache to enforce one budget for the
+whole deployment. Get/set is not atomic across processes, so concurrent
+workers may overshoot a bucket by a request or two.
+"""
+
+import math
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.settings import api_settings
+from rest_framework.throttling import SimpleRateThrottle
+
+_lock = threading.Lock()
+
+
+class TokenBucketThrottle(SimpleRateThrottle):
+    """
+    Base class; subclasses set ``scope`` and implement ``get_ident_for``.
+    Scopes without a configured rate are not throttled.
+    """
+
+    cache_format = "throttle_%(scope)s_%(ident)s"
+
+    def __init__(self):
+        # Resolved per instance so override_settings(REST_FRAMEWORK=...)
+        # and a changed AUTH_THROTTLE_CACHE take effect
+        self.cache = caches[settings.AUTH_THROTTLE_CACHE]
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        self._wait = 0.0
+
+    def get_rate(self):
+        return api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+
+    def get_ident_for(self, request, data):
+        """Return the bucket identity for a request, or None to skip it"""
+        raise NotImplementedError
+
+    def get_cache_key(self, request, view):
+        return self.key_for(request, request.data)
+
+    def key_for(self, request, data):
+        ident = self.get_ident_for(request, data)
+        if ident is None:
+            return None
+        return self.cache_format % {"scope": self.scope, "ident": ident}
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        key = self.get_cache_key(request, view)
+        if key is None:
+            return True
+        return self.consume(key)
+
+    def consume(self, key):
+        """Take one token from ``key``'s bucket; False when it is empty"""
+        capacity = self.num_requests
+        refill = capacity / self.duration
+        with _lock:
+            now = self.timer()
+            tokens, stamp = self.cache.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - stamp) * refill)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+                self._wait = 0.0
+            else:
+                self._wait = (1 - tokens) / refill
+            # An untouched bucket is full again after ``duration``
+            self.cache.set(key, (tokens, now), timeout=math.ceil(self.duration))
+        return allowed
+
+    def wait(self):
+        return self._wait
+
+
+class IPThrottle(TokenBucketThrottle):
+    """
+    Bucket per client IP. X-Forwarded-For is only read behind the
+    ``NUM_PROXIES`` proxies configured in REST_FRAMEWORK; unset, DRF would
+    trust whatever the client sent.
+    """
+
+    def get_ident_for(self, request, data):
+        return self.get_ident(request)
+
+
+class EmailThrottle(TokenBucketThrottle):
+    def get_ident_for(self, request, data):
+        email = data.get("email") if hasattr(data, "get") else None
+        if not isinstance(email, str) or not email.strip():
+            return None
+        return email.strip().lower()
+
+
+class LoginIPThrottle(IPThrottle):
+    scope = "login_ip"
+
+
+class LoginEmailThrottle(EmailThrottle):
+    scope = "login_email"
+
+
+class RegisterIPThrottle(IPThrottle):
+    scope = "register_ip"
+
+
+class RegisterEmailThrottle(EmailThrottle):
+    scope = "register_email"
+
+
+LOGIN_THROTTLES = [LoginIPThrottle, LoginEmailThrottle]
+REGISTER_THROTTLES = [RegisterIPThrottle, RegisterEmailThrottle]
+
+
+def check_throttles(throttle_classes, request, data):
+    """
+    Throttle check for views outside DRF (the async login view). Returns
+    the seconds to wait before retrying, or None when the request may
+    proceed. Every bucket is charged, as in ``APIView.check_throttles``.
+    """
+    waits = []
+    for throttle_class in throttle_classes:
+        throttle = throttle_class()
+        if throttle.rate is None:
+            continue
+        key = throttle.key_for(request, data)
+        if key is not None and not throttle.consume(key):
+            waits.append(throttle.wait())
+    return max(waits) if waits else None
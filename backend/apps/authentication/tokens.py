@@ -0,0 +1,102 @@
+from django.contrib.auth import get_user_model
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from .blacklist import get_blacklist
+from .revocation import TOKEN_VERSION_CLAIM, ais_token_current, is_token_current
+
+User = get_user_model()
+
+
+class PlatformRefreshToken(RefreshToken):
+    """
+    Refresh token carrying the claims permission checks need, so the
+    stateless authentication class can build request.user without a query.
+    Claims are copied onto every access token derived from it.
+
+    Revocation goes through the backend configured in TOKEN_BLACKLIST
+    instead of simplejwt's OutstandingToken/BlacklistedToken tables, and
+    every token is also void once the user's token_version moves on.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token.set_user_claims(user)
+        token[TOKEN_VERSION_CLAIM] = user.token_version
+        return token
+
+    def set_user_claims(self, user):
+        self["role"] = user.role
+        self["is_active"] = user.is_active
+        self["user_version"] = user.version
+
+    def _users(self):
+        return User.objects.filter(pk=self.payload[api_settings.USER_ID_CLAIM]).only(
+            "role", "is_active", "version", "token_version"
+        )
+
+    def _reload_user_claims(self, user):
+        if user is None or not user.is_active:
+            raise TokenError(_("User not found or inactive"))
+        if self.payload.get(TOKEN_VERSION_CLAIM, 0) != user.token_version:
+            raise TokenError(_("Token has been revoked"))
+        self.set_user_claims(user)
+
+    def reload_user_claims(self):
+        """
+        Replace the claims copied from the user with the database values,
+        before new tokens are derived from this one on refresh
+        """
+        self._reload_user_claims(self._users().first())
+
+    async def areload_user_claims(self):
+        self._reload_user_claims(await self._users().afirst())
+
+    # Off for tokens built by averify_refresh_token, which awaits the checks
+    check_revocation_on_verify = True
+
+    def verify(self, *args, **kwargs):
+        super().verify(*args, **kwargs)
+        if self.check_revocation_on_verify:
+            self.check_revocation()
+
+    def check_revocation(self):
+        if get_blacklist().is_revoked(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+        if not is_token_current(self.payload):
+            raise TokenError(_("Token has been revoked"))
+
+    async def acheck_revocation(self):
+        if await get_blacklist().ais_revoked(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+        if not await ais_token_current(self.payload):
+            raise TokenError(_("Token has been revoked"))
+
+    def blacklist(self):
+        get_blacklist().revoke(
+            self.payload[api_settings.JTI_CLAIM], datetime_from_epoch(self["exp"])
+        )
+
+    async def ablacklist(self):
+        await get_blacklist().arevoke(
+            self.payload[api_settings.JTI_CLAIM], datetime_from_epoch(self["exp"])
+        )
+
+
+class _DeferredCheckRefreshToken(PlatformRefreshToken):
+    check_revocation_on_verify = False
+
+
+async def averify_refresh_token(raw_token):
+    """
+    Decode and verify a refresh token from async code. Signature, expiry and
+    type are checked inline; the blacklist and token_version checks are
+    awaited so they never run a query on the event loop.
+    """
+    token = _DeferredCheckRefreshToken(raw_token)
+    await token.acheck_revocation()
+    return token
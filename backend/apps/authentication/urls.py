@@ -8,6 +8,12 @@ from .views import (
     LogoutView,
     CurrentUserView,
 )
+from .async_views import (
+    AsyncCurrentUserView,
+    AsyncLoginView,
+    AsyncLogoutView,
+    AsyncTokenRefreshView,
+)
 
 urlpatterns = [
     # Three separate registration URLs - one for each user type
@@ -26,9 +32,18 @@ urlpatterns = [
     ),
     # JWT Login (for students and professors only)
     path("login/", LoginView.as_view(), name="login"),
+    # Async login for the ASGI deployment (bounded hashing pool)
+    path("login/async/", AsyncLoginView.as_view(), name="login-async"),
     path("logout/", LogoutView.as_view(), name="logout"),
+    path("logout/async/", AsyncLogoutView.as_view(), name="logout-async"),
     # Token management
     path("token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    path(
+        "token/refresh/async/",
+        AsyncTokenRefreshView.as_view(),
+        name="token_refresh_async",
+    ),
     # Current user
     path("me/", CurrentUserView.as_view(), name="current-user"),
+    path("me/async/", AsyncCurrentUserView.as_view(), name="current-user-async"),
 ]
@@ -2,9 +2,10 @@ from rest_framework import status, generics
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import authenticate, get_user_model
+from rest_framework_simplejwt.settings import api_settings
 
+from apps.common.mixins import ConditionalGetMixin
 
 from .serializers import (
     StudentRegistrationSerializer,
@@ -13,6 +14,10 @@ from .serializers import (
     LoginSerializer,
     UserSerializer,
 )
+from .authentication import user_row
+from .last_login import get_last_login_buffer
+from .throttles import LOGIN_THROTTLES, REGISTER_THROTTLES
+from .tokens import PlatformRefreshToken
 
 User = get_user_model()
 
@@ -25,6 +30,7 @@ class StudentRegistrationView(generics.CreateAPIView):
 
     serializer_class = StudentRegistrationSerializer
     permission_classes = [AllowAny]
+    throttle_classes = REGISTER_THROTTLES
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -32,7 +38,7 @@ class StudentRegistrationView(generics.CreateAPIView):
         user = serializer.save()
 
         # Generate JWT tokens
-        refresh = RefreshToken.for_user(user)
+        refresh = PlatformRefreshToken.for_user(user)
 
         return Response(
             {
@@ -55,6 +61,7 @@ class ProfessorRegistrationView(generics.CreateAPIView):
 
     serializer_class = ProfessorRegistrationSerializer
     permission_classes = [AllowAny]
+    throttle_classes = REGISTER_THROTTLES
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -62,7 +69,7 @@ class ProfessorRegistrationView(generics.CreateAPIView):
         user = serializer.save()
 
         # Generate JWT tokens
-        refresh = RefreshToken.for_user(user)
+        refresh = PlatformRefreshToken.for_user(user)
 
         return Response(
             {
@@ -85,6 +92,7 @@ class AdminRegistrationView(generics.CreateAPIView):
 
     serializer_class = AdminRegistrationSerializer
     permission_classes = [AllowAny]
+    throttle_classes = REGISTER_THROTTLES
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -92,7 +100,7 @@ class AdminRegistrationView(generics.CreateAPIView):
         user = serializer.save()
 
         # Generate JWT tokens
-        refresh = RefreshToken.for_user(user)
+        refresh = PlatformRefreshToken.for_user(user)
 
         return Response(
             {
@@ -111,9 +119,12 @@ class LoginView(APIView):
     """
     JWT Login for Students and Professors
     POST /api/auth/login/
+
+    Throttled per client IP and per email before the password is hashed.
     """
 
     permission_classes = [AllowAny]
+    throttle_classes = LOGIN_THROTTLES
 
     def post(self, request):
         serializer = LoginSerializer(data=request.data)
@@ -141,8 +152,12 @@ class LoginView(APIView):
                 {"error": "Account is disabled"}, status=status.HTTP_403_FORBIDDEN
             )
 
+        if api_settings.UPDATE_LAST_LOGIN:
+            # Buffered and written in batches; see last_login.py
+            get_last_login_buffer().record(user.pk)
+
         # Generate tokens
-        refresh = RefreshToken.for_user(user)
+        refresh = PlatformRefreshToken.for_user(user)
 
         return Response(
             {
@@ -167,7 +182,7 @@ class LogoutView(APIView):
     def post(self, request):
         try:
             refresh_token = request.data.get("refresh_token")
-            token = RefreshToken(refresh_token)
+            token = PlatformRefreshToken(refresh_token)
             token.blacklist()
             return Response(
                 {"message": "Successfully logged out"}, status=status.HTTP_200_OK
@@ -178,14 +193,25 @@ class LogoutView(APIView):
             )
 
 
-class CurrentUserView(APIView):
+class CurrentUserView(ConditionalGetMixin, APIView):
     """
     GET current user profile
     GET /api/users/me/
+
+    Served from a cache keyed by user and User.version, with ETag and
+    Last-Modified validators; any save of the user moves it to a new entry.
     """
 
     permission_classes = [IsAuthenticated]
 
+    def get_conditional_key(self, request):
+        return ("current-user", request.user.pk, user_row(request.user).version)
+
+    def get_conditional_modified(self, request):
+        return user_row(request.user).updated_at
+
+    def get_conditional_data(self, request):
+        return UserSerializer(request.user).data
+
     def get(self, request):
-        serializer = UserSerializer(request.user)
-        return Response(serializer.data)
+        return self.conditional_response(request)
@@ -1,7 +1,18 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class CommonConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.common"
     label = "common"
+
+    def ready(self):
+        from .cache import catalog
+        from .db import tune_sqlite
+        from .metrics import registry
+
+        connection_created.connect(tune_sqlite, dispatch_uid="common.tune_sqlite")
+        registry.register_stats(
+            "catalog_cache", "Cohort/team/course read-through cache", catalog.stats
+        )
@@ -0,0 +1,183 @@
+"""
+Read-through caching with versioned keys and single-flight recompute.
+
+Entries are addressed through version counters rather than deleted:
+
+* an object entry ``<model>:obj:<pk>`` embeds the version of that object,
+* a list entry embeds the version of its *scope* (``all`` for the
+  unfiltered list, ``cohort:3`` for a list filtered to cohort 3) plus a
+  digest of the request parameters (filters, cursor, page size).
+
+``invalidate`` bumps the versions an object touches, so every variant of
+every affected list goes stale at once without enumerating their keys,
+while lists of other scopes stay cached. A reader that loaded old data
+while the write was in flight stores it under the old version, where
+nobody looks any more. Missing version counters are recreated from the
+clock, so an evicted counter can never bring an old entry back.
+
+A miss is recomputed once: concurrent readers of the same key in this
+process wait for the first one (``coalesced``), and an ``add``-based lock
+in the cache makes other processes poll for the result instead of
+querying too. If the holder takes longer than ``lock_timeout`` the waiter
+computes the value itself rather than fail.
+"""
+
+import hashlib
+import threading
+import time
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+
+class _Flight:
+    __slots__ = ("done", "value", "failed")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.failed = False
+
+
+class ReadThroughCache:
+    def __init__(self, namespace, alias="default", timeout=300, lock_timeout=10):
+        self.namespace = namespace
+        self.alias = alias
+        self.timeout = timeout
+        self.lock_timeout = lock_timeout
+        self._flights = {}
+        self._flights_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._invalidations = 0
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    # Versions
+
+    def _version_key(self, model, scope):
+        return f"{self.namespace}:ver:{model}:{scope}"
+
+    def _version(self, model, scope):
+        key = self._version_key(model, scope)
+        version = self.cache.get(key)
+        if version is None:
+            self.cache.add(key, time.time_ns(), None)
+            version = self.cache.get(key)
+        return version
+
+    def _bump(self, key):
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            self.cache.set(key, time.time_ns(), None)
+
+    def invalidate(self, model, pks=(), scopes=()):
+        """
+        Expire cached ``model`` objects ``pks`` and the lists of ``scopes``;
+        the unfiltered ``all`` list always goes too
+        """
+        for pk in pks:
+            self._bump(self._version_key(model, f"obj:{pk}"))
+        for scope in {"all", *scopes}:
+            self._bump(self._version_key(model, scope))
+        self._invalidations += 1
+
+    def invalidate_on_commit(self, model, pks=(), scopes=()):
+        """
+        ``invalidate`` once the current transaction commits, so a reader
+        can't cache pre-commit rows under the new version
+        """
+        transaction.on_commit(partial(self.invalidate, model, list(pks), list(scopes)))
+
+    # Reads
+
+    def get_object(self, model, pk, loader):
+        """Cached ``loader()`` for one object (``None`` results are cached too)"""
+        version = self._version(model, f"obj:{pk}")
+        return self._read_through(
+            f"{self.namespace}:{model}:obj:{pk}:{version}", loader
+        )
+
+    def get_list(self, model, scope, params, loader):
+        """Cached ``loader()`` for a list of ``scope`` requested with ``params``"""
+        version = self._version(model, scope)
+        digest = hashlib.sha1(params.encode()).hexdigest()[:16]
+        return self._read_through(
+            f"{self.namespace}:{model}:list:{scope}:{version}:{digest}", loader
+        )
+
+    def _read_through(self, key, loader):
+        entry = self.cache.get(key)
+        if entry is not None:
+            self._hits += 1
+            return entry[0]
+
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            self._coalesced += 1
+            if flight.done.wait(self.lock_timeout) and not flight.failed:
+                return flight.value
+            return loader()
+
+        try:
+            flight.value = self._load(key, loader)
+            return flight.value
+        except BaseException:
+            flight.failed = True
+            raise
+        finally:
+            with self._flights_lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def _load(self, key, loader):
+        lock_key = f"{key}:lock"
+        if not self.cache.add(lock_key, 1, self.lock_timeout):
+            # Another process is computing it; wait for its result
+            deadline = time.monotonic() + self.lock_timeout
+            delay = 0.005
+            while time.monotonic() < deadline:
+                time.sleep(delay)
+                delay = min(delay * 2, 0.1)
+                entry = self.cache.get(key)
+                if entry is not None:
+                    self._coalesced += 1
+                    return entry[0]
+            lock_key = None
+        try:
+            self._misses += 1
+            value = loader()
+            # Wrapped so a cached None is distinguishable from a miss
+            self.cache.set(key, (value,), self.timeout)
+            return value
+        finally:
+            if lock_key is not None:
+                self.cache.delete(lock_key)
+
+    def stats(self):
+        lookups = self._hits + self._misses + self._coalesced
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "invalidations": self._invalidations,
+            "hit_ratio": (self._hits + self._coalesced) / lookups if lookups else 0.0,
+        }
+
+
+catalog = ReadThroughCache(
+    "catalog",
+    alias=settings.CATALOG_CACHE,
+    timeout=settings.CATALOG_CACHE_TIMEOUT,
+    lock_timeout=settings.CATALOG_CACHE_LOCK_TIMEOUT,
+)
@@ -0,0 +1,237 @@
+"""
+Compiled read-only serializers for large list payloads.
+
+A DRF ModelSerializer renders each row by walking its bound fields:
+``get_attribute`` through the instance, a None check, a
+``to_representation`` call and an OrderedDict insert per field. For a page
+of thousands of rows that per-field dispatch costs more than the query.
+
+``compile_serializer`` does the walk once per serializer class and field
+set and generates a function turning a ``values_list()`` tuple into the
+same dict the serializer would produce::
+
+    compiled = compile_serializer(UserSerializer, fields=("email", "id"))
+    rows = queryset.values_list(*compiled.columns)
+    data = compiled.to_representation(rows)
+
+Conversions that are the identity for the column's Python type (integers,
+strings, booleans, string choices, foreign key ids) are inlined away;
+UUIDs become ``str(...)``, dates ``.isoformat()``, and aware datetimes are
+converted to the active timezone, looked up once per call instead of once
+per row. Anything else calls the bound DRF field, so the output stays
+identical to the serializer's. Nullable
+relations on a field's source add their foreign key column as a guard and
+fall back to the field's default / null / omission, as DRF does when the
+relation is missing.
+
+Only serializers using SparseFieldsSerializerMixin whose remaining fields
+are all columns (``get_projection().values_ok``) can be compiled; others
+raise ImproperlyConfigured.
+"""
+
+import datetime
+from functools import lru_cache, partial
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.fields import empty
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.settings import api_settings
+
+# DRF field class -> model field types it renders unchanged
+IDENTITY_TYPES = {
+    serializers.IntegerField: {
+        "AutoField",
+        "BigAutoField",
+        "SmallAutoField",
+        "IntegerField",
+        "BigIntegerField",
+        "SmallIntegerField",
+        "PositiveIntegerField",
+        "PositiveBigIntegerField",
+        "PositiveSmallIntegerField",
+    },
+    serializers.CharField: {"CharField", "TextField", "SlugField", "EmailField"},
+    serializers.EmailField: {"CharField", "EmailField"},
+    serializers.SlugField: {"CharField", "SlugField"},
+    serializers.BooleanField: {"BooleanField"},
+}
+
+
+class CompiledSerializer:
+    def __init__(self, serializer_class, fields, columns, source, to_list):
+        self.serializer_class = serializer_class
+        self.fields = fields
+        # values_list() paths, in the order the row function indexes them
+        self.columns = columns
+        self.source = source
+        self.to_list = to_list
+
+    def to_representation(self, rows):
+        # DRF looks the active timezone up for every datetime value; the
+        # row function gets it once per call
+        tz = timezone.get_current_timezone() if settings.USE_TZ else None
+        return self.to_list(rows, tz)
+
+    def __repr__(self):
+        return f"<CompiledSerializer {self.serializer_class.__name__} {self.fields}>"
+
+
+@lru_cache(maxsize=256)
+def compile_serializer(serializer_class, fields=None, exclude=None):
+    """
+    Row function for ``serializer_class`` limited to ``fields`` / without
+    ``exclude`` (tuples); the last 256 combinations are kept
+    """
+    serializer = serializer_class(
+        fields=list(fields) if fields is not None else None,
+        exclude=list(exclude) if exclude is not None else None,
+    )
+    projection = serializer.get_projection()
+    if projection is None or not projection.values_ok:
+        raise ImproperlyConfigured(
+            f"{serializer_class.__name__} with fields={fields!r} "
+            f"exclude={exclude!r} does not render plain columns only"
+        )
+
+    columns = {}
+    namespace = {}
+    # (name, expression, condition under which the key is left out)
+    entries = []
+
+    def column(path):
+        return columns.setdefault(path, len(columns))
+
+    for field in serializer._readable_fields:
+        index = column(projection.paths[field.field_name])
+        value = _convert(field, f"r[{index}]", namespace, len(entries))
+        guards = [
+            f"r[{column(path)}] is None"
+            for path in _nullable_relations(serializer.Meta.model, field.source_attrs)
+        ]
+        skip = None
+        if guards:
+            missing = _missing(field, namespace, len(entries))
+            if missing is None:
+                skip = " or ".join(guards)
+            else:
+                value = f"{missing} if {' or '.join(guards)} else {value}"
+        entries.append((field.field_name, value, skip))
+
+    if any(skip for _, _, skip in entries):
+        # Statements rather than a dict literal, so keys can be left out
+        # without changing the order of the others
+        lines = ["def to_dict(r, tz):", "    d = {}"]
+        for name, value, skip in entries:
+            if skip:
+                lines.append(f"    if not ({skip}):")
+                lines.append(f"        d[{name!r}] = {value}")
+            else:
+                lines.append(f"    d[{name!r}] = {value}")
+        lines.append("    return d")
+        lines.append("def to_list(rows, tz):")
+        lines.append("    return [to_dict(r, tz) for r in rows]")
+    else:
+        lines = ["def to_list(rows, tz):", "    return [", "        {"]
+        lines.extend(f"            {name!r}: {value}," for name, value, _ in entries)
+        lines.extend(["        }", "        for r in rows", "    ]"])
+    source = "\n".join(lines)
+    exec(compile(source, f"<compiled {serializer_class.__name__}>", "exec"), namespace)
+
+    return CompiledSerializer(
+        serializer_class,
+        tuple(serializer.fields),
+        tuple(columns),
+        source,
+        namespace["to_list"],
+    )
+
+
+def _model_field(model, source_attrs):
+    for attr in source_attrs[:-1]:
+        model = model._meta.get_field(attr).related_model
+    return model._meta.get_field(source_attrs[-1])
+
+
+def _nullable_relations(model, source_attrs):
+    """Paths of the nullable relations ``source_attrs`` passes through"""
+    paths = []
+    for depth, attr in enumerate(source_attrs[:-1]):
+        model_field = model._meta.get_field(attr)
+        if model_field.null:
+            paths.append("__".join(source_attrs[: depth + 1]))
+        model = model_field.related_model
+    return paths
+
+
+def _convert(field, value, namespace, position):
+    """Expression rendering ``value`` (a non-missing column) like ``field``"""
+    if isinstance(field, PrimaryKeyRelatedField) and field.pk_field is None:
+        return value
+    model_field = _model_field(field.parent.Meta.model, field.source_attrs)
+    internal_type = model_field.get_internal_type()
+    if internal_type in IDENTITY_TYPES.get(type(field), ()):
+        return value
+    if type(field) is serializers.ChoiceField and all(
+        isinstance(key, str) for key in field.choices
+    ):
+        return value
+    if type(field) is serializers.UUIDField and field.uuid_format == "hex_verbose":
+        return f"None if {value} is None else str({value})"
+    if type(field) is serializers.DateField and internal_type == "DateField":
+        if _is_iso(getattr(field, "format", api_settings.DATE_FORMAT)):
+            return f"None if {value} is None else {value}.isoformat()"
+    if (
+        type(field) is serializers.DateTimeField
+        and internal_type == "DateTimeField"
+        and not hasattr(field, "timezone")
+        and _is_iso(getattr(field, "format", api_settings.DATETIME_FORMAT))
+    ):
+        name = f"_datetime{position}"
+        namespace[name] = partial(_render_datetime, field)
+        return f"None if {value} is None else {name}({value}, tz)"
+    name = f"_field{position}"
+    namespace[name] = field.to_representation
+    return f"None if {value} is None else {name}({value})"
+
+
+def _missing(field, namespace, position):
+    """
+    Expression for ``field`` when a relation on its source is missing, or
+    None when DRF leaves the field out of the output
+    """
+    if field.default is not empty:
+        if field.default is None:
+            return "None"
+
+        def default():
+            value = field.get_default()
+            return None if value is None else field.to_representation(value)
+
+        name = f"_default{position}"
+        namespace[name] = default
+        return f"{name}()"
+    if field.allow_null:
+        return "None"
+    return None
+
+
+def _is_iso(output_format):
+    return isinstance(output_format, str) and output_format.lower() == ISO_8601
+
+
+def _render_datetime(field, value, tz):
+    """DateTimeField.to_representation for ISO output, ``tz`` resolved once"""
+    if value.tzinfo is None:
+        # Naive values need make_aware and its validity checks
+        return field.to_representation(value)
+    if tz is not None:
+        value = value.astimezone(tz)
+    else:
+        value = timezone.make_naive(value, datetime.timezone.utc)
+    value = value.isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
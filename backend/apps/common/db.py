@@ -0,0 +1,25 @@
+from django.conf import settings
+
+
+def _begin_immediate(connection):
+    connection.cursor().execute("BEGIN IMMEDIATE")
+
+
+def tune_sqlite(sender, connection, **kwargs):
+    """
+    connection_created receiver applying ``SQLITE_PRAGMAS`` to every new
+    SQLite connection when ``SQLITE_TUNED`` is on. journal_mode=WAL is
+    stored in the database file; the others are per connection.
+    """
+    if connection.vendor != "sqlite" or not settings.SQLITE_TUNED:
+        return
+    for name, value in settings.SQLITE_PRAGMAS.items():
+        connection.connection.execute(f"PRAGMA {name} = {value}")
+    # Take the write lock when an atomic block starts. A deferred
+    # transaction that reads and then writes (get_or_create and friends)
+    # fails at once with "database is locked" if another writer committed
+    # in between; busy_timeout only covers waiting for the lock up front.
+    # Django 5.1+ exposes this as OPTIONS["transaction_mode"] = "IMMEDIATE".
+    connection._start_transaction_under_autocommit = lambda: _begin_immediate(
+        connection
+    )
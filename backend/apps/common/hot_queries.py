@@ -0,0 +1,18 @@
+"""Course queries audited by ``manage.py queryplans``"""
+
+from .models import Course
+from .queryplans import register
+
+
+@register("courses.by_cohort")
+def courses_by_cohort():
+    """GET /api/students/courses/?cohort="""
+    return (
+        Course.objects.select_related("cohort").filter(cohort_id=1).order_by("id")[:21]
+    )
+
+
+@register("courses.of_cohort")
+def courses_of_cohort():
+    """cohort.courses.all(), in default (code) order"""
+    return Course.objects.filter(cohort_id=1)
@@ -0,0 +1,60 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from apps.common.queryplans import explain, hot_queries
+
+
+class Command(BaseCommand):
+    help = "EXPLAIN the registered hot queries and flag full table scans"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "names",
+            nargs="*",
+            help="Only queries whose name starts with one of these (e.g. users.)",
+        )
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+        parser.add_argument(
+            "--plans", action="store_true", help="Print the SQL and full plan too"
+        )
+
+    def handle(self, *args, **options):
+        queries = [
+            query
+            for query in hot_queries()
+            if not options["names"]
+            or any(query.name.startswith(name) for name in options["names"])
+        ]
+        if not queries:
+            raise CommandError("No hot queries match")
+
+        vendor = connections[options["database"]].vendor
+        self.stdout.write(f"{len(queries)} hot queries on {vendor}")
+        flagged = []
+        for query in queries:
+            plan = explain(query, using=options["database"])
+            notes = []
+            if plan.flagged:
+                notes.append(f"full scan of {', '.join(plan.flagged)}")
+                flagged.append(query.name)
+            if plan.sorts:
+                notes.append("sorts")
+            line = f"{query.name:28} {query.description}"
+            if plan.flagged:
+                self.stdout.write(
+                    self.style.ERROR(f"SCAN  {line} [{'; '.join(notes)}]")
+                )
+            elif notes:
+                self.stdout.write(self.style.WARNING(f"ok    {line} [{notes[0]}]"))
+            else:
+                self.stdout.write(f"ok    {line}")
+            if options["plans"]:
+                self.stdout.write(f"      {plan.sql}")
+                for row in plan.text.splitlines():
+                    self.stdout.write(f"        {row}")
+
+        if flagged:
+            raise CommandError(
+                f"{len(flagged)} hot queries scan whole tables: {', '.join(flagged)}"
+            )
+        self.stdout.write(self.style.SUCCESS("No unexpected full scans"))
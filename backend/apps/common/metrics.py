@@ -0,0 +1,200 @@
+"""
+In-process request metrics in Prometheus text format.
+
+Every thread records into its own shard (a dict guarded by a lock only
+that thread and the scraper ever take), so recording never contends with
+other request threads. A scrape merges the shards. Shards of threads that
+have finished are folded into one retired shard whenever a new thread
+starts recording or a scrape runs, so servers that spawn a thread per
+request keep one shard per live thread. Histograms use fixed
+buckets; counters and histograms are keyed by metric name plus a tuple of
+label pairs. Values are per process: with several workers, scrape each one
+or aggregate in Prometheus.
+"""
+
+import threading
+import weakref
+from bisect import bisect_left
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class _Shard:
+    __slots__ = ("lock", "counters", "histograms", "thread")
+
+    def __init__(self, thread=None):
+        self.lock = threading.Lock()
+        self.counters = {}
+        # (name, labels) -> [per-bucket counts (last is +Inf), sum]
+        self.histograms = {}
+        # Weak reference to the recording thread; None for the retired shard
+        self.thread = thread
+
+    @property
+    def finished(self):
+        thread = self.thread()
+        return thread is None or not thread.is_alive()
+
+    def add_to(self, counters, histograms):
+        """Add this shard's values to ``counters``/``histograms``; hold ``lock``"""
+        for key, value in self.counters.items():
+            counters[key] = counters.get(key, 0) + value
+        for key, (counts, total) in self.histograms.items():
+            merged = histograms.get(key)
+            if merged is None:
+                histograms[key] = [list(counts), total]
+            else:
+                merged[0] = [a + b for a, b in zip(merged[0], counts)]
+                merged[1] += total
+
+
+def _escape(value):
+    return str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _format_value(value):
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = []
+        # Totals of shards whose thread has finished
+        self._retired = _Shard()
+        self._shards_lock = threading.Lock()
+        self._counters = {}  # name -> help
+        self._histograms = {}  # name -> (help, buckets)
+        self._stats_sources = []  # (prefix, help, callable returning a dict)
+
+    # Definitions
+
+    def counter(self, name, help_text):
+        self._counters[name] = help_text
+
+    def histogram(self, name, help_text, buckets):
+        self._histograms[name] = (help_text, tuple(buckets))
+
+    def register_stats(self, prefix, help_text, source):
+        """
+        Expose ``source()`` (a ``stats()``-style dict) as gauges named
+        ``<prefix>_<key>`` at scrape time. Non-numeric values are skipped.
+        """
+        self._stats_sources.append((prefix, help_text, source))
+
+    # Recording
+
+    def _shard(self):
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _Shard(weakref.ref(threading.current_thread()))
+            self._local.shard = shard
+            with self._shards_lock:
+                self._retire_finished()
+                self._shards.append(shard)
+        return shard
+
+    def _retire_finished(self):
+        """Fold the shards of finished threads into ``_retired``; hold ``_shards_lock``"""
+        live = []
+        for shard in self._shards:
+            if not shard.finished:
+                live.append(shard)
+                continue
+            with shard.lock, self._retired.lock:
+                shard.add_to(self._retired.counters, self._retired.histograms)
+        self._shards = live
+
+    def inc(self, name, labels=(), amount=1):
+        shard = self._shard()
+        key = (name, labels)
+        with shard.lock:
+            shard.counters[key] = shard.counters.get(key, 0) + amount
+
+    def observe(self, name, value, labels=()):
+        buckets = self._histograms[name][1]
+        index = bisect_left(buckets, value)
+        shard = self._shard()
+        key = (name, labels)
+        with shard.lock:
+            entry = shard.histograms.get(key)
+            if entry is None:
+                entry = shard.histograms[key] = [[0] * (len(buckets) + 1), 0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    # Exposition
+
+    def _merge(self):
+        counters, histograms = {}, {}
+        # Under _shards_lock so no shard is retired halfway through and
+        # counted twice; only threads recording for the first time wait
+        with self._shards_lock:
+            self._retire_finished()
+            for shard in (self._retired, *self._shards):
+                with shard.lock:
+                    shard.add_to(counters, histograms)
+        return counters, histograms
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format (0.0.4)"""
+        counters, histograms = self._merge()
+        lines = []
+        for name, help_text in self._counters.items():
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            for (metric, labels), value in sorted(counters.items()):
+                if metric == name:
+                    lines.append(f"{name}{_format_labels(labels)} {value}")
+        for name, (help_text, buckets) in self._histograms.items():
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            for (metric, labels), (counts, total) in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip((*buckets, "+Inf"), counts):
+                    cumulative += count
+                    le = (("le", _format_value(bound) if bound != "+Inf" else bound),)
+                    lines.append(
+                        f"{name}_bucket{_format_labels(labels + le)} {cumulative}"
+                    )
+                lines.append(f"{name}_sum{_format_labels(labels)} {total}")
+                lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+        for prefix, help_text, source in self._stats_sources:
+            for key, value in sorted(source().items()):
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                name = f"{prefix}_{key}"
+                lines += [
+                    f"# HELP {name} {help_text}: {key}",
+                    f"# TYPE {name} gauge",
+                    f"{name} {value}",
+                ]
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+registry.counter("http_requests_total", "Requests by route, method and status")
+registry.histogram(
+    "http_request_duration_seconds", "Wall time per request", DURATION_BUCKETS
+)
+registry.histogram(
+    "http_request_db_queries", "Database queries per request", QUERY_COUNT_BUCKETS
+)
+registry.histogram(
+    "http_request_db_duration_seconds",
+    "Time spent in database queries per request",
+    DURATION_BUCKETS,
+)
+registry.histogram(
+    "http_response_size_bytes", "Response body size (non-streaming)", SIZE_BUCKETS
+)
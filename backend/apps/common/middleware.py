@@ -0,0 +1,122 @@
+import random
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connection
+
+from .metrics import registry
+from .nplusone import detect_nplusone
+
+METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+
+
+class QueryTimer:
+    """execute_wrapper counting queries and the time spent in them"""
+
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - started
+
+
+class MetricsMiddleware:
+    """
+    Records per-route request metrics into apps.common.metrics.registry.
+
+    Routes are labelled by resolved URL name (``login``, ``current-user``;
+    "unmatched" for 404s) so label cardinality stays bounded. Request counts
+    are exact; wall time, response size and database queries/time are
+    recorded for a ``METRICS_SAMPLE_RATE`` fraction of requests. Under ASGI
+    the ORM runs in a worker thread, so async views report no DB figures.
+    Keep this first in MIDDLEWARE so it times the whole stack.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = settings.METRICS_SAMPLE_RATE
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if not self._sampled():
+            response = self.get_response(request)
+            registry.inc("http_requests_total", self._labels(request, response))
+            return response
+        timer = QueryTimer()
+        started = time.perf_counter()
+        with connection.execute_wrapper(timer):
+            response = self.get_response(request)
+        self._record(request, response, time.perf_counter() - started, timer)
+        return response
+
+    async def __acall__(self, request):
+        if not self._sampled():
+            response = await self.get_response(request)
+            registry.inc("http_requests_total", self._labels(request, response))
+            return response
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        self._record(request, response, time.perf_counter() - started)
+        return response
+
+    def _sampled(self):
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def _labels(self, request, response):
+        match = request.resolver_match
+        route = (match.url_name or match.view_name) if match else "unmatched"
+        method = request.method if request.method in METHODS else "OTHER"
+        return (("route", route), ("method", method), ("status", response.status_code))
+
+    def _record(self, request, response, elapsed, timer=None):
+        labels = self._labels(request, response)
+        registry.inc("http_requests_total", labels)
+        route = labels[:1]
+        registry.observe("http_request_duration_seconds", elapsed, route)
+        if timer is not None:
+            registry.observe("http_request_db_queries", timer.count, route)
+            registry.observe("http_request_db_duration_seconds", timer.seconds, route)
+        if not response.streaming:
+            registry.observe("http_response_size_bytes", len(response.content), route)
+
+
+class NPlusOneMiddleware:
+    """
+    Tracks each request's queries (apps/common/nplusone.py) and logs the
+    N+1 and duplicate queries it issued, or raises NPlusOneError when
+    NPLUSONE_STRICT is set (read per request, so tests can override it).
+    Installed when NPLUSONE_ENABLED, which follows DEBUG. Async requests
+    pass through untracked: their ORM calls run in other threads.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.get_response(request)
+        label = f"{request.method} {request.get_full_path()}"
+        with detect_nplusone(strict=settings.NPLUSONE_STRICT, label=label):
+            return self.get_response(request)
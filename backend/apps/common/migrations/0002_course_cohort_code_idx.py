@@ -0,0 +1,20 @@
+# Generated by Django 5.0 on 2026-10-18 09:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0001_initial"),
+        ("students", "0003_hot_path_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="course",
+            index=models.Index(
+                fields=["cohort", "code"], name="course_cohort_code_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,254 @@
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import Http404
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+from .cache import catalog
+from .compiled import compile_serializer
+
+
+def conditional_cache_key(prefix, *parts):
+    """
+    Cache key of a ConditionalGetMixin payload. ``parts`` include a version
+    of the source row, so a change is picked up by every process without
+    invalidating anything
+    """
+    return ":".join(["conditional", prefix, *map(str, parts)])
+
+
+def build_conditional_entry(key, data, modified):
+    """
+    Cache entry for ``data`` stored under ``key``: the payload plus its ETag
+    (from the versioned key and the payload) and Last-Modified (``modified``,
+    when the source row last changed)
+    """
+    data = dict(data)
+    body = json.dumps(data, sort_keys=True, cls=DjangoJSONEncoder)
+    return {
+        "data": data,
+        "etag": '"%s"' % hashlib.sha1(f"{key}\n{body}".encode()).hexdigest(),
+        "last_modified": http_date(modified.timestamp()),
+    }
+
+
+def conditional_headers(entry):
+    return {
+        "ETag": entry["etag"],
+        "Last-Modified": entry["last_modified"],
+        # Clients may keep the payload but must revalidate before reuse
+        "Cache-Control": "private, no-cache",
+    }
+
+
+def is_not_modified(request, entry):
+    """True when the request's validators match ``entry`` (answer with 304)"""
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+    if if_none_match is not None:
+        etags = parse_etags(if_none_match)
+        return "*" in etags or entry["etag"] in etags
+    # If-Modified-Since is only consulted without If-None-Match
+    since = parse_http_date_safe(request.META.get("HTTP_IF_MODIFIED_SINCE"))
+    modified = parse_http_date_safe(entry["last_modified"])
+    return since is not None and modified <= since
+
+
+class ConditionalGetMixin:
+    """
+    Serve a cached, serialized payload with strong ETag / Last-Modified
+    validators and answer matching conditional requests with 304.
+
+    Views implement ``get_conditional_key`` (arguments for
+    ``conditional_cache_key``, ending with the source row's version),
+    ``get_conditional_modified`` (when that row last changed) and
+    ``get_conditional_data`` (the payload to serialize on a cache miss), then
+    return ``self.conditional_response()`` from ``get``. A new version is a
+    new key, so entries of older versions are never served and simply expire.
+    """
+
+    conditional_cache_timeout = 300
+
+    def get_conditional_key(self, request, *args, **kwargs):
+        raise NotImplementedError
+
+    def get_conditional_modified(self, request, *args, **kwargs):
+        raise NotImplementedError
+
+    def get_conditional_data(self, request, *args, **kwargs):
+        raise NotImplementedError
+
+    def get_conditional_entry(self, request, *args, **kwargs):
+        key = conditional_cache_key(*self.get_conditional_key(request, *args, **kwargs))
+        entry = cache.get(key)
+        if entry is None:
+            entry = build_conditional_entry(
+                key,
+                self.get_conditional_data(request, *args, **kwargs),
+                self.get_conditional_modified(request, *args, **kwargs),
+            )
+            cache.set(key, entry, self.conditional_cache_timeout)
+        return entry
+
+    def conditional_response(self, request, *args, **kwargs):
+        entry = self.get_conditional_entry(request, *args, **kwargs)
+        headers = conditional_headers(entry)
+        if is_not_modified(request, entry):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(entry["data"], headers=headers)
+
+
+class CatalogListMixin:
+    """
+    Serve ListAPIView pages from the read-through catalog cache
+    (apps/common/cache.py). ``catalog_model`` names the cached model;
+    ``get_catalog_scope`` returns the scope the request's filters select, so
+    a change to one cohort's rows only expires that cohort's lists (and the
+    unfiltered one). Pages are keyed by the full request URI, since
+    pagination links are absolute.
+    """
+
+    catalog_model = None
+
+    def get_catalog_scope(self):
+        return "all"
+
+    def list(self, request, *args, **kwargs):
+        data = catalog.get_list(
+            self.catalog_model,
+            self.get_catalog_scope(),
+            request.build_absolute_uri(),
+            lambda: super(CatalogListMixin, self).list(request, *args, **kwargs).data,
+        )
+        return Response(data)
+
+
+class CatalogObjectMixin:
+    """
+    RetrieveAPIView counterpart of CatalogListMixin: the serialized object is
+    cached per primary key, a missing one as None (404). Object-level
+    permissions are not re-checked on a hit; use it only for views whose
+    permissions are view-level.
+    """
+
+    catalog_model = None
+
+    def retrieve(self, request, *args, **kwargs):
+        def load():
+            try:
+                return self.get_serializer(self.get_object()).data
+            except Http404:
+                return None
+
+        data = catalog.get_object(
+            self.catalog_model,
+            self.kwargs[self.lookup_url_kwarg or self.lookup_field],
+            load,
+        )
+        if data is None:
+            raise Http404
+        return Response(data)
+
+
+class SparseFieldsViewMixin:
+    """
+    ``?fields=a,b`` / ``?exclude=c`` for list views whose serializer uses
+    SparseFieldsSerializerMixin (apps/common/serializers.py).
+
+    The serializer drops the other fields, and ``list`` narrows the queryset
+    to the columns the remaining ones read: ``.values()`` when they are all
+    plain columns (no model instances are built), ``.only()`` otherwise, with
+    select_related trimmed to the relations still needed. The primary key and
+    the pagination ordering column are always fetched.
+
+    Views with ``compile_rows = True`` go one step further whenever the
+    (possibly trimmed) serializer renders plain columns only: rows come from
+    ``values_list()`` and are rendered by a compiled row function
+    (apps/common/compiled.py) instead of the serializer.
+    """
+
+    compile_rows = False
+
+    def get_sparse_fields(self):
+        """(fields, exclude) from the query string; None where absent"""
+        params = self.request.query_params
+        return tuple(
+            [name for name in params[key].split(",") if name] if key in params else None
+            for key in ("fields", "exclude")
+        )
+
+    def get_serializer(self, *args, **kwargs):
+        fields, exclude = self.get_sparse_fields()
+        kwargs.setdefault("fields", fields)
+        kwargs.setdefault("exclude", exclude)
+        return super().get_serializer(*args, **kwargs)
+
+    def get_compiled_serializer(self):
+        """Compiled row function for this request's fields, or None"""
+        if not self.compile_rows:
+            return None
+        fields, exclude = self.get_sparse_fields()
+        try:
+            return compile_serializer(
+                self.get_serializer_class(),
+                # Sorted: the serializer keeps its own field order anyway
+                tuple(sorted(set(fields))) if fields is not None else None,
+                tuple(sorted(set(exclude))) if exclude is not None else None,
+            )
+        except ImproperlyConfigured:
+            return None
+
+    def _key_columns(self, queryset):
+        """The primary key and the pagination ordering columns"""
+        ordering = getattr(self.pagination_class, "ordering", None) or ()
+        if isinstance(ordering, str):
+            ordering = [ordering]
+        return [
+            queryset.model._meta.pk.name,
+            *(name.lstrip("-") for name in ordering),
+        ]
+
+    def project_queryset(self, queryset):
+        compiled = self.get_compiled_serializer()
+        if compiled is not None:
+            extra = [
+                name
+                for name in self._key_columns(queryset)
+                if name not in compiled.columns
+            ]
+            # Named rows, so the paginator can read its cursor position
+            return queryset.select_related(None).values_list(
+                *compiled.columns, *dict.fromkeys(extra), named=True
+            )
+        if self.get_sparse_fields() == (None, None):
+            return queryset
+        projection = self.get_serializer().get_projection()
+        if projection is None:
+            return queryset
+        # dict.fromkeys keeps the column order (and so the SQL text) stable
+        columns = dict.fromkeys(
+            [*projection.paths.values(), *self._key_columns(queryset)]
+        )
+        queryset = queryset.select_related(None)
+        if projection.values_ok:
+            return queryset.values(*columns)
+        if projection.relations:
+            queryset = queryset.select_related(*projection.relations)
+        return queryset.only(*columns, *projection.relations)
+
+    def serialize_rows(self, rows):
+        compiled = self.get_compiled_serializer()
+        if compiled is not None:
+            return compiled.to_representation(rows)
+        return self.get_serializer(rows, many=True).data
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.project_queryset(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.serialize_rows(page))
+        return Response(self.serialize_rows(queryset))
@@ -1,10 +1,13 @@
 from django.db import models
 from apps.students.models import Cohort
+from .utils import TrackedFieldsMixin
 
 
-class Course(models.Model):
+class Course(TrackedFieldsMixin, models.Model):
     """Course model shared across cohorts and professors"""
 
+    TRACKED_FIELDS = ("cohort_id",)
+
     code = models.CharField(max_length=20, unique=True)
     name = models.CharField(max_length=200)
     description = models.TextField(blank=True)
@@ -13,6 +16,9 @@ class Course(models.Model):
 
     class Meta:
         ordering = ["code"]
+        indexes = [
+            models.Index(fields=["cohort", "code"], name="course_cohort_code_idx"),
+        ]
 
     def __str__(self):
         return f"{self.code} - {self.name}"
@@ -0,0 +1,15 @@
+from rest_framework.negotiation import BaseContentNegotiation
+
+
+class IgnoreAcceptNegotiation(BaseContentNegotiation):
+    """
+    For views that always answer in one non-JSON format (exports, /metrics)
+    whatever the client's Accept header says; errors (401/403) still
+    render with the first renderer, JSON.
+    """
+
+    def select_parser(self, request, parsers):
+        return parsers[0]
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
@@ -0,0 +1,236 @@
+"""
+N+1 query detection and query budgets.
+
+``QueryTracker`` is a connection execute_wrapper that fingerprints every
+query: its SQL with whitespace collapsed, ``IN (%s, %s, ...)`` lists of
+any length folded into one and inlined numbers (LIMIT/OFFSET) replaced.
+Within one tracked block (a request, a test) a fingerprint seen
+``threshold`` times with different parameters is an N+1; seen that often
+with the same parameters it is a duplicate. Each finding names the line of
+project code that issued the query and, when it came from a lazy relation
+access such as ``team.cohort`` on a Team loaded without select_related,
+the relation (``Team.cohort``).
+
+NPlusOneMiddleware tracks every request when NPLUSONE_ENABLED (on with
+DEBUG) and logs its findings, or raises NPlusOneError with NPLUSONE_STRICT.
+In tests::
+
+    with detect_nplusone():          # raises NPlusOneError on an N+1
+        client.get("/api/students/")
+
+    with query_budget(3):            # raises QueryBudgetExceeded past 3
+        client.get("/api/students/teams/")
+
+Both also work as decorators. The errors are AssertionErrors, so test
+runners report them as failures.
+"""
+
+import logging
+import re
+import sys
+from contextlib import ContextDecorator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+logger = logging.getLogger(__name__)
+
+_IN_LIST = re.compile(r"\(\s*%s(?:\s*,\s*%s)*\s*\)")
+_NUMBER = re.compile(r"\b\d+\b")
+_SPACE = re.compile(r"\s+")
+
+
+class NPlusOneError(AssertionError):
+    pass
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def fingerprint(sql):
+    """``sql`` with everything that varies between calls of one query folded"""
+    sql = _IN_LIST.sub("(%s, ...)", sql)
+    sql = _NUMBER.sub("N", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+@dataclass
+class CallSite:
+    filename: str
+    lineno: int
+    function: str
+    # "Model.field" when the query was a lazy relation load
+    relation: str = None
+
+    def __str__(self):
+        site = f"{self.filename}:{self.lineno} in {self.function}"
+        if self.relation:
+            return f"lazy load of {self.relation} at {site}"
+        return site
+
+
+@dataclass
+class _Entry:
+    sql: str
+    count: int = 0
+    params: set = field(default_factory=set)
+    site: CallSite = None
+
+
+@dataclass
+class Finding:
+    sql: str
+    count: int
+    # False when every call had the same parameters (a duplicate)
+    varied: bool
+    site: CallSite
+
+    @property
+    def kind(self):
+        # A lazy load repeated for equal keys (many rows, one parent) is
+        # still an N+1
+        return "N+1" if self.varied or self.site.relation else "duplicate"
+
+    def __str__(self):
+        return f"{self.kind}: {self.count} similar queries, {self.site}\n    {self.sql}"
+
+
+def _relation(descriptor):
+    field = getattr(descriptor, "field", None)
+    if field is not None:
+        return f"{field.model.__name__}.{field.name}"
+    related = getattr(descriptor, "related", None)
+    if related is not None:
+        return f"{related.model.__name__}.{related.get_accessor_name()}"
+    return None
+
+
+def _call_site():
+    """
+    The innermost project frame outside this module (else the innermost
+    one outside installed packages), plus any lazy load
+    """
+    root = str(settings.BASE_DIR)
+    relation = None
+    fallback = None
+    frame = sys._getframe(1)
+    while frame is not None:
+        code = frame.f_code
+        filename = code.co_filename
+        if (
+            relation is None
+            and code.co_name == "__get__"
+            and filename.endswith("related_descriptors.py")
+        ):
+            relation = _relation(frame.f_locals.get("self"))
+        elif filename != __file__ and "site-packages" not in filename:
+            if filename.startswith(root):
+                return CallSite(
+                    str(Path(filename).relative_to(root)),
+                    frame.f_lineno,
+                    code.co_name,
+                    relation,
+                )
+            if fallback is None:
+                fallback = (filename, frame.f_lineno, code.co_name)
+        frame = frame.f_back
+    return CallSite(*(fallback or ("<unknown>", 0, "?")), relation)
+
+
+class QueryTracker:
+    """execute_wrapper grouping queries by fingerprint"""
+
+    def __init__(self, threshold=None):
+        self.threshold = threshold or settings.NPLUSONE_THRESHOLD
+        self.count = 0
+        self._entries = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        key = fingerprint(sql)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _Entry(key)
+        entry.count += 1
+        if len(entry.params) < 2:
+            # Two distinct parameter sets are enough to tell N+1s apart
+            # from duplicates
+            entry.params.add(repr(params))
+        if entry.count == self.threshold:
+            # Only repeated queries pay for the stack walk
+            entry.site = _call_site()
+        return execute(sql, params, many, context)
+
+    def findings(self):
+        return [
+            Finding(entry.sql, entry.count, len(entry.params) > 1, entry.site)
+            for entry in self._entries.values()
+            if entry.count >= self.threshold
+        ]
+
+    def summary(self, limit=10):
+        """The most repeated fingerprints, for error messages"""
+        entries = sorted(self._entries.values(), key=lambda e: -e.count)
+        return "\n".join(f"  {e.count}x {e.sql}" for e in entries[:limit])
+
+
+class _Tracked(ContextDecorator):
+    def __init__(self, using=DEFAULT_DB_ALIAS, threshold=None):
+        self.using = using
+        self.threshold = threshold
+
+    def __enter__(self):
+        self.tracker = QueryTracker(self.threshold)
+        self._wrapper = connections[self.using].execute_wrapper(self.tracker)
+        self._wrapper.__enter__()
+        return self.tracker
+
+    def __exit__(self, *exc_info):
+        self._wrapper.__exit__(*exc_info)
+        if exc_info[0] is None:
+            self.check(self.tracker)
+        return False
+
+
+class detect_nplusone(_Tracked):
+    """
+    Report N+1 and duplicate queries issued inside the block; ``strict``
+    raises NPlusOneError, otherwise they are logged as warnings
+    """
+
+    def __init__(self, strict=True, label="", **kwargs):
+        super().__init__(**kwargs)
+        self.strict = strict
+        self.label = label
+
+    def check(self, tracker):
+        findings = tracker.findings()
+        if not findings:
+            return
+        message = "\n".join(map(str, findings))
+        if self.label:
+            message = f"{self.label}\n{message}"
+        if self.strict:
+            raise NPlusOneError(message)
+        logger.warning(message)
+
+
+class query_budget(_Tracked):
+    """Fail with QueryBudgetExceeded if the block runs over ``max_queries``"""
+
+    def __init__(self, max_queries, **kwargs):
+        super().__init__(**kwargs)
+        self.max_queries = max_queries
+
+    def check(self, tracker):
+        if tracker.count <= self.max_queries:
+            return
+        message = [
+            f"{tracker.count} queries, budget {self.max_queries}:",
+            tracker.summary(),
+        ]
+        message.extend(map(str, tracker.findings()))
+        raise QueryBudgetExceeded("\n".join(message))
@@ -0,0 +1,17 @@
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor (keyset) pagination over the primary key.
+
+    Each page is ``WHERE id > <last seen> ORDER BY id LIMIT n`` against the
+    PK index, so page 500 costs the same as page 1 and no COUNT(*) is run.
+    Views with a better indexed, unique and immutable column can override
+    ``ordering``.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = "id"
@@ -0,0 +1,27 @@
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from .renderers import FastJSONRenderer, orjson
+
+UTF8 = {"utf-8", "utf8"}
+
+
+class FastJSONParser(JSONParser):
+    """
+    orjson-backed JSONParser (opt in with API_FAST_JSON). orjson only reads
+    UTF-8 and always rejects NaN/Infinity, so other encodings or a
+    non-strict STRICT_JSON setting fall back to the stdlib parser.
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or not self.strict or encoding.lower() not in UTF8:
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
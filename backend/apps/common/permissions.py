@@ -28,6 +28,5 @@ class IsOwnerOrAdmin(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.user.role == "admin":
             return True
-        return obj == request.user or (
-            hasattr(obj, "user") and obj.user == request.user
-        )
+        # user_id, not user: comparing obj.user would load the user row
+        return obj == request.user or getattr(obj, "user_id", None) == request.user.pk
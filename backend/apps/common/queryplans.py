@@ -0,0 +1,110 @@
+"""
+Hot query registry and EXPLAIN-based plan audit.
+
+Each app lists the queries its busy request paths run in a
+``hot_queries`` module, built the way the code builds them (placeholder
+ids are fine, EXPLAIN needs no rows)::
+
+    from apps.common.queryplans import register
+
+    @register("students.by_cohort")
+    def students_by_cohort():
+        return StudentProfile.objects.filter(cohort_id=1).order_by("id")[:21]
+
+``manage.py queryplans`` runs every registered queryset through EXPLAIN on
+the active database and flags the tables it reads in full:
+
+* SQLite: ``SCAN <table>`` without an index (``SCAN ... USING INDEX`` is an
+  ordered index walk, which a LIMIT stops early, and is not flagged),
+* PostgreSQL: ``Seq Scan on <table>``. Plans are taken with
+  ``enable_seqscan`` off, so a small development database, where scanning
+  is cheapest, still shows whether an index *could* serve the query,
+* MySQL: ``"access_type": "ALL"`` in the JSON plan.
+
+Sorts the plan has to do itself (``USE TEMP B-TREE``, ``Sort``,
+``filesort``) are reported too, without failing the audit. A query that
+is meant to walk a whole table (a paginated list in primary key order)
+names it in ``scans``.
+"""
+
+import re
+from dataclasses import dataclass, field
+
+from django.db import connections, transaction
+from django.utils.module_loading import autodiscover_modules
+
+FULL_SCANS = {
+    "sqlite": re.compile(r"\bSCAN (\w+)$", re.MULTILINE),
+    "postgresql": re.compile(r"\bSeq Scan on (\w+)"),
+    "mysql": re.compile(r'"table_name": "(\w+)",\s*"access_type": "ALL"'),
+}
+SORTS = {
+    "sqlite": re.compile(r"USE TEMP B-TREE"),
+    "postgresql": re.compile(r"\bSort\b"),
+    "mysql": re.compile(r'"using_filesort": true'),
+}
+
+
+@dataclass(frozen=True)
+class HotQuery:
+    name: str
+    build: object
+    # Tables this query is expected to read in full
+    scans: tuple = ()
+
+    @property
+    def description(self):
+        return (self.build.__doc__ or "").strip()
+
+
+@dataclass
+class Plan:
+    query: HotQuery
+    sql: str
+    text: str
+    full_scans: list = field(default_factory=list)
+    sorts: bool = False
+
+    @property
+    def flagged(self):
+        """Full scans the query did not declare"""
+        return [table for table in self.full_scans if table not in self.query.scans]
+
+
+_registry = {}
+
+
+def register(name, scans=()):
+    """Decorator adding a function returning a QuerySet as hot query ``name``"""
+
+    def decorator(build):
+        _registry[name] = HotQuery(name, build, tuple(scans))
+        return build
+
+    return decorator
+
+
+def hot_queries():
+    """Every registered hot query, by name, after importing each app's module"""
+    autodiscover_modules("hot_queries")
+    return [_registry[name] for name in sorted(_registry)]
+
+
+def explain(query, using="default"):
+    queryset = query.build().using(using)
+    vendor = connections[using].vendor
+    options = {"format": "json"} if vendor == "mysql" else {}
+    with transaction.atomic(using=using):
+        if vendor == "postgresql":
+            with connections[using].cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        text = queryset.explain(**options)
+    scans = FULL_SCANS.get(vendor)
+    sorts = SORTS.get(vendor)
+    return Plan(
+        query=query,
+        sql=str(queryset.query),
+        text=text,
+        full_scans=sorted(set(scans.findall(text))) if scans else [],
+        sorts=bool(sorts and sorts.search(text)),
+    )
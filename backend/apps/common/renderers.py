@@ -0,0 +1,51 @@
+"""
+orjson-backed drop-in for DRF's JSONRenderer (opt in with API_FAST_JSON).
+
+orjson encodes UUIDs, datetimes, dates and times natively in C, so they never
+go through DRF's Python ``JSONEncoder.default``. Anything else that orjson
+doesn't know (Decimal, lazy translation strings, timedelta, querysets, ...)
+is handed to that same encoder, which keeps the output identical to the
+stock renderer. When orjson isn't installed, or a request asks for
+something only the stdlib encoder does (``indent``, ASCII-only output,
+non-compact separators), rendering falls back to ``JSONRenderer``.
+
+One difference: with STRICT_JSON, NaN and Infinity are rendered as null
+where the stock renderer raises ValueError.
+"""
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_encoder = JSONEncoder()
+
+if orjson is not None:
+    # UTC_Z: "...Z" rather than "...+00:00", like DRF's encoder
+    OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not self._accelerated(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+        ret = orjson.dumps(data, default=_encoder.default, option=OPTIONS)
+        # Same JavaScript-safe escaping of U+2028/U+2029 as JSONRenderer
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
+
+    def _accelerated(self, accepted_media_type, renderer_context):
+        return (
+            orjson is not None
+            and self.compact
+            and not self.ensure_ascii
+            and self.get_indent(accepted_media_type, renderer_context) is None
+        )
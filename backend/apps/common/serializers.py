@@ -0,0 +1,122 @@
+"""
+Sparse fieldsets for ModelSerializers.
+
+``SparseFieldsSerializerMixin`` lets a caller keep only some fields::
+
+    UserSerializer(user, fields=["id", "email"])
+    StudentProfileSerializer(page, many=True, exclude=["graduation_year"])
+
+and reports which database columns the remaining fields read
+(``get_projection``), so list views can narrow their queryset to match
+(see SparseFieldsViewMixin in apps/common/mixins.py). When every remaining
+field is a plain column, or a primary key of a forward relation, the
+projection is marked ``values_ok`` and the serializer also renders the
+dict rows of ``queryset.values(...)``, skipping model instances entirely.
+"""
+
+from dataclasses import dataclass
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.relations import PrimaryKeyRelatedField, RelatedField
+
+
+@dataclass
+class Projection:
+    # Serializer field name -> ORM path ("email", "user__email", "cohort")
+    paths: dict
+    # Forward relations the paths traverse, for select_related()
+    relations: set
+    # Whether the fields can be rendered from queryset.values() rows
+    values_ok: bool
+
+
+class SparseFieldsSerializerMixin:
+    def __init__(self, *args, fields=None, exclude=None, **kwargs):
+        self._sparse_fields = fields
+        self._sparse_exclude = exclude
+        super().__init__(*args, **kwargs)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        requested = self._sparse_fields
+        excluded = self._sparse_exclude or ()
+        unknown = [
+            name for name in (*(requested or ()), *excluded) if name not in fields
+        ]
+        if unknown:
+            raise serializers.ValidationError(
+                {"fields": [f"Unknown field(s): {', '.join(unknown)}"]}
+            )
+        if requested is not None:
+            fields = {
+                name: field for name, field in fields.items() if name in requested
+            }
+        for name in excluded:
+            fields.pop(name, None)
+        return fields
+
+    def get_projection(self):
+        """
+        Projection of the remaining readable fields, or None when one of
+        them reads something other than a model column (a method field, a
+        property, a nested serializer) and the queryset must stay as it is
+        """
+        if hasattr(self, "_projection"):
+            return self._projection
+        self._projection = None
+        paths, relations, values_ok = {}, set(), True
+        for field in self._readable_fields:
+            if isinstance(field, serializers.BaseSerializer) or field.source == "*":
+                return None
+            path = self._column_path(field.source_attrs, relations)
+            if path is None:
+                return None
+            if isinstance(field, RelatedField) and not isinstance(
+                field, PrimaryKeyRelatedField
+            ):
+                values_ok = False
+            paths[field.field_name] = path
+        self._projection = Projection(paths, relations, values_ok)
+        return self._projection
+
+    def _column_path(self, source_attrs, relations):
+        model = self.Meta.model
+        for depth, attr in enumerate(source_attrs):
+            try:
+                model_field = model._meta.get_field(attr)
+            except FieldDoesNotExist:
+                return None
+            last = depth == len(source_attrs) - 1
+            if last:
+                if not model_field.concrete or model_field.many_to_many:
+                    return None
+                break
+            if not (model_field.many_to_one or model_field.one_to_one):
+                return None
+            if not model_field.concrete:
+                return None
+            relations.add("__".join(source_attrs[: depth + 1]))
+            model = model_field.related_model
+        return "__".join(source_attrs)
+
+    def to_representation(self, instance):
+        projection = self.get_projection() if isinstance(instance, dict) else None
+        if projection is None or not projection.values_ok:
+            return super().to_representation(instance)
+        # A queryset.values() row keyed by the projection's paths
+        paths = projection.paths
+        ret = {}
+        for field in self._readable_fields:
+            value = instance[paths[field.field_name]]
+            if value is None:
+                ret[field.field_name] = None
+            elif isinstance(field, PrimaryKeyRelatedField):
+                ret[field.field_name] = (
+                    field.pk_field.to_representation(value)
+                    if field.pk_field is not None
+                    else value
+                )
+            else:
+                ret[field.field_name] = field.to_representation(value)
+        return ret
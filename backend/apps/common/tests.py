@@ -0,0 +1,281 @@
+import datetime
+import threading
+from itertools import combinations
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework import serializers
+
+from apps.authentication.serializers import UserSerializer
+from apps.students.models import Cohort, StudentProfile, Team
+from apps.students.serializers import (
+    CourseSerializer,
+    StudentProfileSerializer,
+    TeamSerializer,
+)
+from apps.students.views import StudentProfileQuerysetMixin
+from .compiled import compile_serializer
+from .metrics import MetricsRegistry
+from .nplusone import NPlusOneError, QueryBudgetExceeded, detect_nplusone, query_budget
+from .models import Course
+
+User = get_user_model()
+
+
+class OmittingStudentSerializer(StudentProfileSerializer):
+    """No default and no allow_null: DRF leaves team_name out"""
+
+    team_name = serializers.CharField(source="team.name", read_only=True)
+
+
+class NullStudentSerializer(StudentProfileSerializer):
+    team_name = serializers.CharField(
+        source="team.name", read_only=True, allow_null=True
+    )
+
+
+class DefaultStudentSerializer(StudentProfileSerializer):
+    team_name = serializers.CharField(
+        source="team.name", read_only=True, default="Unassigned"
+    )
+    cohort_name = serializers.CharField(
+        source="cohort.name", read_only=True, default=lambda: "No cohort"
+    )
+
+
+class MethodStudentSerializer(StudentProfileSerializer):
+    label = serializers.SerializerMethodField()
+
+    class Meta(StudentProfileSerializer.Meta):
+        fields = [*StudentProfileSerializer.Meta.fields, "label"]
+
+    def get_label(self, profile):
+        return str(profile)
+
+
+def students():
+    return StudentProfileQuerysetMixin().get_queryset()
+
+
+class CompiledSerializerTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        start = datetime.date(2026, 1, 5)
+        cohorts = [
+            Cohort.objects.create(name=f"Cohort {i}", start_date=start, end_date=start)
+            for i in range(2)
+        ]
+        teams = [
+            Team.objects.create(name=f"Team {i}", cohort=cohorts[i]) for i in range(2)
+        ]
+        for i in range(2):
+            Course.objects.create(
+                code=f"C{i}", name=f"Course {i}", cohort=cohorts[i], description=""
+            )
+        # Every combination of cohort/team/graduation year being missing
+        for i in range(8):
+            user = User.objects.create_user(
+                username=f"student{i}",
+                email=f"student{i}@example.com",
+                password="x",
+                role="student",
+                first_name=f"First {i}" if i % 2 else "",
+            )
+            # Around midnight and a DST change in the zones used below
+            User.objects.filter(pk=user.pk).update(
+                date_joined=datetime.datetime(
+                    2026,
+                    3,
+                    8 + i % 2,
+                    6 + i,
+                    30,
+                    15,
+                    123456 * (i % 2),
+                    tzinfo=datetime.timezone.utc,
+                )
+            )
+            profile = user.student_profile
+            profile.cohort = cohorts[i % 2] if i & 1 else None
+            profile.team = teams[i % 2] if i & 2 else None
+            profile.graduation_year = 2027 if i & 4 else None
+            profile.save()
+
+    def assertParity(self, serializer_class, queryset, fields=None, exclude=None):
+        queryset = queryset.order_by("pk")
+        expected = serializer_class(
+            queryset,
+            many=True,
+            fields=list(fields) if fields is not None else None,
+            exclude=list(exclude) if exclude is not None else None,
+        ).data
+        compiled = compile_serializer(
+            serializer_class,
+            tuple(fields) if fields is not None else None,
+            tuple(exclude) if exclude is not None else None,
+        )
+        actual = compiled.to_representation(queryset.values_list(*compiled.columns))
+        # Key order is part of the payload
+        self.assertEqual(
+            [list(row.items()) for row in actual],
+            [list(row.items()) for row in expected],
+            f"{serializer_class.__name__} fields={fields} exclude={exclude}",
+        )
+        return actual
+
+    def test_nullable_relation_guard_and_default(self):
+        rows = self.assertParity(StudentProfileSerializer, students())
+        self.assertIn(None, [row["team_name"] for row in rows])
+        self.assertIn(None, [row["cohort_name"] for row in rows])
+
+    def test_nullable_relation_callable_and_constant_default(self):
+        rows = self.assertParity(DefaultStudentSerializer, students())
+        self.assertIn("Unassigned", [row["team_name"] for row in rows])
+        self.assertIn("No cohort", [row["cohort_name"] for row in rows])
+
+    def test_nullable_relation_allow_null(self):
+        self.assertParity(NullStudentSerializer, students())
+
+    def test_nullable_relation_omission(self):
+        rows = self.assertParity(OmittingStudentSerializer, students())
+        self.assertIn(False, ["team_name" in row for row in rows])
+        self.assertParity(OmittingStudentSerializer, students(), fields=("team_name",))
+
+    def test_uuids(self):
+        self.assertParity(UserSerializer, User.objects.all(), fields=("id",))
+        self.assertParity(StudentProfileSerializer, students(), fields=("user_id",))
+
+    def test_aware_datetimes_in_active_timezone(self):
+        for zone in ("Asia/Kolkata", "America/New_York", "UTC"):
+            with self.subTest(zone=zone), timezone.override(zone):
+                self.assertParity(UserSerializer, User.objects.all())
+
+    @override_settings(USE_TZ=False)
+    def test_naive_datetimes(self):
+        with timezone.override("Asia/Kolkata"):
+            self.assertParity(UserSerializer, User.objects.all())
+
+    def test_naive_datetime_values_with_use_tz(self):
+        compiled = compile_serializer(UserSerializer, ("date_joined",))
+        field = UserSerializer().fields["date_joined"]
+        naive = datetime.datetime(2026, 3, 8, 2, 30)
+        with timezone.override("America/New_York"):
+            self.assertEqual(
+                compiled.to_representation([(naive,)]),
+                [{"date_joined": field.to_representation(naive)}],
+            )
+
+    def test_sparse_field_combinations(self):
+        cases = (
+            (UserSerializer, User.objects.all()),
+            (StudentProfileSerializer, students()),
+            (OmittingStudentSerializer, students()),
+            (DefaultStudentSerializer, students()),
+            (TeamSerializer, Team.objects.select_related("cohort")),
+            (CourseSerializer, Course.objects.select_related("cohort")),
+        )
+        for serializer_class, queryset in cases:
+            names = list(serializer_class().fields)
+            for size in (1, 2):
+                for fields in combinations(names, size):
+                    with self.subTest(serializer_class.__name__, fields=fields):
+                        self.assertParity(serializer_class, queryset, fields=fields)
+                    # Same set requested in the other order
+                    with self.subTest(serializer_class.__name__, fields=fields[::-1]):
+                        self.assertParity(
+                            serializer_class, queryset, fields=fields[::-1]
+                        )
+            for name in names:
+                with self.subTest(serializer_class.__name__, exclude=name):
+                    self.assertParity(serializer_class, queryset, exclude=(name,))
+            with self.subTest(
+                serializer_class.__name__, fields=names[:3], exclude=names[1]
+            ):
+                self.assertParity(
+                    serializer_class,
+                    queryset,
+                    fields=tuple(names[:3]),
+                    exclude=(names[1],),
+                )
+
+    def test_non_column_fields_are_rejected(self):
+        with self.assertRaises(ImproperlyConfigured):
+            compile_serializer(MethodStudentSerializer)
+        compile_serializer(MethodStudentSerializer, exclude=("label",))
+
+
+class MetricsRegistryTests(TestCase):
+    def test_finished_threads_are_folded(self):
+        registry = MetricsRegistry()
+        registry.counter("jobs_total", "Jobs")
+        registry.histogram("job_seconds", "Job time", (1.0, 5.0))
+
+        def record():
+            registry.inc("jobs_total", (("kind", "a"),))
+            registry.observe("job_seconds", 2.0)
+
+        for _ in range(5):
+            threads = [threading.Thread(target=record) for _ in range(20)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # Each batch's threads retired the previous batch's shards
+        self.assertLessEqual(len(registry._shards), 20)
+        output = registry.render()
+        self.assertEqual(registry._shards, [])
+        self.assertIn('jobs_total{kind="a"} 100', output)
+        self.assertIn('job_seconds_bucket{le="5"} 100', output)
+        self.assertIn("job_seconds_sum 200.0", output)
+
+        record()
+        registry.render()
+        self.assertEqual(len(registry._shards), 1)
+        self.assertIn('jobs_total{kind="a"} 101', registry.render())
+
+
+class NPlusOneTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        start = datetime.date(2026, 1, 5)
+        for i in range(4):
+            cohort = Cohort.objects.create(
+                name=f"Cohort {i}", start_date=start, end_date=start
+            )
+            Team.objects.create(name=f"Team {i}", cohort=cohort)
+
+    def test_lazy_relation_in_a_loop(self):
+        with self.assertRaises(NPlusOneError) as raised:
+            with detect_nplusone():
+                [str(team) for team in Team.objects.all()]
+        message = str(raised.exception)
+        self.assertIn("lazy load of Team.cohort", message)
+        self.assertIn("apps/students/models.py", message)
+
+    def test_select_related_passes(self):
+        with detect_nplusone():
+            names = [str(team) for team in Team.objects.select_related("cohort")]
+        self.assertEqual(len(names), 4)
+
+    def test_non_strict_logs(self):
+        with self.assertLogs("apps.common.nplusone", "WARNING"):
+            with detect_nplusone(strict=False, label="teams"):
+                [str(team) for team in Team.objects.all()]
+
+    def test_decorator(self):
+        @detect_nplusone()
+        def names():
+            return [str(team) for team in Team.objects.all()]
+
+        with self.assertRaises(NPlusOneError):
+            names()
+
+    def test_query_budget(self):
+        with query_budget(1):
+            list(Team.objects.select_related("cohort"))
+        with self.assertRaises(QueryBudgetExceeded) as raised:
+            with query_budget(2):
+                [str(team) for team in Team.objects.all()]
+        self.assertIn("5 queries, budget 2", str(raised.exception))
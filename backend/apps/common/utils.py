@@ -0,0 +1,112 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUTTLCache:
+    """
+    Small thread-safe in-process cache with LRU eviction and a per-entry TTL.
+    Meant for hot, cheap-to-rebuild objects that must not outlive ``ttl``
+    seconds even when nothing explicitly invalidates them.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, maxsize=1024, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key, self._MISSING)
+            if entry is self._MISSING:
+                return default
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class TrackedFieldsMixin:
+    """
+    Model mixin remembering the database values of ``TRACKED_FIELDS``
+    (attribute names, e.g. ``"team_id"``) so signal handlers can tell what a
+    save actually changed without re-querying. Inside post_save the snapshot
+    still describes the state before the save in progress.
+    """
+
+    TRACKED_FIELDS = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {
+            name: value
+            for name, value in zip(field_names, values)
+            if name in cls.TRACKED_FIELDS
+        }
+        return instance
+
+    def loaded_value(self, name, default=None):
+        """Value of ``name`` as last loaded or saved, ``default`` if unknown"""
+        return (getattr(self, "_loaded_values", None) or {}).get(name, default)
+
+    @property
+    def changed_fields(self):
+        """
+        Tracked fields that differ from the values last loaded or saved.
+        Unsaved instances report every tracked field as changed.
+        """
+        loaded = getattr(self, "_loaded_values", None)
+        if loaded is None:
+            return set(self.TRACKED_FIELDS)
+        return {
+            name
+            for name in self.TRACKED_FIELDS
+            if name not in loaded or loaded[name] != getattr(self, name)
+        }
+
+    def written_fields(self, update_fields=None):
+        """
+        Tracked fields a save of ``update_fields`` (None: all) writes.
+        ``update_fields`` may name fields (``"team"``) or attributes
+        (``"team_id"``); the result uses attribute names.
+        """
+        if update_fields is None:
+            return set(self.TRACKED_FIELDS)
+        attnames = {self._meta.get_field(name).attname for name in update_fields}
+        return attnames.intersection(self.TRACKED_FIELDS)
+
+    def saved_changes(self, update_fields=None):
+        """``changed_fields`` that a save of ``update_fields`` writes"""
+        return self.changed_fields & self.written_fields(update_fields)
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Only the fields just written are now in sync with the database
+        loaded = dict(getattr(self, "_loaded_values", None) or {})
+        for name in self.written_fields(kwargs.get("update_fields")):
+            loaded[name] = getattr(self, name)
+        self._loaded_values = loaded
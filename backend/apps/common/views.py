@@ -0,0 +1,21 @@
+from django.http import HttpResponse
+from rest_framework.views import APIView
+
+from .metrics import registry
+from .negotiation import IgnoreAcceptNegotiation
+from .permissions import IsAdmin
+
+
+class MetricsView(APIView):
+    """
+    Prometheus metrics for this process (admins only)
+    GET /metrics
+    """
+
+    permission_classes = [IsAdmin]
+    content_negotiation_class = IgnoreAcceptNegotiation
+
+    def get(self, request):
+        return HttpResponse(
+            registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+        )
@@ -0,0 +1,20 @@
+from django.contrib import admin
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = [
+        "id",
+        "task",
+        "status",
+        "priority",
+        "attempts",
+        "run_at",
+        "created_by",
+        "finished_at",
+    ]
+    list_filter = ["status", "task"]
+    search_fields = ["task", "locked_by"]
+    raw_id_fields = ["created_by"]
+    readonly_fields = ["locked_by", "locked_at", "started_at", "finished_at"]
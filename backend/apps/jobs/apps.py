@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+
+
+class JobsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.jobs"
+    label = "jobs"
+
+    def ready(self):
+        from django.utils.module_loading import autodiscover_modules
+
+        # Each app registers its background tasks in a ``jobs`` module
+        autodiscover_modules("jobs")
@@ -0,0 +1,21 @@
+"""Job queue queries audited by ``manage.py queryplans``"""
+
+import uuid
+
+from django.utils import timezone
+
+from apps.common.queryplans import register
+from .models import Job
+from .queue import _due
+
+
+@register("jobs.claim")
+def jobs_claim():
+    """Worker claim: the next due queued job"""
+    return _due(timezone.now())[:1]
+
+
+@register("jobs.by_owner")
+def jobs_by_owner():
+    """GET /api/jobs/ for a non-admin"""
+    return Job.objects.filter(created_by_id=uuid.uuid4()).order_by("-id")[:21]
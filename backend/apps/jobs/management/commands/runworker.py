@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.jobs.tasks import TASKS
+from apps.jobs.worker import run_workers
+
+
+class Command(BaseCommand):
+    help = "Run background job workers until stopped (SIGTERM/Ctrl-C)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=settings.JOBS_WORKER_PROCESSES,
+            help="Worker processes to run (default: JOBS_WORKER_PROCESSES)",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=None,
+            help="Seconds to sleep when the queue is empty (default: JOBS_POLL_INTERVAL)",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once the queue has no due jobs left",
+        )
+        parser.add_argument(
+            "--max-jobs",
+            type=int,
+            default=None,
+            help="Recycle each worker process after this many jobs",
+        )
+
+    def handle(self, *args, **options):
+        if options["processes"] < 1:
+            raise CommandError("--processes must be at least 1")
+        self.stdout.write(
+            f"Starting {options['processes']} worker(s) for tasks: "
+            + ", ".join(sorted(TASKS))
+        )
+        processed = run_workers(
+            options["processes"],
+            poll_interval=options["poll_interval"],
+            burst=options["burst"],
+            max_jobs=options["max_jobs"],
+        )
+        if processed is not None:
+            self.stdout.write(self.style.SUCCESS(f"Processed {processed} jobs"))
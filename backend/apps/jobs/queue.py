@@ -0,0 +1,180 @@
+"""
+Claiming and running jobs.
+
+Where the database supports it (PostgreSQL, MySQL 8, Oracle) a worker claims
+its next job with ``SELECT ... FOR UPDATE SKIP LOCKED``, so concurrent
+workers never queue up behind each other's candidate row. SQLite has no row
+locks: there the worker reads a few candidates and flips one with a
+conditional ``UPDATE ... WHERE status = 'queued'``, keeping the first it
+wins. Either way each claim hands a job to exactly one worker.
+
+While a job runs, a heartbeat thread refreshes its ``locked_at`` every
+``JOBS_HEARTBEAT_INTERVAL`` seconds, so ``release_stale`` reclaims jobs
+whose worker went silent, not jobs that merely run longer than
+``JOBS_LOCK_TIMEOUT``. Outcomes are written with the same ``locked_by``
+guard, so a worker whose job was reclaimed anyway cannot overwrite the
+result of the worker that picked it up again.
+"""
+
+import threading
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, connection, connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+from .tasks import UnknownTask, get_task
+
+# Conditional-UPDATE fallback: candidates read per claim attempt
+CANDIDATES = 8
+# Traceback characters kept in Job.error
+ERROR_LIMIT = 4000
+
+
+def _due(now):
+    return Job.objects.filter(status=Job.QUEUED, run_at__lte=now).order_by(
+        "-priority", "run_at", "id"
+    )
+
+
+def claim(worker):
+    """Mark the next due job as running for ``worker``; None when idle"""
+    now = timezone.now()
+    changes = {
+        "status": Job.RUNNING,
+        "locked_by": worker,
+        "locked_at": now,
+        "started_at": now,
+        "attempts": F("attempts") + 1,
+    }
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            pk = (
+                _due(now)
+                .select_for_update(skip_locked=True)
+                .values_list("pk", flat=True)
+                .first()
+            )
+            if pk is None:
+                return None
+            Job.objects.filter(pk=pk).update(**changes)
+    else:
+        for pk in _due(now).values_list("pk", flat=True)[:CANDIDATES]:
+            if Job.objects.filter(pk=pk, status=Job.QUEUED).update(**changes):
+                break
+        else:
+            return None
+    return Job.objects.get(pk=pk)
+
+
+def backoff(attempts):
+    """Seconds to wait before retry number ``attempts``"""
+    delay = settings.JOBS_RETRY_BACKOFF * 2 ** (attempts - 1)
+    return min(delay, settings.JOBS_RETRY_BACKOFF_MAX)
+
+
+class Heartbeat:
+    """Context manager refreshing a running job's ``locked_at`` from a thread"""
+
+    def __init__(self, job, interval=None):
+        self.job = job
+        self.interval = (
+            settings.JOBS_HEARTBEAT_INTERVAL if interval is None else interval
+        )
+        self.beats = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"job-heartbeat-{job.pk}", daemon=True
+        )
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        return False
+
+    def _run(self):
+        try:
+            while not self._stop.wait(self.interval):
+                try:
+                    updated = _owned(self.job).update(locked_at=timezone.now())
+                except DatabaseError:
+                    # A missed beat only matters once they add up to the
+                    # lock timeout
+                    continue
+                if not updated:
+                    # Reclaimed or finished: nothing left to keep alive
+                    break
+                self.beats += 1
+        finally:
+            # This thread's own connections
+            connections.close_all()
+
+
+def run(job):
+    """Execute a claimed job and record its outcome; returns the new status"""
+    try:
+        with Heartbeat(job):
+            result = get_task(job.task).func(**job.kwargs)
+    except Exception as exc:
+        return _failed(job, exc)
+    _owned(job).update(
+        status=Job.SUCCEEDED,
+        result=result,
+        error="",
+        finished_at=timezone.now(),
+    )
+    return Job.SUCCEEDED
+
+
+def _owned(job):
+    return Job.objects.filter(pk=job.pk, status=Job.RUNNING, locked_by=job.locked_by)
+
+
+def _failed(job, exc):
+    now = timezone.now()
+    error = traceback.format_exc()[-ERROR_LIMIT:]
+    if job.attempts < job.max_attempts and not isinstance(exc, UnknownTask):
+        _owned(job).update(
+            status=Job.QUEUED,
+            run_at=now + timedelta(seconds=backoff(job.attempts)),
+            locked_by="",
+            locked_at=None,
+            error=error,
+        )
+        return Job.QUEUED
+    _owned(job).update(status=Job.FAILED, error=error, finished_at=now)
+    return Job.FAILED
+
+
+def release_stale(timeout=None):
+    """
+    Return jobs whose worker stopped reporting (killed, OOM, host lost) to
+    the queue, or fail them when they have no attempts left: those whose
+    heartbeat is older than ``timeout`` seconds. Returns the number of jobs
+    touched.
+    """
+    timeout = settings.JOBS_LOCK_TIMEOUT if timeout is None else timeout
+    now = timezone.now()
+    stale = Job.objects.filter(
+        status=Job.RUNNING, locked_at__lt=now - timedelta(seconds=timeout)
+    )
+    requeued = stale.filter(attempts__lt=F("max_attempts")).update(
+        status=Job.QUEUED,
+        run_at=now,
+        locked_by="",
+        locked_at=None,
+        error="Worker lost while running this job",
+    )
+    failed = stale.update(
+        status=Job.FAILED,
+        finished_at=now,
+        error="Worker lost while running this job",
+    )
+    return requeued + failed
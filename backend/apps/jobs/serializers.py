@@ -0,0 +1,41 @@
+from rest_framework import serializers
+from rest_framework.reverse import reverse
+
+from apps.common.serializers import SparseFieldsSerializerMixin
+from .models import Job
+
+
+class JobSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    """Status of a background job; ``download`` is set once a file is ready"""
+
+    download = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Job
+        fields = [
+            "id",
+            "task",
+            "status",
+            "priority",
+            "attempts",
+            "max_attempts",
+            "run_at",
+            "created_at",
+            "started_at",
+            "finished_at",
+            "result",
+            "error",
+            "download",
+        ]
+        read_only_fields = fields
+
+    def get_download(self, obj):
+        if obj.status != Job.SUCCEEDED or not has_file(obj):
+            return None
+        return reverse(
+            "job-download", args=[obj.pk], request=self.context.get("request")
+        )
+
+
+def has_file(job):
+    return isinstance(job.result, dict) and bool(job.result.get("file"))
@@ -0,0 +1,80 @@
+"""
+Task registry and enqueueing.
+
+Apps declare background work in a ``jobs`` module, which JobsConfig.ready
+imports for every installed app::
+
+    @task("students.recompute_cohort_stats", max_attempts=3)
+    def recompute(cohort_ids=None):
+        ...
+
+and request it with ``enqueue("students.recompute_cohort_stats",
+{"cohort_ids": [1]})``. The keyword arguments must be JSON-serializable;
+so must the return value, which is stored in ``Job.result``.
+"""
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+
+from .models import Job
+
+
+class UnknownTask(LookupError):
+    """No task is registered under the requested name"""
+
+
+@dataclass(frozen=True)
+class Task:
+    name: str
+    func: Callable
+    max_attempts: int
+    priority: int
+
+
+TASKS = {}
+
+
+def task(name, max_attempts=None, priority=0):
+    """Register the decorated function as background task ``name``"""
+
+    def decorator(func):
+        if name in TASKS:
+            raise ImproperlyConfigured(f"Task {name!r} is registered twice")
+        TASKS[name] = Task(
+            name=name,
+            func=func,
+            max_attempts=max_attempts or settings.JOBS_MAX_ATTEMPTS,
+            priority=priority,
+        )
+        return func
+
+    return decorator
+
+
+def get_task(name):
+    try:
+        return TASKS[name]
+    except KeyError:
+        raise UnknownTask(f"No task registered as {name!r}") from None
+
+
+def enqueue(name, kwargs=None, *, user=None, priority=None, delay=0):
+    """
+    Queue task ``name`` with keyword arguments ``kwargs`` and return the
+    Job. ``delay`` holds it back for that many seconds; ``user`` is recorded
+    as the owner, who may then follow it through the status API.
+    """
+    spec = get_task(name)
+    return Job.objects.create(
+        task=name,
+        kwargs=kwargs or {},
+        priority=spec.priority if priority is None else priority,
+        max_attempts=spec.max_attempts,
+        run_at=timezone.now() + timedelta(seconds=delay),
+        created_by_id=user.pk if user is not None and user.is_authenticated else None,
+    )
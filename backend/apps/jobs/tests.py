@@ -0,0 +1,58 @@
+import time
+from datetime import timedelta
+
+from django.test import TransactionTestCase, override_settings
+from django.utils import timezone
+
+from .models import Job
+from .queue import Heartbeat, claim, release_stale, run
+from .tasks import enqueue, task
+
+
+@task("jobs.tests.sleep", max_attempts=1)
+def sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+class HeartbeatTests(TransactionTestCase):
+    def claim_stale(self, seconds=0):
+        """A job claimed by a worker whose last beat was an hour ago"""
+        enqueue("jobs.tests.sleep", {"seconds": seconds})
+        job = claim("worker-1")
+        Job.objects.filter(pk=job.pk).update(
+            locked_at=timezone.now() - timedelta(hours=1)
+        )
+        job.refresh_from_db()
+        return job
+
+    def test_silent_worker_is_released(self):
+        self.claim_stale()
+        self.assertEqual(release_stale(timeout=60), 1)
+        self.assertEqual(Job.objects.get().status, Job.FAILED)
+
+    def test_heartbeat_keeps_long_job_locked(self):
+        job = self.claim_stale()
+        with Heartbeat(job, interval=0.02) as heartbeat:
+            time.sleep(0.2)
+            self.assertEqual(release_stale(timeout=60), 0)
+        self.assertGreater(heartbeat.beats, 0)
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.RUNNING)
+        self.assertGreater(job.locked_at, timezone.now() - timedelta(seconds=60))
+
+    def test_heartbeat_stops_once_job_is_reclaimed(self):
+        job = self.claim_stale()
+        with Heartbeat(job, interval=0.02) as heartbeat:
+            Job.objects.filter(pk=job.pk).update(locked_by="worker-2")
+            time.sleep(0.1)
+            self.assertFalse(heartbeat._thread.is_alive())
+        self.assertEqual(heartbeat.beats, 0)
+
+    @override_settings(JOBS_HEARTBEAT_INTERVAL=0.02)
+    def test_run_beats_while_the_task_runs(self):
+        job = self.claim_stale(seconds=0.2)
+        self.assertEqual(run(job), Job.SUCCEEDED)
+        job.refresh_from_db()
+        self.assertEqual(job.result, 0.2)
+        self.assertGreater(job.locked_at, timezone.now() - timedelta(seconds=60))
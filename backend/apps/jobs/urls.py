@@ -0,0 +1,8 @@
+from django.urls import path
+from .views import JobDetailView, JobDownloadView, JobListView
+
+urlpatterns = [
+    path("", JobListView.as_view(), name="job-list"),
+    path("<int:pk>/", JobDetailView.as_view(), name="job-detail"),
+    path("<int:pk>/download/", JobDownloadView.as_view(), name="job-download"),
+]
@@ -0,0 +1,100 @@
+import os
+
+from django.core.files.storage import storages
+from django.http import FileResponse, Http404
+from rest_framework import generics, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
+from rest_framework.views import APIView
+
+from apps.common.mixins import SparseFieldsViewMixin
+from apps.common.negotiation import IgnoreAcceptNegotiation
+from apps.common.pagination import KeysetPagination
+from .models import Job
+from .serializers import JobSerializer, has_file
+
+
+def wants_background(request):
+    """
+    True when the client asked for the work to be queued, with
+    ``?background=1`` or an RFC 7240 ``Prefer: respond-async`` header
+    """
+    if request.query_params.get("background", "").lower() in ("1", "true", "yes"):
+        return True
+    return "respond-async" in request.headers.get("Prefer", "").lower()
+
+
+def job_accepted(request, job):
+    """202 response for a view that handed its work to ``job``"""
+    return Response(
+        JobSerializer(job, context={"request": request}).data,
+        status=status.HTTP_202_ACCEPTED,
+        headers={"Location": reverse("job-detail", args=[job.pk], request=request)},
+    )
+
+
+class NewestFirstPagination(KeysetPagination):
+    ordering = "-id"
+
+
+class JobQuerysetMixin:
+    """Admins see every job, everyone else only the jobs they started"""
+
+    def get_queryset(self):
+        jobs = Job.objects.defer("kwargs")
+        if self.request.user.role != "admin":
+            jobs = jobs.filter(created_by_id=self.request.user.pk)
+        return jobs
+
+
+class JobListView(SparseFieldsViewMixin, JobQuerysetMixin, generics.ListAPIView):
+    """
+    List background jobs, newest first
+    GET /api/jobs/?status=queued|running|succeeded|failed&task=<name>&fields=<a,b>
+    """
+
+    serializer_class = JobSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = NewestFirstPagination
+
+    def get_queryset(self):
+        jobs = super().get_queryset()
+        params = self.request.query_params
+        if params.get("status"):
+            jobs = jobs.filter(status=params["status"])
+        if params.get("task"):
+            jobs = jobs.filter(task=params["task"])
+        return jobs
+
+
+class JobDetailView(JobQuerysetMixin, generics.RetrieveAPIView):
+    """
+    Status of one background job
+    GET /api/jobs/<id>/
+    """
+
+    serializer_class = JobSerializer
+    permission_classes = [IsAuthenticated]
+
+
+class JobDownloadView(JobQuerysetMixin, APIView):
+    """
+    Download the file a finished job produced (e.g. a background export)
+    GET /api/jobs/<id>/download/
+    """
+
+    permission_classes = [IsAuthenticated]
+    content_negotiation_class = IgnoreAcceptNegotiation
+
+    def get(self, request, pk):
+        job = generics.get_object_or_404(self.get_queryset(), pk=pk)
+        if job.status != Job.SUCCEEDED or not has_file(job):
+            raise Http404("This job has no file to download")
+        name = job.result["file"]
+        storage = storages["jobs"]
+        if not storage.exists(name):
+            raise Http404("The job's file has been removed")
+        return FileResponse(
+            storage.open(name), as_attachment=True, filename=os.path.basename(name)
+        )
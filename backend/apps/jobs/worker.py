@@ -0,0 +1,130 @@
+"""
+Worker processes for the job queue.
+
+``Worker`` is the per-process loop: claim a job, run it, repeat, sleeping
+``poll_interval`` seconds whenever the queue is empty and handing stale
+jobs back to the queue every ``JOBS_LOCK_TIMEOUT / 4`` seconds. SIGTERM and
+SIGINT let the current job finish before the loop exits.
+
+``run_workers`` forks ``processes`` of them and supervises: a worker that
+dies is restarted, and SIGTERM/SIGINT to the parent is passed on to every
+child. Workers are not daemonic, so a task may start its own process pool
+(the roster importer hashes passwords that way).
+
+Nothing here imports models at module level: with the ``spawn`` start
+method the child unpickles ``_serve`` before Django is set up.
+"""
+
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+
+from django.conf import settings
+
+
+class Worker:
+    def __init__(self, name=None, poll_interval=None, burst=False, max_jobs=None):
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}"
+        self.poll_interval = (
+            settings.JOBS_POLL_INTERVAL if poll_interval is None else poll_interval
+        )
+        self.burst = burst
+        self.max_jobs = max_jobs
+        self.processed = 0
+        self._stop = threading.Event()
+        self._next_release = 0.0
+
+    def stop(self, *args):
+        self._stop.set()
+
+    def install_signal_handlers(self):
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+    def run(self):
+        from django.db import close_old_connections
+
+        from .queue import claim, release_stale
+        from .queue import run as run_job
+
+        while not self._stop.is_set():
+            close_old_connections()
+            if time.monotonic() >= self._next_release:
+                release_stale()
+                self._next_release = time.monotonic() + settings.JOBS_LOCK_TIMEOUT / 4
+            job = claim(self.name)
+            if job is None:
+                if self.burst:
+                    break
+                self._stop.wait(self.poll_interval)
+                continue
+            run_job(job)
+            self.processed += 1
+            if self.max_jobs and self.processed >= self.max_jobs:
+                break
+        close_old_connections()
+        return self.processed
+
+
+def _serve(options):
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        django.setup()
+    worker = Worker(**options)
+    worker.install_signal_handlers()
+    worker.run()
+
+
+def run_workers(processes, **options):
+    """Run ``processes`` workers (in this process when 1) until stopped"""
+    if processes <= 1:
+        worker = Worker(**options)
+        worker.install_signal_handlers()
+        return worker.run()
+
+    from django.db import connections
+
+    # Children must open their own connections rather than share ours
+    connections.close_all()
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+    stopping = threading.Event()
+
+    def start():
+        process = context.Process(target=_serve, args=(options,), daemon=False)
+        process.start()
+        return process
+
+    def stop(*args):
+        stopping.set()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    pool = [start() for _ in range(processes)]
+    while pool:
+        stopping.wait(1.0)
+        if stopping.is_set():
+            for process in pool:
+                if process.is_alive():
+                    os.kill(process.pid, signal.SIGTERM)
+            for process in pool:
+                process.join()
+            break
+        for index, process in enumerate(pool):
+            if process.is_alive():
+                continue
+            process.join()
+            # Burst workers exit once the queue is empty; max_jobs workers
+            # exit to be recycled and crashed workers are replaced
+            if options.get("burst") and process.exitcode == 0:
+                pool[index] = None
+            else:
+                pool[index] = start()
+        pool = [process for process in pool if process is not None]
+    return None
@@ -0,0 +1,164 @@
+"""
+In-process pub/sub between model-change events and WebSocket subscribers.
+
+Sockets subscribe to groups (``cohort:3``, ``team:7``). Events published to
+a group are held for ``NOTIFICATIONS_BATCH_WINDOW`` seconds, or until
+``NOTIFICATIONS_BATCH_SIZE`` are pending, and then go out as one message
+encoded once and shared by every subscriber of the group. A team
+reshuffle touching 40 students is one frame per socket, not 40.
+
+Each subscriber has a bounded queue of outgoing frames. When a client stops
+reading, its queue fills up; the hub then drops what is pending and queues
+a single ``{"type": "overflow"}`` frame, telling the client to refetch
+rather than replay a backlog. A slow socket never blocks the publisher or
+the other subscribers.
+
+The hub belongs to the event loop of the ASGI process. ``publish`` may be
+called from any thread (signal handlers run in sync code) and hops onto the
+loop; before the first socket connects there is nobody to deliver to and
+events are discarded.
+"""
+
+import asyncio
+import json
+import threading
+from collections import defaultdict, deque
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+def cohort_group(cohort_id):
+    return f"cohort:{cohort_id}"
+
+
+def team_group(team_id):
+    return f"team:{team_id}"
+
+
+class Subscriber:
+    """
+    Outgoing frame queue of one socket. Each frame is queued with the group
+    it was published to (None for replies and ``overflow``), so the socket
+    can re-check it may still follow that group before sending.
+    """
+
+    def __init__(self, max_pending):
+        self.max_pending = max_pending
+        self.groups = set()
+        self.dropped = 0
+        self._frames = deque()
+        self._ready = asyncio.Event()
+
+    def put(self, frame, group=None):
+        if len(self._frames) >= self.max_pending:
+            self.dropped += len(self._frames)
+            self._frames.clear()
+            frame = json.dumps({"type": "overflow", "dropped": self.dropped})
+            group = None
+        self._frames.append((group, frame))
+        self._ready.set()
+
+    async def get(self):
+        """Next ``(group, frame)`` pair"""
+        while not self._frames:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._frames.popleft()
+
+
+class Hub:
+    def __init__(self, batch_window=0.05, batch_size=100, max_pending=64):
+        self.batch_window = batch_window
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.loop = None
+        self.groups = defaultdict(set)
+        self._pending = defaultdict(list)
+        self._flush_handle = None
+
+    def attach(self):
+        """Bind to the running loop; called by every socket before subscribing"""
+        loop = asyncio.get_running_loop()
+        if self.loop is not loop:
+            # A new loop (server restart in-process, tests): the old
+            # subscribers went away with the old loop
+            self.loop = loop
+            self.groups.clear()
+            self._pending.clear()
+            self._flush_handle = None
+
+    def subscriber(self):
+        return Subscriber(self.max_pending)
+
+    def subscribe(self, subscriber, group):
+        self.groups[group].add(subscriber)
+        subscriber.groups.add(group)
+
+    def unsubscribe(self, subscriber, group=None):
+        """Leave ``group``, or every group when it is None"""
+        for name in [group] if group is not None else list(subscriber.groups):
+            subscriber.groups.discard(name)
+            members = self.groups.get(name)
+            if members is not None:
+                members.discard(subscriber)
+                if not members:
+                    del self.groups[name]
+                    self._pending.pop(name, None)
+
+    def publish(self, group, event):
+        """Queue ``event`` (a JSON-serializable dict) for ``group``"""
+        loop = self.loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._enqueue(group, event)
+        else:
+            loop.call_soon_threadsafe(self._enqueue, group, event)
+
+    def _enqueue(self, group, event):
+        if group not in self.groups:
+            return
+        pending = self._pending[group]
+        pending.append(event)
+        if len(pending) >= self.batch_size or self.batch_window <= 0:
+            self._flush_group(group)
+        elif self._flush_handle is None:
+            self._flush_handle = self.loop.call_later(self.batch_window, self.flush)
+
+    def flush(self):
+        self._flush_handle = None
+        for group in list(self._pending):
+            self._flush_group(group)
+
+    def _flush_group(self, group):
+        events = self._pending.pop(group, None)
+        if not events:
+            return
+        frame = json.dumps(
+            {"type": "events", "channel": group, "events": events},
+            cls=DjangoJSONEncoder,
+        )
+        for subscriber in self.groups.get(group, ()):
+            subscriber.put(frame, group)
+
+
+_hub = None
+_hub_lock = threading.Lock()
+
+
+def get_hub():
+    global _hub
+    if _hub is None:
+        with _hub_lock:
+            if _hub is None:
+                _hub = Hub(
+                    batch_window=settings.NOTIFICATIONS_BATCH_WINDOW,
+                    batch_size=settings.NOTIFICATIONS_BATCH_SIZE,
+                    max_pending=settings.NOTIFICATIONS_MAX_PENDING,
+                )
+    return _hub
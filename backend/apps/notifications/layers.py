@@ -0,0 +1,107 @@
+"""
+Pluggable transport carrying notification events to the hub of every ASGI
+process.
+
+``NOTIFICATIONS_LAYER["BACKEND"]`` selects the implementation:
+
+* ``LocalLayer`` hands events straight to this process's hub. Enough when
+  one ASGI process serves both the API and the sockets, and what the
+  benchmarks use.
+* ``PostgresLayer`` sends them with ``NOTIFY`` on one channel. Every ASGI
+  process ``LISTEN``s on a dedicated connection and feeds its own hub, so a
+  save made by any web or job worker reaches sockets held by any other. The
+  database is already shared by all of them, so no extra broker is needed.
+  Postgres caps a payload at 8000 bytes; larger events are dropped and
+  logged.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from django.utils.module_loading import import_string
+
+from .hub import get_hub
+
+logger = logging.getLogger(__name__)
+
+
+class BaseLayer:
+    def publish(self, group, event):
+        """Deliver ``event`` to ``group`` in every process; callable from sync code"""
+        raise NotImplementedError
+
+    async def start(self, hub):
+        """Begin feeding ``hub`` with events published by other processes"""
+
+
+class LocalLayer(BaseLayer):
+    def publish(self, group, event):
+        get_hub().publish(group, event)
+
+
+class PostgresLayer(BaseLayer):
+    MAX_PAYLOAD = 8000
+
+    def __init__(self, channel="notifications", reconnect_delay=1.0):
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self._listener = None
+
+    def publish(self, group, event):
+        payload = json.dumps({"group": group, "event": event}, cls=DjangoJSONEncoder)
+        if len(payload.encode()) >= self.MAX_PAYLOAD:
+            logger.warning("Dropping %d-byte notification for %s", len(payload), group)
+            return
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [self.channel, payload])
+
+    async def start(self, hub):
+        listener = self._listener
+        if (
+            listener is None
+            or listener.done()
+            or listener.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._listener = asyncio.create_task(self._listen(hub))
+
+    async def _listen(self, hub):
+        import psycopg
+        from psycopg import sql
+
+        params = connection.get_connection_params()
+        # Sync-only options Django adds for its own connections
+        for key in ("cursor_factory", "pool"):
+            params.pop(key, None)
+        while True:
+            try:
+                aconn = await psycopg.AsyncConnection.connect(**params, autocommit=True)
+                async with aconn:
+                    await aconn.execute(
+                        sql.SQL("LISTEN {}").format(sql.Identifier(self.channel))
+                    )
+                    async for notify in aconn.notifies():
+                        message = json.loads(notify.payload)
+                        hub.publish(message["group"], message["event"])
+            except psycopg.Error:
+                logger.exception("Notification listener lost its connection")
+                await asyncio.sleep(self.reconnect_delay)
+
+
+_layer = None
+_layer_lock = threading.Lock()
+
+
+def get_layer():
+    """Return the configured notification layer (one instance per process)"""
+    global _layer
+    if _layer is None:
+        with _layer_lock:
+            if _layer is None:
+                backend = import_string(settings.NOTIFICATIONS_LAYER["BACKEND"])
+                _layer = backend(**settings.NOTIFICATIONS_LAYER.get("OPTIONS", {}))
+    return _layer
@@ -0,0 +1,90 @@
+"""
+Model changes pushed to the WebSocket channels.
+
+Every event is published once the surrounding transaction commits, to the
+channels of both the old and the new cohort/team, so a student moved
+between teams shows up on both team dashboards. Bulk writes that skip
+signals (roster import, queryset updates) publish nothing; dashboards
+refetch on reconnect anyway.
+"""
+
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.common.models import Course
+from apps.students.models import StudentProfile, Team
+from .hub import cohort_group, team_group
+from .layers import get_layer
+
+
+def _publish(groups, event):
+    layer = get_layer()
+    for group in groups:
+        layer.publish(group, event)
+
+
+def notify(groups, event):
+    """Publish ``event`` to ``groups`` after the current transaction commits"""
+    transaction.on_commit(partial(_publish, sorted(set(groups)), event))
+
+
+def _action(created, kwargs):
+    if kwargs.get("signal") is post_delete:
+        return "deleted"
+    return "created" if created else "updated"
+
+
+@receiver(post_save, sender=StudentProfile)
+@receiver(post_delete, sender=StudentProfile)
+def notify_student(sender, instance, created=False, **kwargs):
+    cohorts = {instance.cohort_id, instance.loaded_value("cohort_id")}
+    teams = {instance.team_id, instance.loaded_value("team_id")}
+    notify(
+        [cohort_group(pk) for pk in cohorts if pk is not None]
+        + [team_group(pk) for pk in teams if pk is not None],
+        {
+            "model": "student",
+            "action": _action(created, kwargs),
+            "id": instance.pk,
+            "user": instance.user_id,
+            "cohort": instance.cohort_id,
+            "team": instance.team_id,
+        },
+    )
+
+
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+def notify_team(sender, instance, created=False, **kwargs):
+    cohorts = {instance.cohort_id, instance.loaded_value("cohort_id")}
+    notify(
+        [cohort_group(pk) for pk in cohorts if pk is not None]
+        + [team_group(instance.pk)],
+        {
+            "model": "team",
+            "action": _action(created, kwargs),
+            "id": instance.pk,
+            "name": instance.name,
+            "cohort": instance.cohort_id,
+        },
+    )
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def notify_course(sender, instance, created=False, **kwargs):
+    cohorts = {instance.cohort_id, instance.loaded_value("cohort_id")}
+    notify(
+        [cohort_group(pk) for pk in cohorts if pk is not None],
+        {
+            "model": "course",
+            "action": _action(created, kwargs),
+            "id": instance.pk,
+            "code": instance.code,
+            "name": instance.name,
+            "cohort": instance.cohort_id,
+        },
+    )
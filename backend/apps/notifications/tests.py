@@ -0,0 +1,119 @@
+import asyncio
+import datetime
+import json
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.authentication.revocation import revoke_user_tokens
+from apps.authentication.tokens import PlatformRefreshToken
+from apps.students.models import Cohort, StudentProfile, Team
+from .hub import get_hub
+from .websocket import CLOSE_UNAUTHORIZED, NotificationSocket
+
+
+class SocketClient:
+    """Drives NotificationSocket the way an ASGI server would"""
+
+    def __init__(self, token):
+        self.incoming = asyncio.Queue()
+        self.outgoing = asyncio.Queue()
+        scope = {
+            "type": "websocket",
+            "path": "/ws/notifications/",
+            "query_string": f"token={token}".encode(),
+            "headers": [],
+        }
+        self.task = asyncio.create_task(
+            NotificationSocket()(scope, self.incoming.get, self.outgoing.put)
+        )
+
+    async def connect(self):
+        await self.incoming.put({"type": "websocket.connect"})
+        return await self.next()
+
+    async def send_json(self, data):
+        await self.incoming.put({"type": "websocket.receive", "text": json.dumps(data)})
+
+    async def next(self):
+        return await asyncio.wait_for(self.outgoing.get(), 5)
+
+    async def next_json(self):
+        return json.loads((await self.next())["text"])
+
+    async def disconnect(self):
+        await self.incoming.put({"type": "websocket.disconnect"})
+        await asyncio.wait_for(self.task, 5)
+
+
+class NotificationSocketTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        today = datetime.date.today()
+        cohort = Cohort.objects.create(name="Cohort", start_date=today, end_date=today)
+        self.teams = [
+            Team.objects.create(name=f"Team {i}", cohort=cohort) for i in range(2)
+        ]
+        self.user = get_user_model().objects.create_user(
+            username="ada", email="ada@example.com", password="x", role="student"
+        )
+        StudentProfile.objects.filter(user=self.user).update(
+            cohort=cohort, team=self.teams[0]
+        )
+        self.channel = f"team:{self.teams[0].pk}"
+
+    def token(self, lifetime=None):
+        access = PlatformRefreshToken.for_user(self.user).access_token
+        if lifetime is not None:
+            access.set_exp(lifetime=lifetime)
+        return str(access)
+
+    async def subscribed_client(self, **kwargs):
+        client = SocketClient(self.token(**kwargs))
+        self.assertEqual((await client.connect())["type"], "websocket.accept")
+        await client.send_json({"action": "subscribe", "channel": self.channel})
+        self.assertEqual((await client.next_json())["type"], "subscribed")
+        return client
+
+    async def test_events_are_delivered(self):
+        client = await self.subscribed_client()
+        get_hub().publish(self.channel, {"model": "team"})
+        frame = await client.next_json()
+        self.assertEqual(frame["type"], "events")
+        self.assertEqual(frame["events"], [{"model": "team"}])
+        await client.disconnect()
+
+    async def test_moved_student_is_unsubscribed(self):
+        client = await self.subscribed_client()
+        # A queryset update, like team formation: no signals
+        await StudentProfile.objects.filter(user=self.user).aupdate(team=self.teams[1])
+        get_hub().publish(self.channel, {"model": "team"})
+        frame = await client.next_json()
+        self.assertEqual(frame["type"], "unsubscribed")
+        self.assertEqual(frame["channel"], self.channel)
+        self.assertNotIn(self.channel, get_hub().groups)
+        await client.disconnect()
+
+    async def test_revoked_token_closes_socket(self):
+        client = await self.subscribed_client()
+        await sync_to_async(revoke_user_tokens)(
+            get_user_model().objects.filter(pk=self.user.pk)
+        )
+        get_hub().publish(self.channel, {"model": "team"})
+        message = await client.next()
+        self.assertEqual(
+            message, {"type": "websocket.close", "code": CLOSE_UNAUTHORIZED}
+        )
+        await client.disconnect()
+
+    async def test_expired_token_closes_socket(self):
+        # exp is whole seconds: leave at least one for the subscribe
+        client = await self.subscribed_client(lifetime=datetime.timedelta(seconds=2))
+        message = await client.next()
+        self.assertEqual(
+            message, {"type": "websocket.close", "code": CLOSE_UNAUTHORIZED}
+        )
+        self.assertNotIn(self.channel, get_hub().groups)
+        await client.disconnect()
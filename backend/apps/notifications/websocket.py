@@ -0,0 +1,197 @@
+"""
+WebSocket endpoint for dashboard notifications (ASGI only).
+
+    ws://host/ws/notifications/?token=<access token>
+
+Non-browser clients may send ``Authorization: Bearer <token>`` instead of
+the query parameter. The token is validated with the configured DRF JWT
+authentication (so ``SIMPLE_JWT`` and token_version revocation apply) during
+the handshake; a bad or missing token closes the socket before it is
+accepted. An accepted socket is closed with ``CLOSE_UNAUTHORIZED`` when the
+token expires, and when a frame is about to go out after the token was
+revoked (a token_version bump: role change, deactivation, logout
+everywhere). Clients reconnect with a fresh token.
+
+Clients then pick channels::
+
+    {"action": "subscribe", "channel": "cohort:3"}
+    {"action": "unsubscribe", "channel": "team:7"}
+
+Admins and professors may follow any cohort or team, students only their
+own. Students are checked on every subscribe and again before every batch
+is delivered (one indexed profile read), so a student moved off a team or
+cohort, including by bulk writes that send no signals, stops receiving its
+events at once and gets an ``unsubscribed`` frame with ``"detail": "Not
+allowed"``. The server answers with ``subscribed``/``unsubscribed``/``error``
+frames and pushes ``{"type": "events", "channel": ..., "events": [...]}``
+batches; see hub.py for batching and the ``overflow`` frame.
+"""
+
+import asyncio
+import json
+import time
+from urllib.parse import parse_qs
+
+from rest_framework.settings import api_settings as drf_settings
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.authentication.revocation import ais_token_current
+from .hub import get_hub
+from .layers import get_layer
+
+CHANNEL_KINDS = ("cohort", "team")
+MAX_CHANNELS = 50
+
+# Close codes. Sent before accept, servers answer the handshake with 403
+CLOSE_UNAUTHORIZED = 4401
+CLOSE_NOT_FOUND = 4404
+
+
+def _raw_token(scope):
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            parts = value.split()
+            if len(parts) == 2 and parts[0].decode() in api_settings.AUTH_HEADER_TYPES:
+                return parts[1]
+    tokens = parse_qs(scope.get("query_string", b"").decode()).get("token")
+    return tokens[0].encode() if tokens else None
+
+
+async def authenticate(scope):
+    """``(user, validated token)`` for the handshake's JWT, or None"""
+    raw_token = _raw_token(scope)
+    if raw_token is None:
+        return None
+    for auth_class in drf_settings.DEFAULT_AUTHENTICATION_CLASSES:
+        authenticator = auth_class()
+        if not hasattr(authenticator, "aget_user"):
+            continue
+        try:
+            validated_token = authenticator.get_validated_token(raw_token)
+            return await authenticator.aget_user(validated_token), validated_token
+        except (InvalidToken, AuthenticationFailed):
+            return None
+    return None
+
+
+async def may_follow(user, kind, object_id):
+    if user.role in ("admin", "professor"):
+        return True
+    if user.role != "student":
+        return False
+    from apps.students.models import StudentProfile
+
+    profile = await (
+        StudentProfile.objects.filter(user_id=user.pk)
+        .values_list("cohort_id", "team_id")
+        .afirst()
+    )
+    if profile is None:
+        return False
+    cohort_id, team_id = profile
+    return object_id == (cohort_id if kind == "cohort" else team_id)
+
+
+class Session:
+    """The user and token of one accepted socket"""
+
+    def __init__(self, user, token):
+        self.user = user
+        self.token = token
+
+    @property
+    def expires_in(self):
+        """Seconds until the access token expires"""
+        return self.token["exp"] - time.time()
+
+    async def is_current(self):
+        """The token has neither expired nor been revoked"""
+        return self.expires_in > 0 and await ais_token_current(self.token)
+
+
+class NotificationSocket:
+    """ASGI application for one ``/ws/notifications/`` connection"""
+
+    async def __call__(self, scope, receive, send):
+        message = await receive()
+        if message["type"] != "websocket.connect":
+            return
+        authenticated = await authenticate(scope)
+        if authenticated is None:
+            await send({"type": "websocket.close", "code": CLOSE_UNAUTHORIZED})
+            return
+        session = Session(*authenticated)
+
+        hub = get_hub()
+        hub.attach()
+        await get_layer().start(hub)
+        await send({"type": "websocket.accept"})
+
+        subscriber = hub.subscriber()
+        pump = asyncio.create_task(self._pump(hub, session, subscriber, send))
+        try:
+            while True:
+                message = await receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                if message["type"] == "websocket.receive" and not pump.done():
+                    reply = await self.handle(
+                        hub, session, subscriber, message.get("text")
+                    )
+                    subscriber.put(json.dumps(reply))
+        finally:
+            hub.unsubscribe(subscriber)
+            pump.cancel()
+
+    async def _pump(self, hub, session, subscriber, send):
+        # The only task sending once the socket is accepted. Closing leaves
+        # the receive loop to the server's websocket.disconnect.
+        while True:
+            try:
+                channel, frame = await asyncio.wait_for(
+                    subscriber.get(), max(session.expires_in, 0)
+                )
+            except asyncio.TimeoutError:
+                break
+            if channel is not None:
+                if not await session.is_current():
+                    break
+                kind, object_id = channel.split(":")
+                if not await may_follow(session.user, kind, int(object_id)):
+                    hub.unsubscribe(subscriber, channel)
+                    frame = json.dumps(
+                        {
+                            "type": "unsubscribed",
+                            "channel": channel,
+                            "detail": "Not allowed",
+                        }
+                    )
+            await send({"type": "websocket.send", "text": frame})
+        hub.unsubscribe(subscriber)
+        await send({"type": "websocket.close", "code": CLOSE_UNAUTHORIZED})
+
+    async def handle(self, hub, session, subscriber, text):
+        try:
+            request = json.loads(text or "")
+            action = request["action"]
+            channel = request["channel"]
+            kind, object_id = channel.split(":")
+            object_id = int(object_id)
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return {"type": "error", "detail": "Expected {action, channel}"}
+        if kind not in CHANNEL_KINDS or action not in ("subscribe", "unsubscribe"):
+            return {"type": "error", "detail": "Unknown channel or action"}
+        channel = f"{kind}:{object_id}"
+
+        if action == "unsubscribe":
+            hub.unsubscribe(subscriber, channel)
+            return {"type": "unsubscribed", "channel": channel}
+        if channel not in subscriber.groups and len(subscriber.groups) >= MAX_CHANNELS:
+            return {"type": "error", "detail": "Too many channels", "channel": channel}
+        if not await session.is_current():
+            return {"type": "error", "detail": "Token expired or revoked"}
+        if not await may_follow(session.user, kind, object_id):
+            return {"type": "error", "detail": "Not allowed", "channel": channel}
+        hub.subscribe(subscriber, channel)
+        return {"type": "subscribed", "channel": channel}
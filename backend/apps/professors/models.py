@@ -1,12 +1,16 @@
 from django.db import models
 from django.contrib.auth import get_user_model
 
+from apps.common.utils import TrackedFieldsMixin
+
 User = get_user_model()
 
 
-class ProfessorProfile(models.Model):
+class ProfessorProfile(TrackedFieldsMixin, models.Model):
     """Extended profile for professor users"""
 
+    TRACKED_FIELDS = ("department", "specialization")
+
     user = models.OneToOneField(
         User, on_delete=models.CASCADE, related_name="professor_profile"
     )
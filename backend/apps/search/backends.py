@@ -0,0 +1,131 @@
+"""
+Database-specific full-text search over SearchEntry.
+
+* SQLite: an FTS5 table (``SearchIndex``) with prefix indexes, ranked by
+  bm25. Created by migration 0001 together with its sync triggers.
+* Postgres: GIN indexes on ``to_tsvector('simple', document)`` and on
+  ``document`` with ``gin_trgm_ops``. Prefix tsquery matches are ranked
+  with ts_rank, and trigram word similarity catches typos.
+* Anything else falls back to unindexed ``icontains`` per term.
+
+Every backend takes the user's text as plain words: punctuation is dropped
+before the query is built, so no query syntax reaches the database.
+"""
+
+import re
+
+from django.db import connection
+from django.db.models import F, Q, Value
+
+from .models import SearchEntry
+
+MAX_TERMS = 8
+_WORD = re.compile(r"\w+")
+
+
+def parse_terms(text):
+    """Lower-cased words of ``text``, at most MAX_TERMS of them"""
+    return _WORD.findall(text.lower())[:MAX_TERMS]
+
+
+class BaseSearchBackend:
+    """
+    ``search`` filters a SearchEntry queryset down to entries matching
+    every term, annotates a ``score`` (higher is better) and orders by it.
+    """
+
+    def search(self, queryset, terms):
+        raise NotImplementedError
+
+    def optimize(self):
+        """Compact the index after a bulk rebuild"""
+
+
+class SQLiteSearchBackend(BaseSearchBackend):
+    def search(self, queryset, terms):
+        # Each word is quoted and prefix-matched: "jo"* "smi"*
+        expression = " ".join(f'"{term}"*' for term in terms)
+        return (
+            queryset.filter(fts__text__match=expression)
+            .annotate(score=-F("fts__rank"))
+            .order_by("fts__rank")
+        )
+
+    def optimize(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO search_searchentry_fts(search_searchentry_fts) "
+                "VALUES ('optimize')"
+            )
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    def __init__(self):
+        from django.contrib.postgres.lookups import TrigramWordSimilar
+
+        # contrib.postgres isn't in INSTALLED_APPS, so register the one
+        # lookup we need on the indexed field only
+        SearchEntry._meta.get_field("document").register_lookup(TrigramWordSimilar)
+
+    def search(self, queryset, terms):
+        from django.contrib.postgres.search import (
+            SearchQuery,
+            SearchRank,
+            SearchVector,
+            TrigramWordSimilarity,
+        )
+
+        # Same expression as the GIN index created in migration 0001
+        vector = SearchVector("document", config="simple")
+        query = SearchQuery(
+            " & ".join(f"{term}:*" for term in terms),
+            search_type="raw",
+            config="simple",
+        )
+        text = " ".join(terms)
+        return (
+            queryset.annotate(vector=vector)
+            .filter(Q(vector=query) | Q(document__trigram_word_similar=text))
+            .annotate(
+                score=SearchRank(vector, query)
+                + TrigramWordSimilarity(text, "document")
+            )
+            .order_by("-score", "id")
+        )
+
+
+class ContainsSearchBackend(BaseSearchBackend):
+    def search(self, queryset, terms):
+        for term in terms:
+            queryset = queryset.filter(document__icontains=term)
+        return queryset.annotate(score=Value(0.0)).order_by("title", "id")
+
+
+_backends = {}
+
+
+def get_search_backend():
+    """Return the backend for the default database's vendor"""
+    vendor = connection.vendor
+    if vendor not in _backends:
+        if vendor == "sqlite":
+            _backends[vendor] = SQLiteSearchBackend()
+        elif vendor == "postgresql":
+            _backends[vendor] = PostgresSearchBackend()
+        else:
+            _backends[vendor] = ContainsSearchBackend()
+    return _backends[vendor]
+
+
+def search_entries(text, kinds=None):
+    """
+    Ranked SearchEntry queryset for free text ``text``, optionally limited
+    to some ``kinds`` ("user", "course"). Empty text matches nothing.
+    """
+    terms = parse_terms(text)
+    if not terms:
+        return SearchEntry.objects.none()
+    queryset = SearchEntry.objects.all()
+    if kinds is not None:
+        queryset = queryset.filter(kind__in=kinds)
+    return get_search_backend().search(queryset, terms)
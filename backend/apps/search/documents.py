@@ -0,0 +1,39 @@
+"""
+Builders for the text stored in SearchEntry. They only read attributes, so
+the initial migration can run them against historical models too.
+"""
+
+
+def _join(*values):
+    return " ".join(str(value) for value in values if value)
+
+
+def user_document(user):
+    """Fields of a SearchEntry for ``user`` and its role profile"""
+    full_name = _join(user.first_name, user.last_name)
+    extra = []
+    # Only the profile for the current role is indexed
+    if user.role == "student":
+        student = getattr(user, "student_profile", None)
+        if student is not None:
+            extra.append(student.student_id)
+    elif user.role == "professor":
+        professor = getattr(user, "professor_profile", None)
+        if professor is not None:
+            extra.extend([professor.department, professor.specialization])
+    return {
+        "kind": "user",
+        "title": (full_name or user.email)[:255],
+        "subtitle": _join(user.email, user.role)[:255],
+        "document": _join(user.email, user.username, full_name, *extra),
+    }
+
+
+def course_document(course):
+    """Fields of a SearchEntry for ``course``"""
+    return {
+        "kind": "course",
+        "title": f"{course.code} - {course.name}"[:255],
+        "subtitle": "",
+        "document": _join(course.code, course.name, course.description),
+    }
@@ -0,0 +1,84 @@
+"""
+Keeps SearchEntry rows in step with the models they describe. Single rows
+are upserted from the signals in signals.py; bulk writers that skip
+signals (the roster importer) call ``index_users`` themselves.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from apps.common.models import Course
+from .backends import get_search_backend
+from .documents import course_document, user_document
+from .models import SearchEntry
+
+User = get_user_model()
+
+ENTRY_FIELDS = ["kind", "title", "subtitle", "document"]
+
+
+def index_user(user):
+    """Create or refresh the entry for one User instance"""
+    SearchEntry.objects.update_or_create(user=user, defaults=user_document(user))
+
+
+def index_course(course):
+    """Create or refresh the entry for one Course instance"""
+    SearchEntry.objects.update_or_create(
+        course=course, defaults=course_document(course)
+    )
+
+
+def index_users(users, batch_size=500):
+    """
+    Upsert entries for many users in one statement per batch. Profiles are
+    read from the instances' relation caches when present, so callers that
+    just built them (see build_profile) cost no extra queries.
+    """
+    entries = [SearchEntry(user=user, **user_document(user)) for user in users]
+    SearchEntry.objects.bulk_create(
+        entries,
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=["user"],
+        update_fields=ENTRY_FIELDS,
+    )
+    return len(entries)
+
+
+def rebuild_index(batch_size=1000):
+    """Drop every entry and re-index all users and courses"""
+    users = User.objects.select_related("student_profile", "professor_profile")
+    with transaction.atomic():
+        SearchEntry.objects.all().delete()
+        user_count = _bulk_insert(
+            (
+                SearchEntry(user=user, **user_document(user))
+                for user in users.iterator(chunk_size=batch_size)
+            ),
+            batch_size,
+        )
+        course_count = _bulk_insert(
+            (
+                SearchEntry(course=course, **course_document(course))
+                for course in Course.objects.iterator(chunk_size=batch_size)
+            ),
+            batch_size,
+        )
+    get_search_backend().optimize()
+    return user_count, course_count
+
+
+def _bulk_insert(entries, batch_size):
+    count = 0
+    batch = []
+    for entry in entries:
+        batch.append(entry)
+        if len(batch) >= batch_size:
+            SearchEntry.objects.bulk_create(batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        SearchEntry.objects.bulk_create(batch)
+        count += len(batch)
+    return count
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from apps.search.indexing import rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Re-index every user and course for /api/search/"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        users, courses = rebuild_index(options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Indexed {users} users and {courses} courses")
+        )
@@ -0,0 +1,187 @@
+# Generated by Django 5.0 on 2026-10-18 09:05
+
+import apps.search.models
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+from apps.search.documents import course_document, user_document
+
+FTS_TABLE = "search_searchentry_fts"
+
+SQLITE_INDEX = [
+    f"""
+    CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        title, document,
+        content='search_searchentry', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    f"""
+    CREATE TRIGGER search_searchentry_ai AFTER INSERT ON search_searchentry BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, document)
+        VALUES (new.id, new.title, new.document);
+    END
+    """,
+    f"""
+    CREATE TRIGGER search_searchentry_ad AFTER DELETE ON search_searchentry BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, document)
+        VALUES ('delete', old.id, old.title, old.document);
+    END
+    """,
+    f"""
+    CREATE TRIGGER search_searchentry_au AFTER UPDATE ON search_searchentry BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, document)
+        VALUES ('delete', old.id, old.title, old.document);
+        INSERT INTO {FTS_TABLE}(rowid, title, document)
+        VALUES (new.id, new.title, new.document);
+    END
+    """,
+]
+
+
+def _postgres_indexes():
+    from django.contrib.postgres.indexes import GinIndex
+    from django.contrib.postgres.search import SearchVector
+
+    return [
+        # Must match the expression PostgresSearchBackend queries with
+        GinIndex(SearchVector("document", config="simple"), name="search_doc_tsv"),
+        GinIndex(
+            fields=["document"], opclasses=["gin_trgm_ops"], name="search_doc_trgm"
+        ),
+    ]
+
+
+def create_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        for statement in SQLITE_INDEX:
+            schema_editor.execute(statement)
+    elif vendor == "postgresql":
+        SearchEntry = apps.get_model("search", "SearchEntry")
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for index in _postgres_indexes():
+            schema_editor.add_index(SearchEntry, index)
+
+
+def drop_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        for name in ("ai", "ad", "au"):
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS search_searchentry_{name}")
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    elif vendor == "postgresql":
+        SearchEntry = apps.get_model("search", "SearchEntry")
+        for index in _postgres_indexes():
+            schema_editor.remove_index(SearchEntry, index)
+
+
+def populate_entries(apps, schema_editor):
+    User = apps.get_model("authentication", "User")
+    Course = apps.get_model("common", "Course")
+    SearchEntry = apps.get_model("search", "SearchEntry")
+    users = User.objects.select_related("student_profile", "professor_profile")
+    SearchEntry.objects.bulk_create(
+        (SearchEntry(user=user, **user_document(user)) for user in users.iterator()),
+        batch_size=1000,
+    )
+    SearchEntry.objects.bulk_create(
+        (
+            SearchEntry(course=course, **course_document(course))
+            for course in Course.objects.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("common", "0001_initial"),
+        ("students", "0002_cohortstats"),
+        ("professors", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("user", "User"), ("course", "Course")], max_length=10
+                    ),
+                ),
+                ("title", models.CharField(max_length=255)),
+                ("subtitle", models.CharField(blank=True, max_length=255)),
+                ("document", models.TextField()),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "course",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_entry",
+                        to="common.course",
+                    ),
+                ),
+                (
+                    "user",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_entry",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Search Entry",
+                "verbose_name_plural": "Search Entries",
+            },
+        ),
+        migrations.CreateModel(
+            name="SearchIndex",
+            fields=[
+                (
+                    "entry",
+                    models.OneToOneField(
+                        db_column="rowid",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        primary_key=True,
+                        related_name="fts",
+                        serialize=False,
+                        to="search.searchentry",
+                    ),
+                ),
+                (
+                    "text",
+                    apps.search.models.FullTextField(
+                        db_column="search_searchentry_fts"
+                    ),
+                ),
+                ("rank", models.FloatField()),
+            ],
+            options={
+                "db_table": "search_searchentry_fts",
+                "managed": False,
+            },
+        ),
+        migrations.RunPython(create_index, drop_index),
+        migrations.RunPython(populate_entries, migrations.RunPython.noop),
+    ]
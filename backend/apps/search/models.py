@@ -0,0 +1,87 @@
+from django.contrib.auth import get_user_model
+from django.db import models
+from django.db.models import Lookup
+
+from apps.common.models import Course
+
+User = get_user_model()
+
+
+class SearchEntry(models.Model):
+    """
+    One searchable document per User or Course. ``document`` holds every
+    indexed column of the source rows (user, profile or course fields)
+    and is what the database full-text index is built over.
+    """
+
+    KIND_CHOICES = [
+        ("user", "User"),
+        ("course", "Course"),
+    ]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="search_entry",
+    )
+    course = models.OneToOneField(
+        Course,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="search_entry",
+    )
+    title = models.CharField(max_length=255)
+    subtitle = models.CharField(max_length=255, blank=True)
+    document = models.TextField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Search Entry"
+        verbose_name_plural = "Search Entries"
+
+    def __str__(self):
+        return f"{self.kind}: {self.title}"
+
+    @property
+    def object_id(self):
+        return self.user_id if self.kind == "user" else self.course_id
+
+
+class FullTextField(models.TextField):
+    """The FTS5 hidden column named after its table; supports ``__match``"""
+
+
+@FullTextField.register_lookup
+class FullTextMatch(Lookup):
+    lookup_name = "match"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} MATCH {rhs}", lhs_params + rhs_params
+
+
+class SearchIndex(models.Model):
+    """
+    Read-only view of the SQLite FTS5 table over SearchEntry. The table and
+    the triggers that keep it in sync are created by migration 0001 on
+    SQLite only; on Postgres the index lives on SearchEntry.document.
+    """
+
+    entry = models.OneToOneField(
+        SearchEntry,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        db_column="rowid",
+        related_name="fts",
+    )
+    text = FullTextField(db_column="search_searchentry_fts")
+    rank = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = "search_searchentry_fts"
@@ -0,0 +1,17 @@
+from rest_framework import serializers
+from .models import SearchEntry
+
+
+class SearchResultSerializer(serializers.ModelSerializer):
+    """One ranked hit; ``id`` is the User UUID or Course id per ``kind``"""
+
+    id = serializers.SerializerMethodField()
+    score = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = SearchEntry
+        fields = ["kind", "id", "title", "subtitle", "score"]
+        read_only_fields = fields
+
+    def get_id(self, obj):
+        return str(obj.object_id)
@@ -0,0 +1,49 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from apps.common.models import Course
+from apps.professors.models import ProfessorProfile
+from apps.students.models import StudentProfile
+from .indexing import index_course, index_user
+
+User = get_user_model()
+
+# User columns that appear in the search document; deletes cascade to
+# SearchEntry, so only saves need handling
+INDEXED_USER_FIELDS = {"email", "username", "first_name", "last_name", "role"}
+INDEXED_PROFILE_FIELDS = {"student_id", "department", "specialization"}
+
+
+@receiver(pre_save, sender=User)
+def mark_user_for_index(sender, instance, update_fields=None, **kwargs):
+    # Logins and token bumps save the user too; only saves that can change
+    # the document are indexed. Decided before the save so profiles created
+    # by the user's own post_save (apps/users/signals.py) can leave it to
+    # index_saved_user.
+    instance._search_index_pending = instance._state.adding or bool(
+        instance.saved_changes(update_fields) & INDEXED_USER_FIELDS
+    )
+
+
+@receiver(post_save, sender=User)
+def index_saved_user(sender, instance, **kwargs):
+    if instance.__dict__.pop("_search_index_pending", False):
+        index_user(instance)
+
+
+@receiver(post_save, sender=StudentProfile)
+@receiver(post_save, sender=ProfessorProfile)
+def index_profile_owner(sender, instance, created, update_fields=None, **kwargs):
+    # Team, cohort and other profile changes don't touch the document
+    changed = instance.saved_changes(update_fields)
+    if not created and not changed & INDEXED_PROFILE_FIELDS:
+        return
+    if getattr(instance.user, "_search_index_pending", False):
+        return
+    index_user(instance.user)
+
+
+@receiver(post_save, sender=Course)
+def index_saved_course(sender, instance, **kwargs):
+    index_course(instance)
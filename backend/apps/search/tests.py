@@ -0,0 +1,205 @@
+import datetime
+from types import SimpleNamespace
+from unittest import mock
+
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase
+
+from apps.authentication.admin import UserAdmin
+from apps.common.models import Course
+from apps.professors.models import ProfessorProfile
+from apps.students.models import Cohort, StudentProfile
+from . import backends
+from .backends import (
+    ContainsSearchBackend,
+    PostgresSearchBackend,
+    SQLiteSearchBackend,
+    get_search_backend,
+    search_entries,
+)
+from .indexing import rebuild_index
+from .models import SearchEntry
+
+User = get_user_model()
+
+
+def document(user):
+    return SearchEntry.objects.get(user=user).document
+
+
+class SearchIndexingTests(TestCase):
+    def setUp(self):
+        self.student = User.objects.create_user(
+            username="ada", email="ada@example.com", password="x", role="student"
+        )
+        self.professor = User.objects.create_user(
+            username="alan", email="alan@example.com", password="x", role="professor"
+        )
+
+    def test_created_user_includes_profile(self):
+        profile = StudentProfile.objects.get(user=self.student)
+        self.assertIn(profile.student_id, document(self.student))
+        self.assertEqual(SearchEntry.objects.filter(kind="user").count(), 2)
+
+    def test_user_changes(self):
+        user = User.objects.get(pk=self.student.pk)
+        user.first_name = "Ada"
+        user.last_name = "Lovelace"
+        user.save()
+        entry = SearchEntry.objects.get(user=user)
+        self.assertEqual(entry.title, "Ada Lovelace")
+        self.assertIn("Lovelace", entry.document)
+
+    def test_saves_outside_the_document_skip_indexing(self):
+        user = User.objects.get(pk=self.student.pk)
+        user.first_name = "Ada"
+        user.save(update_fields=["last_login"])
+        self.assertNotIn("Ada", document(user))
+
+    def test_profile_changes(self):
+        profile = StudentProfile.objects.get(user=self.student)
+        profile.student_id = "S-1234"
+        profile.save(update_fields=["student_id"])
+        self.assertIn("S-1234", document(self.student))
+
+        professor = ProfessorProfile.objects.get(user=self.professor)
+        professor.department = "Mathematics"
+        professor.specialization = "Logic"
+        professor.save()
+        self.assertIn("Mathematics Logic", document(self.professor))
+
+    def test_team_only_profile_save_keeps_entry(self):
+        today = datetime.date.today()
+        cohort = Cohort.objects.create(name="Cohort", start_date=today, end_date=today)
+        profile = StudentProfile.objects.get(user=self.student)
+        before = SearchEntry.objects.get(user=self.student).updated_at
+        profile.cohort = cohort
+        profile.save()
+        self.assertEqual(SearchEntry.objects.get(user=self.student).updated_at, before)
+
+    def test_role_change_indexes_new_profile(self):
+        user = User.objects.get(pk=self.student.pk)
+        user.role = "professor"
+        user.save()
+        self.assertEqual(
+            SearchEntry.objects.get(user=user).subtitle, "ada@example.com professor"
+        )
+
+    def test_courses(self):
+        today = datetime.date.today()
+        cohort = Cohort.objects.create(name="Cohort", start_date=today, end_date=today)
+        course = Course.objects.create(
+            code="CS101", name="Algorithms", cohort=cohort, description="Graphs"
+        )
+        entry = SearchEntry.objects.get(course=course)
+        self.assertEqual(entry.title, "CS101 - Algorithms")
+        self.assertIn("Graphs", entry.document)
+
+    def test_rebuild(self):
+        SearchEntry.objects.all().delete()
+        self.assertEqual(rebuild_index(), (2, 0))
+        self.assertEqual(
+            list(search_entries("alan")), [SearchEntry.objects.get(user=self.professor)]
+        )
+
+
+class SearchBackendTests(TestCase):
+    def setUp(self):
+        for username, first, last in (
+            ("ada", "Ada", "Lovelace"),
+            ("grace", "Grace", "Hopper"),
+            ("alan", "Alan", "Turing"),
+        ):
+            User.objects.create_user(
+                username=username,
+                email=f"{username}@example.com",
+                password="x",
+                role="professor",
+                first_name=first,
+                last_name=last,
+            )
+        today = datetime.date.today()
+        cohort = Cohort.objects.create(name="Cohort", start_date=today, end_date=today)
+        Course.objects.create(code="CS101", name="Turing machines", cohort=cohort)
+
+    def titles(self, queryset):
+        return sorted(entry.title for entry in queryset)
+
+    def test_fts5_prefix_terms(self):
+        self.assertIsInstance(get_search_backend(), SQLiteSearchBackend)
+        self.assertEqual(self.titles(search_entries("lov")), ["Ada Lovelace"])
+        self.assertEqual(
+            self.titles(search_entries("tur")),
+            ["Alan Turing", "CS101 - Turing machines"],
+        )
+        self.assertEqual(
+            self.titles(search_entries("tur", kinds=["course"])),
+            ["CS101 - Turing machines"],
+        )
+        self.assertEqual(self.titles(search_entries("grace hop")), ["Grace Hopper"])
+
+    def test_query_syntax_is_dropped(self):
+        self.assertEqual(self.titles(search_entries('"ada*" (lov')), ["Ada Lovelace"])
+        self.assertEqual(list(search_entries("  ")), [])
+        self.assertEqual(list(search_entries("*")), [])
+
+    def test_contains_fallback(self):
+        queryset = ContainsSearchBackend().search(SearchEntry.objects.all(), ["hop"])
+        self.assertEqual(self.titles(queryset), ["Grace Hopper"])
+        queryset = ContainsSearchBackend().search(
+            SearchEntry.objects.all(), ["ring", "alan"]
+        )
+        self.assertEqual(self.titles(queryset), ["Alan Turing"])
+
+    def test_backend_per_vendor(self):
+        for vendor, backend in (
+            ("sqlite", SQLiteSearchBackend),
+            ("postgresql", PostgresSearchBackend),
+            ("mysql", ContainsSearchBackend),
+        ):
+            with self.subTest(vendor=vendor), mock.patch.object(
+                backends, "connection", SimpleNamespace(vendor=vendor)
+            ), mock.patch.object(backends, "_backends", {}):
+                self.assertIsInstance(get_search_backend(), backend)
+
+    def test_postgres_query(self):
+        # Built only: compiling needs a Postgres connection
+        queryset = PostgresSearchBackend().search(
+            SearchEntry.objects.all(), ["ada", "lov"]
+        )
+        self.assertIn("score", queryset.query.annotations)
+        self.assertEqual(queryset.query.order_by, ("-score", "id"))
+
+
+class UserAdminSearchTests(TestCase):
+    def setUp(self):
+        self.ada = User.objects.create_user(
+            username="ada", email="ada@example.com", password="x", role="student"
+        )
+        User.objects.create_user(
+            username="grace", email="grace@example.com", password="x", role="student"
+        )
+        self.model_admin = UserAdmin(User, admin.site)
+        self.request = RequestFactory().get("/admin/authentication/user/")
+
+    def search(self, term):
+        queryset, may_have_duplicates = self.model_admin.get_search_results(
+            self.request, User.objects.all(), term
+        )
+        self.assertFalse(may_have_duplicates)
+        return queryset
+
+    def test_matches_from_index(self):
+        self.assertEqual(list(self.search("ada")), [self.ada])
+        student_id = StudentProfile.objects.get(user=self.ada).student_id
+        self.assertEqual(list(self.search(student_id)), [self.ada])
+
+    def test_blank_term_keeps_queryset(self):
+        self.assertEqual(self.search("  ").count(), 2)
+
+    def test_courses_are_not_users(self):
+        today = datetime.date.today()
+        cohort = Cohort.objects.create(name="Cohort", start_date=today, end_date=today)
+        Course.objects.create(code="ADA1", name="Ada programming", cohort=cohort)
+        self.assertEqual(list(self.search("ada")), [self.ada])
@@ -0,0 +1,34 @@
+from rest_framework import generics, serializers
+from rest_framework.permissions import IsAuthenticated
+
+from .backends import search_entries
+from .serializers import SearchResultSerializer
+
+# Students may look up courses but not other people
+VISIBLE_KINDS = {
+    "admin": ["user", "course"],
+    "professor": ["user", "course"],
+    "student": ["course"],
+}
+
+
+class SearchView(generics.ListAPIView):
+    """
+    Ranked full-text search over users and courses
+    GET /api/search/?q=<text>&type=user|course
+    """
+
+    serializer_class = SearchResultSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        params = self.request.query_params
+        text = params.get("q", "").strip()
+        if not text:
+            raise serializers.ValidationError({"q": ["This parameter is required."]})
+        kinds = VISIBLE_KINDS.get(self.request.user.role, [])
+        if params.get("type"):
+            kinds = [kind for kind in kinds if kind == params["type"]]
+        return search_entries(text, kinds).only(
+            "id", "kind", "user_id", "course_id", "title", "subtitle"
+        )
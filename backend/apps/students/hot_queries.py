@@ -0,0 +1,75 @@
+"""Student, team and cohort queries audited by ``manage.py queryplans``"""
+
+from apps.common.queryplans import register
+from .models import Cohort, CohortStats, StudentProfile, Team
+from .views import StudentProfileQuerysetMixin
+
+PAGE = 21
+
+
+def _students():
+    return StudentProfileQuerysetMixin().get_queryset()
+
+
+@register("students.list", scans=["students_studentprofile"])
+def students_list():
+    """GET /api/students/ - first page, primary key order"""
+    return _students().order_by("id")[:PAGE]
+
+
+@register("students.by_cohort")
+def students_by_cohort():
+    """GET /api/students/?cohort="""
+    return _students().filter(cohort_id=1).order_by("id")[:PAGE]
+
+
+@register("students.by_cohort_team")
+def students_by_cohort_team():
+    """GET /api/students/?cohort=&team="""
+    return _students().filter(cohort_id=1, team_id=1).order_by("id")[:PAGE]
+
+
+@register("students.unassigned")
+def students_unassigned():
+    """GET /api/students/?unassigned=true"""
+    return _students().filter(team__isnull=True).order_by("id")[:PAGE]
+
+
+@register("students.team_formation")
+def students_team_formation():
+    """form_teams: a cohort's unassigned students"""
+    return (
+        StudentProfile.objects.filter(cohort_id=1, team__isnull=True)
+        .order_by("id")
+        .values_list("id", "graduation_year")
+    )
+
+
+@register("teams.by_cohort")
+def teams_by_cohort():
+    """GET /api/students/teams/?cohort="""
+    return (
+        Team.objects.select_related("cohort").filter(cohort_id=1).order_by("id")[:PAGE]
+    )
+
+
+@register("teams.of_cohort")
+def teams_of_cohort():
+    """cohort.teams.all(), in default (name) order"""
+    return Team.objects.filter(cohort_id=1)
+
+
+@register("cohorts.active")
+def cohorts_active():
+    """Active cohorts, newest first"""
+    return Cohort.objects.filter(is_active=True)[:PAGE]
+
+
+@register("cohort_stats.active", scans=["students_cohortstats"])
+def cohort_stats_active():
+    """GET /api/students/cohorts/stats/?active=true (one row per cohort)"""
+    return (
+        CohortStats.objects.select_related("cohort")
+        .filter(cohort__is_active=True)
+        .order_by("id")[:PAGE]
+    )
@@ -0,0 +1,9 @@
+"""Background tasks for the students app (discovered by apps.jobs)"""
+
+from apps.jobs.tasks import task
+from .stats import recompute_cohort_stats
+
+
+@task("students.recompute_cohort_stats", max_attempts=3)
+def recompute_stats(cohort_ids=None):
+    return {"cohorts": recompute_cohort_stats(cohort_ids)}
@@ -0,0 +1,77 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.students.models import Cohort
+from apps.students.team_formation import (
+    FormationConstraints,
+    TeamFormationError,
+    form_teams,
+)
+
+
+def _pair(value):
+    first, _, second = value.partition(",")
+    try:
+        return int(first), int(second)
+    except ValueError:
+        raise CommandError(f"Expected a pair of profile ids like 12,34, got {value!r}")
+
+
+class Command(BaseCommand):
+    help = "Split a cohort's unassigned students into balanced teams"
+
+    def add_arguments(self, parser):
+        parser.add_argument("cohort", type=int, help="Cohort id")
+        parser.add_argument("--min-size", type=int, default=3)
+        parser.add_argument("--max-size", type=int, default=5)
+        parser.add_argument(
+            "--keep-together",
+            type=_pair,
+            action="append",
+            default=[],
+            metavar="ID,ID",
+            help="StudentProfile ids that must share a team (repeatable)",
+        )
+        parser.add_argument(
+            "--keep-apart",
+            type=_pair,
+            action="append",
+            default=[],
+            metavar="ID,ID",
+            help="StudentProfile ids that must not share a team (repeatable)",
+        )
+        parser.add_argument("--name-prefix", default="Team")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Solve and report without creating teams",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            cohort = Cohort.objects.get(pk=options["cohort"])
+        except Cohort.DoesNotExist:
+            raise CommandError(f"Cohort {options['cohort']} does not exist")
+
+        constraints = FormationConstraints(
+            min_size=options["min_size"],
+            max_size=options["max_size"],
+            keep_together=options["keep_together"],
+            keep_apart=options["keep_apart"],
+        )
+        try:
+            result = form_teams(
+                cohort,
+                constraints,
+                dry_run=options["dry_run"],
+                name_prefix=options["name_prefix"],
+            )
+        except TeamFormationError as exc:
+            raise CommandError(str(exc))
+
+        self.stdout.write(json.dumps(result.as_dict(), indent=2))
+        verb = "Would create" if options["dry_run"] else "Created"
+        self.stdout.write(
+            self.style.SUCCESS(f"{verb} {len(result.team_sizes)} teams for {cohort}")
+        )
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from apps.jobs.tasks import enqueue
+from apps.students.stats import recompute_cohort_stats
+
+
+class Command(BaseCommand):
+    help = "Rebuild CohortStats counters from the source tables (drift repair)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--cohort",
+            type=int,
+            action="append",
+            dest="cohorts",
+            help="Cohort id to recompute (repeatable; default: all cohorts)",
+        )
+        parser.add_argument(
+            "--background",
+            action="store_true",
+            help="Queue the rebuild for `runworker` instead of running it here",
+        )
+
+    def handle(self, *args, **options):
+        if options["background"]:
+            job = enqueue(
+                "students.recompute_cohort_stats", {"cohort_ids": options["cohorts"]}
+            )
+            self.stdout.write(self.style.SUCCESS(f"Queued job {job.pk}"))
+            return
+        count = recompute_cohort_stats(options["cohorts"])
+        self.stdout.write(self.style.SUCCESS(f"Recomputed stats for {count} cohorts"))
@@ -0,0 +1,54 @@
+# Generated by Django 5.0 on 2026-10-18 08:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def populate_stats(apps, schema_editor):
+    Cohort = apps.get_model("students", "Cohort")
+    CohortStats = apps.get_model("students", "CohortStats")
+    stats = Cohort.objects.annotate(
+        students_total=Count("students", distinct=True),
+        unassigned=Count("students", filter=Q(students__team__isnull=True), distinct=True),
+        teams_total=Count("teams", distinct=True),
+        courses_total=Count("courses", distinct=True),
+    )
+    CohortStats.objects.bulk_create(
+        CohortStats(
+            cohort_id=cohort.pk,
+            student_count=cohort.students_total,
+            unassigned_count=cohort.unassigned,
+            team_count=cohort.teams_total,
+            course_count=cohort.courses_total,
+        )
+        for cohort in stats
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0001_initial'),
+        ('common', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CohortStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('student_count', models.IntegerField(default=0)),
+                ('team_count', models.IntegerField(default=0)),
+                ('unassigned_count', models.IntegerField(default=0)),
+                ('course_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('cohort', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='students.cohort')),
+            ],
+            options={
+                'verbose_name': 'Cohort Stats',
+                'verbose_name_plural': 'Cohort Stats',
+            },
+        ),
+        migrations.RunPython(populate_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0 on 2026-10-18 09:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("students", "0002_cohortstats"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="cohort",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["-start_date"],
+                name="cohort_active_start_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="studentprofile",
+            index=models.Index(
+                fields=["cohort", "team"], name="student_cohort_team_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="team",
+            index=models.Index(fields=["cohort", "name"], name="team_cohort_name_idx"),
+        ),
+    ]
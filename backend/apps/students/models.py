@@ -1,6 +1,8 @@
 from django.db import models
 from django.contrib.auth import get_user_model
 
+from apps.common.utils import TrackedFieldsMixin
+
 User = get_user_model()
 
 
@@ -15,28 +17,46 @@ class Cohort(models.Model):
 
     class Meta:
         ordering = ["-start_date"]
+        indexes = [
+            # Active cohorts, newest first. Partial rather than composite: a
+            # boolean leading column is too coarse for the planner to use
+            models.Index(
+                fields=["-start_date"],
+                condition=models.Q(is_active=True),
+                name="cohort_active_start_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
 
-class Team(models.Model):
+class Team(TrackedFieldsMixin, models.Model):
     """Team model for capstone projects"""
 
+    TRACKED_FIELDS = ("cohort_id",)
+
     name = models.CharField(max_length=100)
     cohort = models.ForeignKey(Cohort, on_delete=models.CASCADE, related_name="teams")
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ["name"]
+        indexes = [
+            # A cohort's teams in default order; the FK index keeps serving
+            # the keyset (cohort, id) pages
+            models.Index(fields=["cohort", "name"], name="team_cohort_name_idx"),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.cohort.name})"
 
 
-class StudentProfile(models.Model):
+class StudentProfile(TrackedFieldsMixin, models.Model):
     """Extended profile for student users"""
 
+    TRACKED_FIELDS = ("cohort_id", "team_id", "student_id")
+
     user = models.OneToOneField(
         User, on_delete=models.CASCADE, related_name="student_profile"
     )
@@ -54,5 +74,41 @@ class StudentProfile(models.Model):
     enrollment_date = models.DateField()
     graduation_year = models.IntegerField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # ?cohort=&team=, and a cohort's unassigned students (team IS NULL)
+            models.Index(fields=["cohort", "team"], name="student_cohort_team_idx"),
+        ]
+
     def __str__(self):
         return f"{self.user.email} - {self.student_id}"
+
+
+class CohortStats(models.Model):
+    """
+    Denormalized per-cohort counters for admin dashboards.
+    Kept current by the signals in apps/students/signals.py; repaired with
+    ``manage.py recompute_cohort_stats``.
+    """
+
+    cohort = models.OneToOneField(
+        Cohort, on_delete=models.CASCADE, related_name="stats"
+    )
+    student_count = models.IntegerField(default=0)
+    team_count = models.IntegerField(default=0)
+    unassigned_count = models.IntegerField(default=0)
+    course_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Cohort Stats"
+        verbose_name_plural = "Cohort Stats"
+
+    def __str__(self):
+        return f"Stats for cohort {self.cohort_id}"
+
+    @property
+    def average_team_size(self):
+        if not self.team_count:
+            return 0.0
+        return (self.student_count - self.unassigned_count) / self.team_count
@@ -0,0 +1,118 @@
+from rest_framework import serializers
+from apps.common.models import Course
+from apps.common.serializers import SparseFieldsSerializerMixin
+from .models import Cohort, CohortStats, Team, StudentProfile
+
+
+class CohortSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    """Serializer for Cohort model"""
+
+    class Meta:
+        model = Cohort
+        fields = ["id", "name", "start_date", "end_date", "is_active"]
+
+
+class TeamSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    """Serializer for Team model; cohort name comes from select_related"""
+
+    cohort_name = serializers.CharField(source="cohort.name", read_only=True)
+
+    class Meta:
+        model = Team
+        fields = ["id", "name", "cohort", "cohort_name"]
+
+
+class CourseSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    """Serializer for Course model; cohort name comes from select_related"""
+
+    cohort_name = serializers.CharField(source="cohort.name", read_only=True)
+
+    class Meta:
+        model = Course
+        fields = ["id", "code", "name", "description", "cohort", "cohort_name"]
+
+
+class StudentProfileSerializer(
+    SparseFieldsSerializerMixin, serializers.ModelSerializer
+):
+    """Read-only student listing row with user, cohort and team flattened in"""
+
+    user_id = serializers.UUIDField(source="user.id", read_only=True)
+    email = serializers.EmailField(source="user.email", read_only=True)
+    first_name = serializers.CharField(source="user.first_name", read_only=True)
+    last_name = serializers.CharField(source="user.last_name", read_only=True)
+    cohort_name = serializers.CharField(
+        source="cohort.name", read_only=True, default=None
+    )
+    team_name = serializers.CharField(source="team.name", read_only=True, default=None)
+
+    class Meta:
+        model = StudentProfile
+        fields = [
+            "id",
+            "student_id",
+            "user_id",
+            "email",
+            "first_name",
+            "last_name",
+            "cohort",
+            "cohort_name",
+            "team",
+            "team_name",
+            "enrollment_date",
+            "graduation_year",
+        ]
+        read_only_fields = fields
+
+
+class CohortStatsSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    """Dashboard row: cohort identity plus its denormalized counters"""
+
+    cohort_name = serializers.CharField(source="cohort.name", read_only=True)
+    is_active = serializers.BooleanField(source="cohort.is_active", read_only=True)
+    average_team_size = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = CohortStats
+        fields = [
+            "cohort",
+            "cohort_name",
+            "is_active",
+            "student_count",
+            "team_count",
+            "unassigned_count",
+            "course_count",
+            "average_team_size",
+            "updated_at",
+        ]
+        read_only_fields = fields
+
+
+class TeamFormationSerializer(serializers.Serializer):
+    """Constraints accepted by the team formation endpoint"""
+
+    min_size = serializers.IntegerField(min_value=1, default=3)
+    max_size = serializers.IntegerField(min_value=1, default=5)
+    keep_together = serializers.ListField(
+        child=serializers.ListField(
+            child=serializers.IntegerField(), min_length=2, max_length=2
+        ),
+        required=False,
+        default=list,
+    )
+    keep_apart = serializers.ListField(
+        child=serializers.ListField(
+            child=serializers.IntegerField(), min_length=2, max_length=2
+        ),
+        required=False,
+        default=list,
+    )
+    dry_run = serializers.BooleanField(default=False)
+    name_prefix = serializers.CharField(max_length=80, default="Team")
+
+    def validate(self, attrs):
+        if attrs["max_size"] < attrs["min_size"]:
+            raise serializers.ValidationError(
+                {"max_size": "Must be greater than or equal to min_size."}
+            )
+        return attrs
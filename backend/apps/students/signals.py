@@ -0,0 +1,107 @@
+from django.db.models import Count
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from apps.common.cache import catalog
+from apps.common.models import Course
+from .models import Cohort, CohortStats, StudentProfile, Team
+from .stats import apply_deltas
+
+
+def deleting_cohort(origin):
+    """Whether a delete signal comes from a Cohort delete cascading down"""
+    return isinstance(origin, Cohort) or getattr(origin, "model", None) is Cohort
+
+
+@receiver(post_save, sender=Cohort)
+def create_cohort_stats(sender, instance, created, **kwargs):
+    if created:
+        CohortStats.objects.get_or_create(cohort=instance)
+
+
+@receiver(post_save, sender=StudentProfile)
+def track_student_counts(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        cohort, team = instance.cohort_id, instance.team_id
+    else:
+        changed = instance.saved_changes(update_fields) & {"cohort_id", "team_id"}
+        if not changed:
+            return
+        old_cohort = instance.loaded_value("cohort_id")
+        old_team = instance.loaded_value("team_id")
+        apply_deltas(
+            old_cohort, student_count=-1, unassigned_count=-int(old_team is None)
+        )
+        # Fields left out of update_fields keep their database value
+        cohort = instance.cohort_id if "cohort_id" in changed else old_cohort
+        team = instance.team_id if "team_id" in changed else old_team
+    apply_deltas(cohort, student_count=1, unassigned_count=int(team is None))
+
+
+@receiver(post_delete, sender=StudentProfile)
+def untrack_student_counts(sender, instance, **kwargs):
+    apply_deltas(
+        instance.cohort_id,
+        recompute=False,
+        student_count=-1,
+        unassigned_count=-int(instance.team_id is None),
+    )
+
+
+@receiver(post_save, sender=Team)
+@receiver(post_save, sender=Course)
+def track_cohort_children(sender, instance, created, update_fields=None, **kwargs):
+    counter = "team_count" if sender is Team else "course_count"
+    if not created and "cohort_id" not in instance.saved_changes(update_fields):
+        return
+    if not created:
+        apply_deltas(instance.loaded_value("cohort_id"), **{counter: -1})
+    apply_deltas(instance.cohort_id, **{counter: 1})
+
+
+@receiver(pre_delete, sender=Team)
+def release_team_members(sender, instance, origin=None, **kwargs):
+    # Members are set to team=NULL with a queryset update (no signals),
+    # so count them as unassigned before the team goes away
+    if deleting_cohort(origin):
+        return
+    rows = instance.members.values("cohort_id").annotate(total=Count("id"))
+    for row in rows:
+        apply_deltas(row["cohort_id"], recompute=False, unassigned_count=row["total"])
+
+
+@receiver(post_delete, sender=Team)
+@receiver(post_delete, sender=Course)
+def untrack_cohort_children(sender, instance, origin=None, **kwargs):
+    # The cohort's stats row goes with the cohort; nothing to count
+    if deleting_cohort(origin):
+        return
+    counter = "team_count" if sender is Team else "course_count"
+    apply_deltas(instance.cohort_id, recompute=False, **{counter: -1})
+
+
+def cohort_scopes(*cohort_ids):
+    """Catalog cache list scopes of the given cohorts (see apps/common/cache.py)"""
+    return {f"cohort:{pk}" for pk in cohort_ids if pk is not None}
+
+
+@receiver(post_save, sender=Cohort)
+@receiver(post_delete, sender=Cohort)
+def invalidate_cohort_catalog(sender, instance, **kwargs):
+    catalog.invalidate_on_commit("cohort", [instance.pk])
+    # Team and course rows show the cohort name
+    for model, child in (("team", Team), ("course", Course)):
+        pks = child.objects.filter(cohort_id=instance.pk).values_list("pk", flat=True)
+        catalog.invalidate_on_commit(model, pks, cohort_scopes(instance.pk))
+
+
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def invalidate_child_catalog(sender, instance, **kwargs):
+    catalog.invalidate_on_commit(
+        "team" if sender is Team else "course",
+        [instance.pk],
+        cohort_scopes(instance.cohort_id, instance.loaded_value("cohort_id")),
+    )
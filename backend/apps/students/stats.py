@@ -0,0 +1,72 @@
+"""
+Maintenance of the denormalized CohortStats counters.
+
+Signal handlers apply +/- deltas with F() expressions, so concurrent writers
+never overwrite each other's counts. ``recompute_cohort_stats`` rebuilds
+rows from scratch with three grouped queries and one upsert; it is used for
+drift repair, after bulk writes that bypass signals, and whenever a delta
+targets a cohort that has no stats row yet.
+"""
+
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from .models import Cohort, CohortStats, StudentProfile, Team
+
+COUNTERS = ["student_count", "team_count", "unassigned_count", "course_count"]
+
+
+def apply_deltas(cohort_id, recompute=True, **deltas):
+    """
+    Add ``deltas`` (counter name -> int) to one cohort's stats row. A
+    missing row is rebuilt with ``recompute_cohort_stats`` unless
+    ``recompute`` is False, as on delete paths, where the row may be gone
+    because the cohort itself is being deleted.
+    """
+    deltas = {name: delta for name, delta in deltas.items() if delta}
+    if cohort_id is None or not deltas:
+        return
+    updated = CohortStats.objects.filter(cohort_id=cohort_id).update(
+        updated_at=timezone.now(),
+        **{name: F(name) + delta for name, delta in deltas.items()},
+    )
+    if not updated and recompute:
+        recompute_cohort_stats([cohort_id])
+
+
+def recompute_cohort_stats(cohort_ids=None):
+    """Rebuild stats for ``cohort_ids`` (all cohorts when None)"""
+    from apps.common.models import Course
+
+    cohorts = Cohort.objects.all()
+    if cohort_ids is not None:
+        cohorts = cohorts.filter(pk__in=cohort_ids)
+    ids = list(cohorts.values_list("pk", flat=True))
+    if not ids:
+        return 0
+
+    stats = {pk: CohortStats(cohort_id=pk) for pk in ids}
+    students = (
+        StudentProfile.objects.filter(cohort_id__in=ids)
+        .values("cohort_id")
+        .annotate(total=Count("id"), unassigned=Count("id", filter=Q(team__isnull=True)))
+    )
+    for row in students:
+        stats[row["cohort_id"]].student_count = row["total"]
+        stats[row["cohort_id"]].unassigned_count = row["unassigned"]
+    for model, counter in ((Team, "team_count"), (Course, "course_count")):
+        rows = (
+            model.objects.filter(cohort_id__in=ids)
+            .values("cohort_id")
+            .annotate(total=Count("id"))
+        )
+        for row in rows:
+            setattr(stats[row["cohort_id"]], counter, row["total"])
+
+    CohortStats.objects.bulk_create(
+        stats.values(),
+        update_conflicts=True,
+        unique_fields=["cohort"],
+        update_fields=[*COUNTERS, "updated_at"],
+    )
+    return len(ids)
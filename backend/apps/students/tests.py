@@ -0,0 +1,126 @@
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.common.models import Course
+from .models import Cohort, CohortStats, StudentProfile, Team
+
+User = get_user_model()
+
+
+class CohortStatsTests(TestCase):
+    def setUp(self):
+        today = datetime.date.today()
+        self.cohort = Cohort.objects.create(
+            name="Cohort", start_date=today, end_date=today
+        )
+        self.teams = [
+            Team.objects.create(name=f"Team {i}", cohort=self.cohort) for i in range(2)
+        ]
+        Course.objects.create(code="C1", name="Course", cohort=self.cohort)
+        for i in range(3):
+            user = User.objects.create_user(
+                username=f"student{i}",
+                email=f"student{i}@example.com",
+                password="x",
+                role="student",
+            )
+            profile = user.student_profile
+            profile.cohort = self.cohort
+            profile.team = self.teams[0] if i else None
+            profile.save()
+
+    def stats(self):
+        return CohortStats.objects.get(cohort=self.cohort)
+
+    def test_counts(self):
+        stats = self.stats()
+        self.assertEqual(stats.team_count, 2)
+        self.assertEqual(stats.course_count, 1)
+        self.assertEqual(stats.student_count, 3)
+        self.assertEqual(stats.unassigned_count, 1)
+
+    def test_partial_then_full_save(self):
+        profile = StudentProfile.objects.get(user__username="student0")
+        profile.team = self.teams[1]
+        profile.save(update_fields=["team"])
+        self.assertEqual(self.stats().unassigned_count, 0)
+        profile.save()
+        self.assertEqual(self.stats().unassigned_count, 0)
+
+    def test_partial_save_counts_written_fields_only(self):
+        other = Cohort.objects.create(
+            name="Other",
+            start_date=self.cohort.start_date,
+            end_date=self.cohort.end_date,
+        )
+        profile = StudentProfile.objects.get(user__username="student0")
+        profile.cohort = other
+        profile.team = self.teams[1]
+        profile.save(update_fields=["team_id"])
+        self.assertEqual(self.stats().student_count, 3)
+        self.assertEqual(self.stats().unassigned_count, 0)
+        self.assertEqual(CohortStats.objects.get(cohort=other).student_count, 0)
+        profile.save()
+        self.assertEqual(self.stats().student_count, 2)
+        self.assertEqual(self.stats().unassigned_count, 0)
+        other_stats = CohortStats.objects.get(cohort=other)
+        self.assertEqual(other_stats.student_count, 1)
+        self.assertEqual(other_stats.unassigned_count, 0)
+
+    def test_delete_team_releases_members(self):
+        self.teams[0].delete()
+        stats = self.stats()
+        self.assertEqual(stats.team_count, 1)
+        self.assertEqual(stats.unassigned_count, 3)
+
+    def test_delete_populated_cohort(self):
+        pk = self.cohort.pk
+        self.cohort.delete()
+        self.assertFalse(CohortStats.objects.filter(cohort_id=pk).exists())
+        self.assertFalse(Team.objects.filter(cohort_id=pk).exists())
+        self.assertEqual(StudentProfile.objects.filter(cohort__isnull=True).count(), 3)
+
+    def test_bulk_delete_populated_cohorts(self):
+        Cohort.objects.all().delete()
+        self.assertFalse(CohortStats.objects.exists())
+
+
+class ListFilterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        today = datetime.date.today()
+        self.cohort = Cohort.objects.create(
+            name="Cohort", start_date=today, end_date=today
+        )
+        Team.objects.create(name="Team", cohort=self.cohort)
+        Course.objects.create(code="C1", name="Course", cohort=self.cohort)
+        admin = User.objects.create_user(
+            username="admin", email="admin@example.com", password="x", role="admin"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(admin)
+
+    def test_malformed_ids_are_bad_requests(self):
+        for url in (
+            "/api/students/?cohort=abc",
+            "/api/students/?team=abc",
+            "/api/students/?cohort=1.5",
+            "/api/students/teams/?cohort=abc",
+            "/api/students/courses/?cohort=-1",
+        ):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 400)
+
+    def test_cohort_filter(self):
+        for url in ("/api/students/teams/", "/api/students/courses/"):
+            with self.subTest(url=url):
+                response = self.client.get(url, {"cohort": self.cohort.pk})
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(len(response.data["results"]), 1)
+                response = self.client.get(url, {"cohort": self.cohort.pk + 1})
+                self.assertEqual(response.data["results"], [])
@@ -1,5 +1,30 @@
 from django.urls import path
+from .views import (
+    StudentProfileListView,
+    StudentProfileDetailView,
+    TeamListView,
+    TeamDetailView,
+    CohortListView,
+    CohortDetailView,
+    CourseListView,
+    CourseDetailView,
+    CohortStatsView,
+    CohortFormTeamsView,
+)
 
 urlpatterns = [
-    # Student endpoints will go here
+    path("", StudentProfileListView.as_view(), name="student-list"),
+    path("<int:pk>/", StudentProfileDetailView.as_view(), name="student-detail"),
+    path("teams/", TeamListView.as_view(), name="team-list"),
+    path("teams/<int:pk>/", TeamDetailView.as_view(), name="team-detail"),
+    path("cohorts/", CohortListView.as_view(), name="cohort-list"),
+    path("cohorts/<int:pk>/", CohortDetailView.as_view(), name="cohort-detail"),
+    path("cohorts/stats/", CohortStatsView.as_view(), name="cohort-stats"),
+    path("courses/", CourseListView.as_view(), name="course-list"),
+    path("courses/<int:pk>/", CourseDetailView.as_view(), name="course-detail"),
+    path(
+        "cohorts/<int:pk>/form-teams/",
+        CohortFormTeamsView.as_view(),
+        name="cohort-form-teams",
+    ),
 ]
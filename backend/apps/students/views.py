@@ -0,0 +1,279 @@
+from django.shortcuts import get_object_or_404
+from rest_framework import generics, serializers, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.common.mixins import (
+    CatalogListMixin,
+    CatalogObjectMixin,
+    SparseFieldsViewMixin,
+)
+from apps.common.models import Course
+from apps.common.pagination import KeysetPagination
+from apps.common.permissions import IsAdmin, IsProfessor
+from .models import Cohort, CohortStats, Team, StudentProfile
+from .serializers import (
+    CohortSerializer,
+    CohortStatsSerializer,
+    CourseSerializer,
+    TeamFormationSerializer,
+    TeamSerializer,
+    StudentProfileSerializer,
+)
+from .team_formation import FormationConstraints, TeamFormationError, form_teams
+
+
+class StudentProfileQuerysetMixin:
+    """
+    Joins user/cohort/team in the same query (avoiding the per-row lazy
+    loads StudentProfile.__str__ and Team.__str__ would trigger) and only
+    fetches the columns StudentProfileSerializer renders.
+    """
+
+    def get_queryset(self):
+        return StudentProfile.objects.select_related("user", "cohort", "team").only(
+            "id",
+            "student_id",
+            "enrollment_date",
+            "graduation_year",
+            "user__id",
+            "user__email",
+            "user__first_name",
+            "user__last_name",
+            "cohort__id",
+            "cohort__name",
+            "team__id",
+            "team__name",
+        )
+
+
+class StudentProfileListView(
+    SparseFieldsViewMixin, StudentProfileQuerysetMixin, generics.ListAPIView
+):
+    """
+    List students (admins and professors)
+    GET /api/students/?cohort=<id>&team=<id>&unassigned=true
+    """
+
+    serializer_class = StudentProfileSerializer
+    permission_classes = [IsAdmin | IsProfessor]
+    pagination_class = KeysetPagination
+    compile_rows = True
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        cohort = id_param(self.request, "cohort")
+        if cohort is not None:
+            queryset = queryset.filter(cohort_id=cohort)
+        team = id_param(self.request, "team")
+        if team is not None:
+            queryset = queryset.filter(team_id=team)
+        if self.request.query_params.get("unassigned") in ("1", "true"):
+            queryset = queryset.filter(team__isnull=True)
+        return queryset
+
+
+class StudentProfileDetailView(StudentProfileQuerysetMixin, generics.RetrieveAPIView):
+    """
+    Student detail (admins and professors)
+    GET /api/students/<id>/
+    """
+
+    serializer_class = StudentProfileSerializer
+    permission_classes = [IsAdmin | IsProfessor]
+
+
+def id_param(request, name):
+    """
+    ``?<name>=<id>`` as an int, None when absent or empty; anything else is
+    a 400 rather than a lookup error
+    """
+    value = request.query_params.get(name, "")
+    if not value:
+        return None
+    if not (value.isascii() and value.isdigit()):
+        raise serializers.ValidationError({name: ["A valid integer is required."]})
+    return int(value)
+
+
+def cohort_scope(request):
+    """Catalog cache scope of a ``?cohort=<id>`` filtered list"""
+    cohort = id_param(request, "cohort")
+    return "all" if cohort is None else f"cohort:{cohort}"
+
+
+class TeamQuerysetMixin:
+    def get_queryset(self):
+        return Team.objects.select_related("cohort").only(
+            "id", "name", "cohort__id", "cohort__name"
+        )
+
+
+class TeamListView(
+    CatalogListMixin, SparseFieldsViewMixin, TeamQuerysetMixin, generics.ListAPIView
+):
+    """
+    List teams (cached, see apps/common/cache.py)
+    GET /api/students/teams/?cohort=<id>
+    """
+
+    serializer_class = TeamSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+    catalog_model = "team"
+
+    def get_catalog_scope(self):
+        return cohort_scope(self.request)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        cohort = id_param(self.request, "cohort")
+        if cohort is not None:
+            queryset = queryset.filter(cohort_id=cohort)
+        return queryset
+
+
+class TeamDetailView(CatalogObjectMixin, TeamQuerysetMixin, generics.RetrieveAPIView):
+    """
+    Team detail (cached)
+    GET /api/students/teams/<id>/
+    """
+
+    serializer_class = TeamSerializer
+    permission_classes = [IsAuthenticated]
+    catalog_model = "team"
+
+
+class NewestFirstPagination(KeysetPagination):
+    ordering = "-id"
+
+
+class CohortListView(CatalogListMixin, SparseFieldsViewMixin, generics.ListAPIView):
+    """
+    List cohorts, newest first (cached)
+    GET /api/students/cohorts/
+    """
+
+    queryset = Cohort.objects.only("id", "name", "start_date", "end_date", "is_active")
+    serializer_class = CohortSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = NewestFirstPagination
+    catalog_model = "cohort"
+
+
+class CohortDetailView(CatalogObjectMixin, generics.RetrieveAPIView):
+    """
+    Cohort detail (cached)
+    GET /api/students/cohorts/<id>/
+    """
+
+    queryset = Cohort.objects.only("id", "name", "start_date", "end_date", "is_active")
+    serializer_class = CohortSerializer
+    permission_classes = [IsAuthenticated]
+    catalog_model = "cohort"
+
+
+class CourseQuerysetMixin:
+    def get_queryset(self):
+        return Course.objects.select_related("cohort").only(
+            "id", "code", "name", "description", "cohort__id", "cohort__name"
+        )
+
+
+class CourseListView(
+    CatalogListMixin, SparseFieldsViewMixin, CourseQuerysetMixin, generics.ListAPIView
+):
+    """
+    List courses (cached)
+    GET /api/students/courses/?cohort=<id>
+    """
+
+    serializer_class = CourseSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+    catalog_model = "course"
+
+    def get_catalog_scope(self):
+        return cohort_scope(self.request)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        cohort = id_param(self.request, "cohort")
+        if cohort is not None:
+            queryset = queryset.filter(cohort_id=cohort)
+        return queryset
+
+
+class CourseDetailView(
+    CatalogObjectMixin, CourseQuerysetMixin, generics.RetrieveAPIView
+):
+    """
+    Course detail (cached)
+    GET /api/students/courses/<id>/
+    """
+
+    serializer_class = CourseSerializer
+    permission_classes = [IsAuthenticated]
+    catalog_model = "course"
+
+
+class CohortStatsView(SparseFieldsViewMixin, generics.ListAPIView):
+    """
+    Per-cohort dashboard counters in a single query (admins only)
+    GET /api/students/cohorts/stats/?active=true
+    """
+
+    serializer_class = CohortStatsSerializer
+    permission_classes = [IsAdmin]
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        queryset = CohortStats.objects.select_related("cohort").only(
+            "id",
+            "student_count",
+            "team_count",
+            "unassigned_count",
+            "course_count",
+            "updated_at",
+            "cohort__id",
+            "cohort__name",
+            "cohort__is_active",
+        )
+        if self.request.query_params.get("active") in ("1", "true"):
+            queryset = queryset.filter(cohort__is_active=True)
+        return queryset
+
+
+class CohortFormTeamsView(APIView):
+    """
+    Split a cohort's unassigned students into balanced teams (admins only)
+    POST /api/students/cohorts/<id>/form-teams/
+    """
+
+    permission_classes = [IsAdmin]
+
+    def post(self, request, pk):
+        cohort = get_object_or_404(Cohort, pk=pk)
+        serializer = TeamFormationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        options = serializer.validated_data
+        constraints = FormationConstraints(
+            min_size=options["min_size"],
+            max_size=options["max_size"],
+            keep_together=options["keep_together"],
+            keep_apart=options["keep_apart"],
+        )
+        try:
+            result = form_teams(
+                cohort,
+                constraints,
+                dry_run=options["dry_run"],
+                name_prefix=options["name_prefix"],
+            )
+        except TeamFormationError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if options["dry_run"]:
+            return Response(result.as_dict(), status=status.HTTP_200_OK)
+        return Response(result.as_dict(), status=status.HTTP_201_CREATED)
@@ -0,0 +1,22 @@
+"""Background tasks for the users app (discovered by apps.jobs)"""
+
+from django.core.files.storage import storages
+
+from apps.jobs.tasks import task
+from .roster import DEFAULT_BATCH_SIZE, RosterImporter, open_roster, read_rows
+
+
+# Not retried: batches committed before a failure would be reported as
+# duplicates by a second run
+@task("users.import_roster", max_attempts=1)
+def import_roster(file, fmt="csv", batch_size=DEFAULT_BATCH_SIZE):
+    """Import a roster uploaded to job storage, then delete the upload"""
+    storage = storages["jobs"]
+    try:
+        with storage.open(file, "rb") as raw:
+            # A worker process can afford the hashing pool (one per CPU)
+            importer = RosterImporter(batch_size=batch_size, workers=None)
+            report = importer.run(read_rows(open_roster(raw), fmt))
+    finally:
+        storage.delete(file)
+    return report.as_dict()
@@ -0,0 +1,58 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.users.roster import (
+    DEFAULT_BATCH_SIZE,
+    ROSTER_ENCODING,
+    RosterImporter,
+    detect_format,
+    open_roster,
+    read_rows,
+)
+
+
+class Command(BaseCommand):
+    help = "Bulk import students/professors from a CSV or NDJSON roster"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Roster file, or '-' to read stdin")
+        parser.add_argument(
+            "--format",
+            choices=["csv", "ndjson"],
+            help="Roster format (default: inferred from the file extension)",
+        )
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Password hashing processes (default: CPU count, 1 disables the pool)",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        fmt = options["format"] or detect_format(path)
+        importer = RosterImporter(
+            batch_size=options["batch_size"], workers=options["workers"]
+        )
+
+        if path == "-":
+            report = importer.run(read_rows(open_roster(sys.stdin.buffer), fmt))
+        else:
+            try:
+                stream = open(path, newline="", encoding=ROSTER_ENCODING)
+            except OSError as exc:
+                raise CommandError(f"Cannot open roster: {exc}")
+            with stream:
+                report = importer.run(read_rows(stream, fmt))
+
+        for error in report.errors:
+            self.stderr.write(f"line {error.line}: {error.errors}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {report.created}/{report.total} rows "
+                f"({len(report.errors)} failed) in {report.elapsed:.2f}s "
+                f"- {report.rows_per_sec:.1f} rows/sec"
+            )
+        )
@@ -0,0 +1,34 @@
+import uuid
+from django.utils import timezone
+from apps.students.models import StudentProfile
+from apps.professors.models import ProfessorProfile
+from apps.admin.models import AdminProfile
+
+
+# Role -> profile model holding the role-specific data
+PROFILE_MODELS = {
+    "student": StudentProfile,
+    "professor": ProfessorProfile,
+    "admin": AdminProfile,
+}
+
+
+def generate_profile_id():
+    """Short random identifier used for student_id / employee_id"""
+    return str(uuid.uuid4())[:8]
+
+
+def build_profile(user, **fields):
+    """
+    Return an unsaved profile instance for the user's role, or None.
+    Shared by the post_save signal and the bulk roster importer so both
+    paths produce identical rows.
+    """
+    if user.role == "student":
+        fields.setdefault("student_id", generate_profile_id())
+        fields.setdefault("enrollment_date", timezone.localdate())
+    elif user.role == "professor":
+        fields.setdefault("employee_id", generate_profile_id())
+    elif user.role != "admin":
+        return None
+    return PROFILE_MODELS[user.role](user=user, **fields)
@@ -0,0 +1,371 @@
+"""
+Bulk cohort roster import.
+
+Rows are streamed from CSV or NDJSON, validated a batch at a time, have their
+passwords hashed (across a process pool in background jobs and the
+management command) and are written with ``bulk_create``
+inside one transaction per batch. ``bulk_create`` does not send ``post_save``,
+so the profile rows the signals in ``apps/users/signals.py`` would create are
+built here with the same helper and inserted in bulk alongside the users,
+and the users are added to the search index in the same transaction.
+"""
+
+import csv
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.password_validation import validate_password
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import DatabaseError, transaction
+from rest_framework import serializers
+
+from apps.students.models import Cohort, StudentProfile
+from apps.students.stats import recompute_cohort_stats
+from apps.professors.models import ProfessorProfile
+from apps.search.indexing import index_users
+from .profiles import PROFILE_MODELS, build_profile
+
+User = get_user_model()
+
+DEFAULT_BATCH_SIZE = 500
+# Spreadsheet exports often start with a byte order mark
+ROSTER_ENCODING = "utf-8-sig"
+IMPORT_ROLES = ["student", "professor"]
+
+
+class RosterRowSerializer(serializers.Serializer):
+    """Validates a single roster row without touching the database"""
+
+    email = serializers.EmailField()
+    first_name = serializers.CharField(max_length=150, required=False, default="")
+    last_name = serializers.CharField(max_length=150, required=False, default="")
+    username = serializers.CharField(
+        max_length=150, required=False, allow_blank=True, default=""
+    )
+    role = serializers.ChoiceField(
+        choices=IMPORT_ROLES, required=False, default="student"
+    )
+    password = serializers.CharField(required=False, allow_blank=True, default="")
+    # Student columns
+    student_id = serializers.CharField(
+        max_length=50, required=False, allow_blank=True, default=""
+    )
+    cohort = serializers.IntegerField(required=False, allow_null=True, default=None)
+    graduation_year = serializers.IntegerField(
+        required=False, allow_null=True, default=None
+    )
+    # Professor columns
+    employee_id = serializers.CharField(
+        max_length=50, required=False, allow_blank=True, default=""
+    )
+    department = serializers.CharField(
+        max_length=100, required=False, allow_blank=True, default=""
+    )
+    specialization = serializers.CharField(
+        max_length=200, required=False, allow_blank=True, default=""
+    )
+
+    def to_internal_value(self, data):
+        # CSV cells arrive as empty strings; treat them as missing values
+        data = {key: value for key, value in data.items() if value not in ("", None)}
+        return super().to_internal_value(data)
+
+    def validate_email(self, value):
+        return User.objects.normalize_email(value)
+
+    def validate_password(self, value):
+        if value:
+            try:
+                validate_password(value)
+            except DjangoValidationError as exc:
+                raise serializers.ValidationError(list(exc.messages))
+        return value
+
+
+@dataclass
+class RowError:
+    line: int
+    errors: dict
+
+    def as_dict(self):
+        return {"line": self.line, "errors": self.errors}
+
+
+@dataclass
+class ImportReport:
+    total: int = 0
+    created: int = 0
+    errors: list = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_sec(self):
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self):
+        return {
+            "total": self.total,
+            "created": self.created,
+            "failed": len(self.errors),
+            "elapsed_seconds": round(self.elapsed, 3),
+            "rows_per_sec": round(self.rows_per_sec, 1),
+            "errors": [error.as_dict() for error in self.errors],
+        }
+
+
+def detect_format(filename):
+    """Guess the roster format from a file name, defaulting to CSV"""
+    if filename and filename.lower().endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    return "csv"
+
+
+def open_roster(raw):
+    """Text stream over a binary roster file; a UTF-8 byte order mark is skipped"""
+    return io.TextIOWrapper(raw, encoding=ROSTER_ENCODING, newline="")
+
+
+class RosterDecodeError(ValueError):
+    """The roster stops being valid text at (or shortly after) ``line``"""
+
+    def __init__(self, line):
+        super().__init__(
+            f"Roster is not valid UTF-8 text; rows from line {line} on were "
+            "not imported"
+        )
+        self.line = line
+
+
+def read_rows(stream, fmt="csv"):
+    """
+    Yield ``(line_number, row)`` pairs from a text stream.
+    Unparseable NDJSON lines are yielded as ``(line_number, None)``; bytes
+    that do not decode end the stream with RosterDecodeError.
+    """
+    if fmt not in ("csv", "ndjson"):
+        raise ValueError(f"Unsupported roster format: {fmt}")
+    line_number = 0
+    try:
+        if fmt == "ndjson":
+            for line_number, line in enumerate(stream, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    row = None
+                yield line_number, row if isinstance(row, dict) else None
+        else:
+            reader = csv.DictReader(stream)
+            for row in reader:
+                # Header is line 1, so data rows start at 2
+                line_number = reader.line_num
+                yield line_number, {k.strip(): v for k, v in row.items() if k}
+    except UnicodeDecodeError as exc:
+        # Decoding happens a buffer at a time, so the bad bytes may be a
+        # few lines further on
+        raise RosterDecodeError(line_number + 1) from exc
+
+
+def _hash_password(raw_password):
+    # Module-level so the process pool can pickle it
+    return make_password(raw_password)
+
+
+class RosterImporter:
+    """
+    Streams roster rows into the database in fixed-size batches.
+    Invalid rows are reported individually and never abort the import.
+    """
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE, workers=1):
+        self.batch_size = batch_size
+        # Password hashing processes; None means one per CPU. The default
+        # hashes in-process, as a request should not fork a pool
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self._seen_emails = set()
+        self._seen_usernames = set()
+        self._seen_profile_ids = set()
+        self._cohort_ids = set()
+
+    def run(self, rows):
+        report = ImportReport()
+        started = time.perf_counter()
+        executor = ProcessPoolExecutor(self.workers) if self.workers > 1 else None
+        try:
+            batch = []
+            try:
+                for line, row in rows:
+                    batch.append((line, row))
+                    if len(batch) >= self.batch_size:
+                        self._import_batch(batch, report, executor)
+                        batch = []
+            except RosterDecodeError as exc:
+                report.total += 1
+                report.errors.append(
+                    RowError(exc.line, {"non_field_errors": [str(exc)]})
+                )
+            if batch:
+                self._import_batch(batch, report, executor)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        if self._cohort_ids:
+            # bulk_create skipped the signals that maintain CohortStats
+            recompute_cohort_stats(self._cohort_ids)
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def _import_batch(self, batch, report, executor):
+        report.total += len(batch)
+        valid = self._validate_batch(batch, report)
+        if not valid:
+            return
+
+        passwords = [data["password"] or None for _, data in valid]
+        if executor is not None:
+            chunksize = max(1, len(passwords) // (self.workers * 4))
+            hashes = list(executor.map(_hash_password, passwords, chunksize=chunksize))
+        else:
+            hashes = [_hash_password(password) for password in passwords]
+
+        users = []
+        profiles = {model: [] for model in PROFILE_MODELS.values()}
+        for (_, data), encoded in zip(valid, hashes):
+            user = User(
+                email=data["email"],
+                username=data["username"] or User.generate_username(data["email"]),
+                first_name=data["first_name"],
+                last_name=data["last_name"],
+                role=data["role"],
+                auth_provider="jwt",
+                password=encoded,
+            )
+            users.append(user)
+            profile = build_profile(user, **self._profile_fields(data))
+            profiles[type(profile)].append(profile)
+
+        try:
+            with transaction.atomic():
+                User.objects.bulk_create(users, batch_size=self.batch_size)
+                for model, objs in profiles.items():
+                    if objs:
+                        model.objects.bulk_create(objs, batch_size=self.batch_size)
+                index_users(users, batch_size=self.batch_size)
+        except DatabaseError as exc:
+            for line, _ in valid:
+                report.errors.append(RowError(line, {"non_field_errors": [str(exc)]}))
+            return
+        report.created += len(users)
+        self._cohort_ids.update(
+            data["cohort"]
+            for _, data in valid
+            if data["role"] == "student" and data["cohort"]
+        )
+
+    def _profile_fields(self, data):
+        if data["role"] == "student":
+            fields = {
+                "cohort_id": data["cohort"],
+                "graduation_year": data["graduation_year"],
+            }
+            if data["student_id"]:
+                fields["student_id"] = data["student_id"]
+            return fields
+        fields = {
+            "department": data["department"],
+            "specialization": data["specialization"],
+        }
+        if data["employee_id"]:
+            fields["employee_id"] = data["employee_id"]
+        return fields
+
+    def _validate_batch(self, batch, report):
+        """
+        Run per-row validation, then check uniqueness for the whole batch
+        with one query per column instead of one per row.
+        """
+        parsed = []
+        for line, row in batch:
+            if row is None:
+                report.errors.append(
+                    RowError(line, {"non_field_errors": ["Malformed row"]})
+                )
+                continue
+            serializer = RosterRowSerializer(data=row)
+            if serializer.is_valid():
+                parsed.append((line, serializer.validated_data))
+            else:
+                report.errors.append(RowError(line, serializer.errors))
+        if not parsed:
+            return parsed
+
+        emails = {data["email"] for _, data in parsed}
+        usernames = {data["username"] for _, data in parsed if data["username"]}
+        student_ids = {data["student_id"] for _, data in parsed if data["student_id"]}
+        employee_ids = {
+            data["employee_id"] for _, data in parsed if data["employee_id"]
+        }
+        cohort_ids = {data["cohort"] for _, data in parsed if data["cohort"]}
+
+        taken_emails = set(
+            User.objects.filter(email__in=emails).values_list("email", flat=True)
+        )
+        taken_usernames = set(
+            User.objects.filter(username__in=usernames).values_list(
+                "username", flat=True
+            )
+        )
+        taken_student_ids = set(
+            StudentProfile.objects.filter(student_id__in=student_ids).values_list(
+                "student_id", flat=True
+            )
+        )
+        taken_employee_ids = set(
+            ProfessorProfile.objects.filter(employee_id__in=employee_ids).values_list(
+                "employee_id", flat=True
+            )
+        )
+        known_cohorts = set(
+            Cohort.objects.filter(pk__in=cohort_ids).values_list("pk", flat=True)
+        )
+
+        valid = []
+        for line, data in parsed:
+            errors = {}
+            if data["email"] in taken_emails or data["email"] in self._seen_emails:
+                errors["email"] = ["A user with this email already exists."]
+            username = data["username"]
+            if username and (
+                username in taken_usernames or username in self._seen_usernames
+            ):
+                errors["username"] = ["A user with this username already exists."]
+            profile_key = "student_id" if data["role"] == "student" else "employee_id"
+            profile_id = data[profile_key]
+            taken_ids = (
+                taken_student_ids if profile_key == "student_id" else taken_employee_ids
+            )
+            if profile_id and (
+                profile_id in taken_ids
+                or (profile_key, profile_id) in self._seen_profile_ids
+            ):
+                errors[profile_key] = [f"This {profile_key} is already in use."]
+            if data["cohort"] and data["cohort"] not in known_cohorts:
+                errors["cohort"] = [f"Cohort {data['cohort']} does not exist."]
+            if errors:
+                report.errors.append(RowError(line, errors))
+                continue
+            self._seen_emails.add(data["email"])
+            if username:
+                self._seen_usernames.add(username)
+            if profile_id:
+                self._seen_profile_ids.add((profile_key, profile_id))
+            valid.append((line, data))
+        return valid
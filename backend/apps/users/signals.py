@@ -1,10 +1,9 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
-from apps.students.models import StudentProfile
-from apps.professors.models import ProfessorProfile
-from apps.admin.models import AdminProfile
-import uuid
+from apps.authentication.authentication import user_cache
+from apps.authentication.revocation import forget_token_version
+from .profiles import PROFILE_MODELS, build_profile
 
 User = get_user_model()
 
@@ -12,23 +11,28 @@ User = get_user_model()
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
     if created:
-        if instance.role == "student":
-            StudentProfile.objects.create(
-                user=instance, student_id=str(uuid.uuid4())[:8]
-            )
-        elif instance.role == "professor":
-            ProfessorProfile.objects.create(
-                user=instance, employee_id=str(uuid.uuid4())[:8]
-            )
-        elif instance.role == "admin":
-            AdminProfile.objects.create(user=instance)
+        profile = build_profile(instance)
+        if profile is not None:
+            profile.save()
 
 
 @receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    if instance.role == "student" and hasattr(instance, "student_profile"):
-        instance.student_profile.save()
-    elif instance.role == "professor" and hasattr(instance, "professor_profile"):
-        instance.professor_profile.save()
-    elif instance.role == "admin" and hasattr(instance, "admin_profile"):
-        instance.admin_profile.save()
+def sync_user_profile(sender, instance, created, update_fields=None, **kwargs):
+    # The profile only depends on the role: make sure a user whose role
+    # changed has a profile for the new one. Any other save costs no query.
+    if created or "role" not in instance.changed_fields:
+        return
+    if update_fields is not None and "role" not in update_fields:
+        return
+    model = PROFILE_MODELS.get(instance.role)
+    if model is not None and not model.objects.filter(user=instance).exists():
+        build_profile(instance).save()
+
+
+@receiver(post_save, sender=User)
+def evict_cached_user(sender, instance, **kwargs):
+    # Drop the stale row ClaimsUser would otherwise serve until its TTL and
+    # the cached token version so deactivation takes effect immediately.
+    # The /me/ payload is keyed by User.version and needs nothing.
+    user_cache.delete(instance.pk)
+    forget_token_version([instance.pk])
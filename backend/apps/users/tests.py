@@ -0,0 +1,115 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.authentication.last_login import get_last_login_buffer
+from apps.students.models import StudentProfile
+
+User = get_user_model()
+
+
+class RosterImportTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            username="admin", email="admin@example.com", password="x", role="admin"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def upload(self, content, name="roster.csv"):
+        return self.client.post(
+            "/api/users/import/",
+            {"file": SimpleUploadedFile(name, content)},
+            format="multipart",
+        )
+
+    def test_csv_with_byte_order_mark(self):
+        content = "email,first_name\r\nada@example.com,Ada\r\n".encode("utf-8-sig")
+        response = self.upload(content)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["created"], 1)
+        self.assertEqual(User.objects.get(email="ada@example.com").first_name, "Ada")
+
+    def test_undecodable_file_is_a_row_error(self):
+        content = (
+            b"email,first_name\r\nada@example.com,Ada\r\nbob@example.com,B\xe9b\r\n"
+        )
+        response = self.upload(content)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["created"], 0)
+        self.assertEqual(response.data["failed"], 1)
+        self.assertIn("not valid UTF-8", str(response.data["errors"][0]))
+
+    def test_ndjson(self):
+        content = b'{"email": "ada@example.com"}\n\nnot json\n'
+        response = self.upload(content, name="roster.ndjson")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["created"], 1)
+        self.assertEqual(
+            response.data["errors"],
+            [{"line": 3, "errors": {"non_field_errors": ["Malformed row"]}}],
+        )
+
+
+class UserQueryCountTests(TestCase):
+    """
+    Saving a user writes its profile only when the role changes; the search
+    index upserts (update_or_create: savepoint, SELECT, write, release) are
+    counted too
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="ada", email="ada@example.com", password="secret", role="student"
+        )
+
+    def test_create(self):
+        # User and profile INSERTs, then one index upsert for both
+        with self.assertNumQueries(8):
+            User.objects.create_user(
+                username="bob", email="bob@example.com", password="x", role="student"
+            )
+
+    def test_update(self):
+        user = User.objects.get(pk=self.user.pk)
+        user.first_name = "Ada"
+        # UPDATE, the profile read for the search document, one index upsert
+        with self.assertNumQueries(6):
+            user.save()
+        with self.assertNumQueries(1):
+            user.save(update_fields=["last_login"])
+
+    def test_profile_update(self):
+        profile = StudentProfile.objects.select_related("user").get(user=self.user)
+        profile.graduation_year = 2027
+        # Only the UPDATE: the field isn't part of the search document
+        with self.assertNumQueries(1):
+            profile.save()
+        profile.student_id = "S-1"
+        # UPDATE and the owner's index upsert; the user row is not touched
+        with self.assertNumQueries(5):
+            profile.save()
+
+    def test_role_change(self):
+        user = User.objects.get(pk=self.user.pk)
+        user.role = "professor"
+        # UPDATE, EXISTS and INSERT of the professor profile, one upsert
+        with self.assertNumQueries(7):
+            user.save()
+
+    def test_login(self):
+        # The user SELECT; last_login is buffered and throttles use the cache
+        with self.assertNumQueries(1):
+            response = self.client.post(
+                "/api/auth/login/",
+                {"email": "ada@example.com", "password": "secret"},
+                content_type="application/json",
+            )
+        self.assertEqual(response.status_code, 200)
+        # Write the buffered login now, while the test database exists
+        get_last_login_buffer().flush()
+        self.user.refresh_from_db()
+        self.assertIsNotNone(self.user.last_login)
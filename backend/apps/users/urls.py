@@ -1,5 +1,7 @@
 from django.urls import path
+from .views import RosterImportView
 
 urlpatterns = [
-    # User endpoints will go here
+    # Bulk roster import (admin only)
+    path("import/", RosterImportView.as_view(), name="roster-import"),
 ]
@@ -0,0 +1,52 @@
+import uuid
+
+from django.core.files.storage import storages
+from rest_framework import status
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.common.permissions import IsAdmin
+from apps.jobs.tasks import enqueue
+from apps.jobs.views import job_accepted, wants_background
+from .roster import RosterImporter, detect_format, open_roster, read_rows
+
+
+class RosterImportView(APIView):
+    """
+    Bulk roster import (admin only)
+    POST /api/users/import/
+    multipart field "file" holding a CSV or NDJSON roster;
+    optional "format" overrides the extension-based detection
+
+    With ?background=1 (or Prefer: respond-async) the file is handed to a
+    job instead and 202 is returned with the job's status URL.
+    """
+
+    permission_classes = [IsAdmin]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request):
+        upload = request.FILES.get("file")
+        if upload is None:
+            return Response(
+                {"error": "No roster file provided"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        fmt = request.data.get("format") or detect_format(upload.name)
+        if fmt not in ("csv", "ndjson"):
+            return Response(
+                {"error": f"Unsupported roster format: {fmt}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if wants_background(request):
+            name = storages["jobs"].save(f"rosters/{uuid.uuid4().hex}.{fmt}", upload)
+            job = enqueue(
+                "users.import_roster", {"file": name, "fmt": fmt}, user=request.user
+            )
+            return job_accepted(request, job)
+
+        report = RosterImporter().run(read_rows(open_roster(upload.file), fmt))
+        return Response(report.as_dict(), status=status.HTTP_200_OK)
@@ -0,0 +1,98 @@
+"""
+Shared setup for the scripts in this directory.
+
+Each benchmark runs against a throwaway test database (in-memory SQLite by
+default, or whatever DATABASES points at with a ``test_`` prefix), so they
+never touch development data. Run them from ``backend/``:
+
+    python benchmarks/<script>.py --help
+"""
+
+import os
+import statistics
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+
+def setup_database():
+    """Create the test database and return a callable that destroys it"""
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, keepdb=False)
+
+    def teardown():
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    return teardown
+
+
+def without_auth_throttles():
+    """
+    override_settings turning off the login/registration token buckets; the
+    benchmarks drive those endpoints from one client address
+    """
+    from django.conf import settings
+    from django.test.utils import override_settings
+
+    rates = dict.fromkeys(settings.REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"])
+    return override_settings(
+        REST_FRAMEWORK={**settings.REST_FRAMEWORK, "DEFAULT_THROTTLE_RATES": rates}
+    )
+
+
+def create_users(count, password="BenchPass123!", role="student", prefix="bench"):
+    """Bulk insert users sharing one password hash; returns their emails"""
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.hashers import make_password
+
+    User = get_user_model()
+    encoded = make_password(password)
+    users = [
+        User(
+            email=f"{prefix}{i}@example.com",
+            username=f"{prefix}{i}",
+            role=role,
+            password=encoded,
+        )
+        for i in range(count)
+    ]
+    User.objects.bulk_create(users, batch_size=1000)
+    return [user.email for user in users]
+
+
+def percentiles(samples):
+    """p50/p99/max of a list of seconds, in milliseconds"""
+    ordered = sorted(samples)
+    p99_index = max(0, int(round(len(ordered) * 0.99)) - 1)
+    return {
+        "p50": statistics.median(ordered) * 1000,
+        "p99": ordered[p99_index] * 1000,
+        "max": ordered[-1] * 1000,
+    }
+
+
+def report(title, rows):
+    """Print ``rows`` (list of dicts with identical keys) as an aligned table"""
+    print(f"\n{title}")
+    if not rows:
+        return
+    headers = list(rows[0])
+    cells = [[_fmt(row[h]) for h in headers] for row in rows]
+    widths = [max(len(h), *(len(c[i]) for c in cells)) for i, h in enumerate(headers)]
+    print("  ".join(h.ljust(w) for h, w in zip(headers, widths)))
+    for line in cells:
+        print("  ".join(c.ljust(w) for c, w in zip(line, widths)))
+
+
+def _fmt(value):
+    return f"{value:.2f}" if isinstance(value, float) else str(value)
@@ -0,0 +1,192 @@
+"""
+WSGI vs ASGI under many concurrent connections: /me and token refresh.
+
+Three deployments are compared, each in a fresh subprocess so RSS growth is
+attributable to the connections it holds open:
+
+  wsgi        sync views, one thread per connection (a threaded WSGI server)
+  asgi-sync   sync views behind the ASGI handler (run on its single
+              thread-sensitive executor)
+  asgi        the async views (``me/async/``, ``token/refresh/async/``) on
+              one event loop
+
+Every connection issues ``--requests`` calls back to back, alternating
+GET /me and a refresh that rotates its own token chain. No uvicorn/gunicorn
+is involved: the apps are driven in-process through Django's test clients,
+so the numbers isolate the framework side of the request, not socket I/O.
+Memory per connection is peak RSS growth (sampled from /proc) divided by
+the connection count.
+
+    python benchmarks/asgi_vs_wsgi.py --connections 1000 --requests 4
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import _bootstrap
+
+MODES = ("wsgi", "asgi-sync", "asgi")
+PATHS = {
+    "wsgi": ("/api/auth/me/", "/api/auth/token/refresh/"),
+    "asgi-sync": ("/api/auth/me/", "/api/auth/token/refresh/"),
+    "asgi": ("/api/auth/me/async/", "/api/auth/token/refresh/async/"),
+}
+
+
+def rss_bytes():
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+class PeakRSS(threading.Thread):
+    def __init__(self, interval=0.005):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = rss_bytes()
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.wait(self.interval):
+            self.peak = max(self.peak, rss_bytes())
+
+    def stop(self):
+        self._done.set()
+        self.join()
+        return self.peak
+
+
+def measure(mode, connections, requests):
+    from django.contrib.auth import get_user_model
+    from django.test import AsyncClient, Client
+
+    from apps.authentication.tokens import PlatformRefreshToken
+
+    logging.getLogger("django.request").setLevel(logging.ERROR)
+    teardown = _bootstrap.setup_database()
+    try:
+        _bootstrap.without_auth_throttles().enable()
+        _bootstrap.create_users(connections)
+        users = list(get_user_model().objects.order_by("pk"))
+        refresh = [PlatformRefreshToken.for_user(user) for user in users]
+        access = [str(token.access_token) for token in refresh]
+        refresh = [str(token) for token in refresh]
+        me_path, refresh_path = PATHS[mode]
+
+        def sync_connection(index):
+            client = Client()
+            auth = {"Authorization": f"Bearer {access[index]}"}
+            token, timings, statuses = refresh[index], [], []
+            for n in range(requests):
+                started = time.perf_counter()
+                if n % 2 == 0:
+                    response = client.get(me_path, headers=auth)
+                else:
+                    response = client.post(
+                        refresh_path,
+                        json.dumps({"refresh": token}),
+                        content_type="application/json",
+                    )
+                    if response.status_code == 200:
+                        token = response.json()["refresh"]
+                timings.append(time.perf_counter() - started)
+                statuses.append(response.status_code)
+            return timings, statuses
+
+        async def async_connection(client, index):
+            auth = {"Authorization": f"Bearer {access[index]}"}
+            token, timings, statuses = refresh[index], [], []
+            for n in range(requests):
+                started = time.perf_counter()
+                if n % 2 == 0:
+                    response = await client.get(me_path, headers=auth)
+                else:
+                    response = await client.post(
+                        refresh_path,
+                        {"refresh": token},
+                        content_type="application/json",
+                    )
+                    if response.status_code == 200:
+                        token = json.loads(response.content)["refresh"]
+                timings.append(time.perf_counter() - started)
+                statuses.append(response.status_code)
+            return timings, statuses
+
+        async def run_async():
+            client = AsyncClient()
+            return await asyncio.gather(
+                *(async_connection(client, i) for i in range(connections))
+            )
+
+        baseline = rss_bytes()
+        sampler = PeakRSS()
+        sampler.start()
+        started = time.perf_counter()
+        if mode == "wsgi":
+            with ThreadPoolExecutor(connections) as pool:
+                results = list(pool.map(sync_connection, range(connections)))
+        else:
+            results = asyncio.run(run_async())
+        elapsed = time.perf_counter() - started
+        peak = sampler.stop()
+    finally:
+        teardown()
+
+    timings = [t for conn_timings, _ in results for t in conn_timings]
+    errors = sum(s != 200 for _, statuses in results for s in statuses)
+    return {
+        "mode": mode,
+        "errors": errors,
+        **_bootstrap.percentiles(timings),
+        "req/s": len(timings) / elapsed,
+        "KiB/conn": (peak - baseline) / 1024 / connections,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--connections", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=4)
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child, args.connections, args.requests)))
+        return
+
+    rows = []
+    for mode in args.modes.split(","):
+        output = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--child",
+                mode,
+                "--connections",
+                str(args.connections),
+                "--requests",
+                str(args.requests),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        rows.append(json.loads(output.strip().splitlines()[-1]))
+
+    _bootstrap.report(
+        f"{args.connections} concurrent connections x {args.requests} requests "
+        f"(me + token refresh, in-process)",
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
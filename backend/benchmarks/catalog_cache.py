@@ -0,0 +1,129 @@
+"""
+Catalog read-through cache: team/cohort/course list throughput with the
+cache vs without it, and a stampede test.
+
+The stampede test expires a list while ``--threads`` clients request it at
+once; with single-flight only one of them should run the queries
+(``loads``), the others wait for its result (``coalesced``).
+
+    python benchmarks/catalog_cache.py --cohorts 50 --requests 2000
+"""
+
+import argparse
+import datetime
+import threading
+import time
+
+import _bootstrap
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import Client
+from django.test.utils import override_settings
+
+from apps.authentication.tokens import PlatformRefreshToken
+from apps.common.cache import catalog
+from apps.common.models import Course
+from apps.students.models import Cohort, Team
+
+PATHS = (
+    "/api/students/cohorts/",
+    "/api/students/teams/?cohort={cohort}",
+    "/api/students/courses/?cohort={cohort}",
+)
+
+
+def seed(cohorts):
+    today = datetime.date.today()
+    rows = Cohort.objects.bulk_create(
+        [
+            Cohort(name=f"Cohort {i}", start_date=today, end_date=today)
+            for i in range(cohorts)
+        ]
+    )
+    Team.objects.bulk_create(
+        [
+            Team(name=f"Team {i}-{j}", cohort=c)
+            for i, c in enumerate(rows)
+            for j in range(8)
+        ]
+    )
+    Course.objects.bulk_create(
+        [
+            Course(code=f"C{i}-{j}", name=f"Course {j}", cohort=c)
+            for i, c in enumerate(rows)
+            for j in range(4)
+        ]
+    )
+    return [c.pk for c in rows]
+
+
+def throughput(label, cohort_ids, headers, requests):
+    client = Client()
+    started = time.perf_counter()
+    for n in range(requests):
+        path = PATHS[n % len(PATHS)].format(cohort=cohort_ids[n % len(cohort_ids)])
+        assert client.get(path, headers=headers).status_code == 200
+    elapsed = time.perf_counter() - started
+    return {"cache": label, "req/s": requests / elapsed}
+
+
+def stampede(cohort_id, headers, threads):
+    path = f"/api/students/teams/?cohort={cohort_id}"
+    before = catalog.stats()
+    catalog.invalidate("team", scopes=[f"cohort:{cohort_id}"])
+    barrier = threading.Barrier(threads)
+
+    def fetch():
+        client = Client()
+        barrier.wait()
+        client.get(path, headers=headers)
+
+    pool = [threading.Thread(target=fetch) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    after = catalog.stats()
+    return {
+        "threads": threads,
+        "loads": after["misses"] - before["misses"],
+        "coalesced": after["coalesced"] - before["coalesced"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cohorts", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=32)
+    args = parser.parse_args()
+
+    teardown = _bootstrap.setup_database()
+    try:
+        cohort_ids = seed(args.cohorts)
+        _bootstrap.create_users(1, role="admin")
+        user = get_user_model().objects.get()
+        token = PlatformRefreshToken.for_user(user).access_token
+        headers = {"Authorization": f"Bearer {token}"}
+
+        dummy = {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}
+        with override_settings(CACHES={**settings.CACHES, "catalog-off": dummy}):
+            catalog.alias = "catalog-off"
+            rows = [throughput("off", cohort_ids, headers, args.requests)]
+        catalog.alias = "default"
+        throughput("warm-up", cohort_ids, headers, len(PATHS) * len(cohort_ids))
+        rows.append(throughput("on", cohort_ids, headers, args.requests))
+        _bootstrap.report(
+            f"{args.requests} catalog list requests over {args.cohorts} cohorts", rows
+        )
+        _bootstrap.report(
+            "Expired list requested concurrently",
+            [stampede(cohort_ids[0], headers, args.threads)],
+        )
+    finally:
+        teardown()
+
+
+if __name__ == "__main__":
+    main()
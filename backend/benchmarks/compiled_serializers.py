@@ -0,0 +1,147 @@
+"""
+Compiled serializers: objects/sec rendering list payloads with the DRF
+ModelSerializer vs. the compiled row function, plus a parity check.
+
+Each case renders the same rows both ways: the serializer over model
+instances from the view's queryset, and ``compile_serializer`` over
+``values_list()`` tuples. The JSON bodies must be byte-identical (the run
+aborts otherwise); throughput counts the query, the rendering to Python
+and the JSON encoding. The seeded data mixes null and non-null relations,
+dates, datetimes and UUIDs so every conversion path is exercised,
+including a field that DRF leaves out when its relation is missing.
+
+    python benchmarks/compiled_serializers.py --rows 10000
+"""
+
+import argparse
+import datetime
+import time
+
+import _bootstrap
+
+from django.contrib.auth import get_user_model
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from apps.authentication.serializers import UserSerializer
+from apps.common.compiled import compile_serializer
+from apps.common.models import Course
+from apps.students.models import Cohort, StudentProfile, Team
+from apps.students.serializers import CourseSerializer, StudentProfileSerializer
+from apps.students.views import StudentProfileQuerysetMixin
+
+
+class OmittingStudentSerializer(StudentProfileSerializer):
+    """team_name without a default: DRF omits it for unassigned students"""
+
+    team_name = serializers.CharField(source="team.name", read_only=True)
+
+
+def students():
+    return StudentProfileQuerysetMixin().get_queryset()
+
+
+CASES = (
+    ("users", UserSerializer, None, lambda: get_user_model().objects.all()),
+    ("students", StudentProfileSerializer, None, students),
+    ("students id,email", StudentProfileSerializer, ("email", "id"), students),
+    ("students omitting", OmittingStudentSerializer, None, students),
+    (
+        "courses",
+        CourseSerializer,
+        None,
+        lambda: Course.objects.select_related("cohort"),
+    ),
+)
+
+
+def seed(rows):
+    today = datetime.date.today()
+    cohorts = Cohort.objects.bulk_create(
+        [
+            Cohort(name=f"Cohort {i}", start_date=today, end_date=today)
+            for i in range(10)
+        ]
+    )
+    teams = Team.objects.bulk_create(
+        [Team(name=f"Team {i}", cohort=cohorts[i % 10]) for i in range(40)]
+    )
+    _bootstrap.create_users(rows)
+    StudentProfile.objects.bulk_create(
+        [
+            StudentProfile(
+                user=user,
+                student_id=f"S{index:07d}",
+                enrollment_date=today,
+                cohort=cohorts[index % 10] if index % 4 else None,
+                team=teams[index % 40] if index % 3 else None,
+                graduation_year=2027 if index % 2 else None,
+            )
+            for index, user in enumerate(get_user_model().objects.all())
+        ],
+        batch_size=1000,
+    )
+    Course.objects.bulk_create(
+        [
+            Course(code=f"C{i}", name=f"Course {i}", cohort=cohorts[i % 10])
+            for i in range(rows // 10)
+        ]
+    )
+
+
+def timed(render, repeat):
+    best, body = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = JSONRenderer().render(render())
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, body
+
+
+def measure(label, serializer_class, fields, queryset, repeat):
+    ordered = queryset().order_by("pk")
+    compiled = compile_serializer(serializer_class, fields)
+    drf_seconds, expected = timed(
+        lambda: serializer_class(
+            ordered, many=True, fields=list(fields) if fields else None
+        ).data,
+        repeat,
+    )
+    fast_seconds, actual = timed(
+        lambda: compiled.to_representation(ordered.values_list(*compiled.columns)),
+        repeat,
+    )
+    if actual != expected:
+        raise SystemExit(f"{label}: compiled output differs from {serializer_class}")
+    count = ordered.count()
+    return {
+        "case": label,
+        "rows": count,
+        "drf obj/s": count / drf_seconds,
+        "compiled obj/s": count / fast_seconds,
+        "speedup": drf_seconds / fast_seconds,
+        "identical": "yes",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    teardown = _bootstrap.setup_database()
+    try:
+        seed(args.rows)
+        rows = [
+            measure(label, serializer_class, fields, queryset, args.repeat)
+            for label, serializer_class, fields, queryset in CASES
+        ]
+        _bootstrap.report("Serializer vs compiled row function", rows)
+    finally:
+        teardown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Peak RSS of a streaming export as the table grows.
+
+For each size, one process populates an on-disk SQLite database with that
+many students (user + profile, cohort and team), then a fresh process
+streams /api/admin/exports/<name>.<format> through the test client,
+discarding the bytes, and reports how far its peak RSS rose above the
+baseline taken just before the request. The run fails (exit status 1) if
+the largest export grows more than --max-growth-mb beyond the smallest.
+
+    python benchmarks/export_memory.py --sizes 1000,100000,1000000
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import _bootstrap
+
+
+def peak_rss_mb():
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def populate(count):
+    from django.contrib.auth import get_user_model
+    from django.core.management import call_command
+    from django.utils import timezone
+
+    from apps.students.models import Cohort, StudentProfile, Team
+
+    call_command("migrate", verbosity=0)
+    User = get_user_model()
+    cohort = Cohort.objects.create(
+        name="Bench", start_date="2026-01-01", end_date="2026-12-31"
+    )
+    teams = Team.objects.bulk_create(
+        [Team(name=f"Team {i}", cohort=cohort) for i in range(max(1, count // 5))]
+    )
+    today = timezone.localdate()
+    step = 10_000
+    for offset in range(0, count, step):
+        users = User.objects.bulk_create(
+            User(
+                email=f"bench{i}@example.com",
+                username=f"bench{i}",
+                first_name="Bench",
+                last_name=f"Student {i}",
+                role="student",
+            )
+            for i in range(offset, min(count, offset + step))
+        )
+        StudentProfile.objects.bulk_create(
+            StudentProfile(
+                user=user,
+                student_id=f"S{offset + i:08d}",
+                cohort=cohort,
+                team=teams[(offset + i) % len(teams)],
+                enrollment_date=today,
+            )
+            for i, user in enumerate(users)
+        )
+
+
+def export(name, fmt):
+    from django.contrib.auth import get_user_model
+    from django.test.utils import setup_test_environment
+    from rest_framework.test import APIClient
+
+    setup_test_environment()
+    admin = get_user_model().objects.create(
+        email="admin@bench.local", username="bench-admin", role="admin"
+    )
+    client = APIClient()
+    client.force_authenticate(admin)
+    # Warm up URL resolution and imports on an empty export first
+    b"".join(client.get("/api/admin/exports/courses.csv").streaming_content)
+    baseline = peak_rss_mb()
+    response = client.get(f"/api/admin/exports/{name}.{fmt}")
+    size = sum(len(chunk) for chunk in response.streaming_content)
+    print(
+        json.dumps({"bytes": size, "baseline_mb": baseline, "peak_mb": peak_rss_mb()})
+    )
+
+
+def run_step(step, database, *extra):
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{database}"}
+    output = subprocess.run(
+        [sys.executable, __file__, "--step", step, *extra],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return output.strip().splitlines()[-1] if output.strip() else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="1000,100000")
+    parser.add_argument("--export", default="students")
+    parser.add_argument("--format", default="csv", choices=["csv", "ndjson"])
+    parser.add_argument("--max-growth-mb", type=float, default=20.0)
+    parser.add_argument(
+        "--step", choices=["populate", "export"], help=argparse.SUPPRESS
+    )
+    parser.add_argument("--rows", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.step == "populate":
+        populate(args.rows)
+        return
+    if args.step == "export":
+        export(args.export, args.format)
+        return
+
+    workdir = tempfile.mkdtemp(prefix="export-bench-")
+    rows = []
+    try:
+        for size in sorted(int(size) for size in args.sizes.split(",")):
+            database = os.path.join(workdir, f"export-{size}.sqlite3")
+            run_step("populate", database, "--rows", str(size))
+            result = json.loads(
+                run_step(
+                    "export",
+                    database,
+                    "--export",
+                    args.export,
+                    "--format",
+                    args.format,
+                )
+            )
+            rows.append(
+                {
+                    "rows": size,
+                    "output_mb": result["bytes"] / 1024 / 1024,
+                    "baseline_mb": result["baseline_mb"],
+                    "peak_mb": result["peak_mb"],
+                    "growth_mb": result["peak_mb"] - result["baseline_mb"],
+                }
+            )
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    _bootstrap.report(f"{args.export}.{args.format} peak RSS", rows)
+    spread = rows[-1]["growth_mb"] - rows[0]["growth_mb"]
+    if spread > args.max_growth_mb:
+        print(f"\nFAIL: peak RSS growth differs by {spread:.1f} MB across sizes")
+        sys.exit(1)
+    print(f"\nOK: peak RSS growth differs by {spread:.1f} MB across sizes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Job queue throughput: no-op jobs drained by ``runworker``-style worker
+processes in burst mode, for several process counts.
+
+Each row also checks that every job ran exactly once (``attempts == 1``
+and status succeeded), which is what the claim query has to guarantee under
+contention. SQLite runs use an on-disk test database so the worker
+processes share it; set SQLITE_TUNED=True or DATABASE_URL to compare
+configurations (PostgreSQL claims with SKIP LOCKED).
+
+    python benchmarks/job_queue.py --jobs 2000 --processes 1,2,4
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import _bootstrap
+
+from django.db import connection
+from django.db.models import Count
+
+from apps.jobs.models import Job
+from apps.jobs.tasks import task
+from apps.jobs.worker import run_workers
+
+
+@task("bench.noop")
+def noop(index):
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--processes", default="1,2,4")
+    args = parser.parse_args()
+
+    workdir = None
+    if connection.vendor == "sqlite":
+        workdir = tempfile.mkdtemp(prefix="jobbench-")
+        connection.settings_dict["TEST"]["NAME"] = os.path.join(workdir, "test.db")
+    teardown = _bootstrap.setup_database()
+    try:
+        rows = []
+        for processes in [int(p) for p in args.processes.split(",")]:
+            Job.objects.all().delete()
+            Job.objects.bulk_create(
+                [Job(task="bench.noop", kwargs={"index": i}) for i in range(args.jobs)],
+                batch_size=1000,
+            )
+            started = time.perf_counter()
+            run_workers(processes, burst=True, poll_interval=0.05)
+            elapsed = time.perf_counter() - started
+            outcome = dict(Job.objects.values_list("status").annotate(n=Count("id")))
+            rows.append(
+                {
+                    "processes": processes,
+                    "succeeded": outcome.get(Job.SUCCEEDED, 0),
+                    "exactly_once": not Job.objects.exclude(attempts=1).exists(),
+                    "jobs/s": args.jobs / elapsed,
+                }
+            )
+        _bootstrap.report(
+            f"{args.jobs} no-op jobs, {connection.vendor} "
+            f"(worker start-up included)",
+            rows,
+        )
+    finally:
+        teardown()
+        if workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
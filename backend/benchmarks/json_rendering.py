@@ -0,0 +1,92 @@
+"""
+Render and parse time for UserSerializer payloads: DRF's JSONRenderer /
+JSONParser vs FastJSONRenderer / FastJSONParser (orjson).
+
+Users are built in memory, so no database is needed. The serialized data
+is produced once and then rendered (and the resulting bytes parsed) by each
+implementation; the run also checks that both renderers emit identical
+bytes.
+
+    python benchmarks/json_rendering.py --users 10000 --repeat 20
+"""
+
+import argparse
+import io
+import time
+import uuid
+from datetime import timedelta
+
+import _bootstrap
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from apps.authentication.serializers import UserSerializer
+from apps.common.parsers import FastJSONParser
+from apps.common.renderers import FastJSONRenderer, orjson
+
+
+def build_payload(count):
+    User = get_user_model()
+    now = timezone.now()
+    users = [
+        User(
+            id=uuid.uuid4(),
+            email=f"bench{i}@example.com",
+            username=f"bench{i}",
+            first_name="Zoë",
+            last_name=f"Student {i}",
+            role="student",
+            date_joined=now - timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+    return UserSerializer(users, many=True).data
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    if orjson is None:
+        print("orjson is not installed; FastJSON* will use the fallback path")
+
+    data = build_payload(args.users)
+    stock, fast = JSONRenderer(), FastJSONRenderer()
+    body = stock.render(data)
+    identical = body == fast.render(data)
+
+    rows = []
+    for label, renderer, json_parser in (
+        ("JSONRenderer/JSONParser", stock, JSONParser()),
+        ("FastJSONRenderer/FastJSONParser", fast, FastJSONParser()),
+    ):
+        rows.append(
+            {
+                "implementation": label,
+                "render_ms": best_of(lambda: renderer.render(data), args.repeat),
+                "parse_ms": best_of(
+                    lambda: json_parser.parse(io.BytesIO(body)), args.repeat
+                ),
+            }
+        )
+    _bootstrap.report(
+        f"{args.users} users, {len(body) / 1024:.0f} KiB, identical={identical}",
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Login latency under concurrent load: sync LoginView vs AsyncLoginView.
+
+The sync view is driven from a thread per concurrent client (like a pool of
+WSGI workers); the async view is driven from one event loop, with password
+verification on the bounded hashing pool. 503s from load shedding are
+counted separately and excluded from the latency percentiles.
+
+    python benchmarks/login_latency.py --requests 200 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import _bootstrap
+
+from django.test import AsyncClient, Client
+
+PASSWORD = "BenchPass123!"
+
+
+def run_sync(emails, concurrency):
+    def login(email):
+        client = Client()
+        started = time.perf_counter()
+        response = client.post(
+            "/api/auth/login/",
+            json.dumps({"email": email, "password": PASSWORD}),
+            content_type="application/json",
+        )
+        return response.status_code, time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        results = list(pool.map(login, emails))
+    return results, time.perf_counter() - started
+
+
+async def run_async(emails, concurrency):
+    client = AsyncClient()
+    gate = asyncio.Semaphore(concurrency)
+
+    async def login(email):
+        async with gate:
+            started = time.perf_counter()
+            response = await client.post(
+                "/api/auth/login/async/",
+                {"email": email, "password": PASSWORD},
+                content_type="application/json",
+            )
+            return response.status_code, time.perf_counter() - started
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(login(email) for email in emails))
+    return results, time.perf_counter() - started
+
+
+def summarize(label, results, elapsed):
+    ok = [latency for code, latency in results if code == 200]
+    shed = sum(1 for code, _ in results if code == 503)
+    row = {"view": label, "ok": len(ok), "shed_503": shed}
+    if ok:
+        row.update(_bootstrap.percentiles(ok))
+    row["req/s"] = len(results) / elapsed
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    _bootstrap.without_auth_throttles().enable()
+    teardown = _bootstrap.setup_database()
+    try:
+        emails = _bootstrap.create_users(args.requests, password=PASSWORD)
+        rows = [
+            summarize("sync", *run_sync(emails, args.concurrency)),
+            summarize("async", *asyncio.run(run_async(emails, args.concurrency))),
+        ]
+        _bootstrap.report(
+            f"{args.requests} logins, concurrency {args.concurrency} (latency in ms)",
+            rows,
+        )
+    finally:
+        teardown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Per-request overhead of MetricsMiddleware on a cheap authenticated endpoint
+(/api/students/cohorts/, one query): middleware removed vs enabled at a few
+sample rates. Configurations are interleaved round by round so drift in the
+machine affects them equally; the best round of each is reported.
+
+    python benchmarks/metrics_overhead.py --requests 2000 --rounds 5
+"""
+
+import argparse
+import time
+
+import _bootstrap
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test.utils import override_settings
+from rest_framework.test import APIClient
+
+MIDDLEWARE_PATH = "apps.common.middleware.MetricsMiddleware"
+
+
+def make_client(admin, sample_rate):
+    middleware = [m for m in settings.MIDDLEWARE if m != MIDDLEWARE_PATH]
+    if sample_rate is not None:
+        middleware.insert(0, MIDDLEWARE_PATH)
+    # The handler (and the middleware's sample rate) is built on first use
+    with override_settings(MIDDLEWARE=middleware, METRICS_SAMPLE_RATE=sample_rate):
+        client = APIClient()
+        client.force_authenticate(admin)
+        client.get("/api/students/cohorts/")
+    return client
+
+
+def run(client, count):
+    started = time.perf_counter()
+    for _ in range(count):
+        client.get("/api/students/cohorts/")
+    return (time.perf_counter() - started) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--rates", default="1.0,0.1")
+    args = parser.parse_args()
+
+    teardown = _bootstrap.setup_database()
+    try:
+        admin = get_user_model().objects.create(
+            email="admin@bench.local", username="admin", role="admin"
+        )
+        configs = {"off": None}
+        configs.update({f"rate={rate}": float(rate) for rate in args.rates.split(",")})
+        clients = {name: make_client(admin, rate) for name, rate in configs.items()}
+
+        best = {name: float("inf") for name in configs}
+        for _ in range(args.rounds):
+            for name, client in clients.items():
+                best[name] = min(best[name], run(client, args.requests))
+
+        baseline = best["off"]
+        rows = [
+            {
+                "middleware": name,
+                "us_per_request": seconds * 1e6,
+                "overhead_%": (seconds / baseline - 1) * 100,
+            }
+            for name, seconds in best.items()
+        ]
+        _bootstrap.report(f"{args.requests} requests x {args.rounds} rounds", rows)
+    finally:
+        teardown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Admin user search: the stock ``icontains`` scan over search_fields vs the
+full-text index behind /api/search/ and UserAdmin.get_search_results.
+
+Each term is run as the admin changelist would (first page of 100 rows)
+and timed over several repeats.
+
+    python benchmarks/search.py --users 100000 --terms smith,bench42,exam
+"""
+
+import argparse
+import time
+
+import _bootstrap
+
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+
+from apps.authentication.admin import UserAdmin
+from apps.search.indexing import rebuild_index
+
+
+def timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        samples.append(time.perf_counter() - started)
+    return result, _bootstrap.percentiles(samples)["p50"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--terms", default="smith,bench4242,example")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    teardown = _bootstrap.setup_database()
+    try:
+        _bootstrap.create_users(args.users)
+        User = get_user_model()
+        # bulk_create skips the indexing signals
+        rebuild_index()
+        user_admin = UserAdmin(User, admin.site)
+        queryset = User.objects.all()
+
+        rows = []
+        for term in args.terms.split(","):
+
+            def scan():
+                found, _ = admin.ModelAdmin.get_search_results(
+                    user_admin, None, queryset, term
+                )
+                return list(found[:100])
+
+            def indexed():
+                found, _ = user_admin.get_search_results(None, queryset, term)
+                return list(found[:100])
+
+            scan_rows, scan_ms = timed(scan, args.repeat)
+            index_rows, index_ms = timed(indexed, args.repeat)
+            rows.append(
+                {
+                    "term": term,
+                    "icontains_ms": scan_ms,
+                    "fts_ms": index_ms,
+                    "icontains_rows": len(scan_rows),
+                    "fts_rows": len(index_rows),
+                }
+            )
+        _bootstrap.report(f"{args.users} users, first 100 matches", rows)
+    finally:
+        teardown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Sparse fieldsets: payload size and CPU time for a student listing rendered
+in full vs. trimmed with ``?fields=``.
+
+Serializes ``--rows`` StudentProfile rows three ways, the way
+SparseFieldsViewMixin would for each request:
+
+* ``full``: every field, model instances from the view's queryset,
+* ``only``: ``id,email,cohort_name`` fetched with ``.only()`` into
+  instances (what a subset with a method or nested field falls back to),
+* ``values``: the same subset fetched with ``.values()`` into dicts.
+
+CPU is process time for query + serialization + JSON rendering.
+
+    python benchmarks/sparse_fields.py --rows 10000
+"""
+
+import argparse
+import datetime
+import time
+
+import _bootstrap
+
+from django.contrib.auth import get_user_model
+from rest_framework.renderers import JSONRenderer
+
+from apps.common.mixins import SparseFieldsViewMixin
+from apps.students.models import Cohort, StudentProfile, Team
+from apps.students.serializers import StudentProfileSerializer
+from apps.students.views import StudentProfileQuerysetMixin
+
+SUBSET = ["id", "email", "cohort_name"]
+VARIANTS = (("full", None, False), ("only", SUBSET, False), ("values", SUBSET, True))
+
+
+class Projector(SparseFieldsViewMixin, StudentProfileQuerysetMixin):
+    """The view's queryset and projection, minus the request"""
+
+    pagination_class = None
+
+    def __init__(self, fields, use_values):
+        self.fields = fields
+        self.use_values = use_values
+
+    def get_sparse_fields(self):
+        return self.fields, None
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = StudentProfileSerializer(*args, fields=self.fields, **kwargs)
+        if not args and not self.use_values:
+            serializer.get_projection().values_ok = False
+        return serializer
+
+
+def seed(rows):
+    today = datetime.date.today()
+    cohort = Cohort.objects.create(name="Bench", start_date=today, end_date=today)
+    team = Team.objects.create(name="Bench team", cohort=cohort)
+    _bootstrap.create_users(rows)
+    StudentProfile.objects.bulk_create(
+        [
+            StudentProfile(
+                user=user,
+                student_id=f"S{index:07d}",
+                enrollment_date=today,
+                cohort=cohort,
+                team=team if index % 2 else None,
+            )
+            for index, user in enumerate(get_user_model().objects.all())
+        ],
+        batch_size=1000,
+    )
+
+
+def measure(label, fields, use_values, repeat):
+    projector = Projector(fields, use_values)
+    samples = []
+    for _ in range(repeat):
+        started = time.process_time()
+        queryset = projector.project_queryset(projector.get_queryset())
+        data = projector.get_serializer(queryset, many=True).data
+        body = JSONRenderer().render(data)
+        samples.append(time.process_time() - started)
+    return {
+        "variant": label,
+        "fields": ",".join(fields) if fields else "(all)",
+        "queryset": "values" if queryset._fields else "instances",
+        "bytes": len(body),
+        "cpu_ms": min(samples) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    teardown = _bootstrap.setup_database()
+    try:
+        seed(args.rows)
+        rows = [
+            measure(label, fields, use_values, args.repeat)
+            for label, fields, use_values in VARIANTS
+        ]
+        _bootstrap.report(f"{args.rows} student rows serialized", rows)
+    finally:
+        teardown()
+
+
+if __name__ == "__main__":
+    main()
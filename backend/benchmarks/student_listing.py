@@ -0,0 +1,113 @@
+"""
+Deep-page latency of the student listing: keyset (cursor) pagination as
+served by /api/students/ vs the global PageNumberPagination (COUNT + OFFSET).
+
+The keyset run walks the ``next`` cursors from page 1 and records the
+latency of selected pages; the offset run requests ``?page=N`` directly.
+
+    python benchmarks/student_listing.py --students 100000 --pages 1,100,500
+"""
+
+import argparse
+import time
+
+import _bootstrap
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+
+from apps.students.models import Cohort, StudentProfile, Team
+from apps.students.views import StudentProfileListView
+
+
+class OffsetStudentListView(StudentProfileListView):
+    pagination_class = PageNumberPagination
+
+    def get_queryset(self):
+        return super().get_queryset().order_by("id")
+
+
+def populate(count):
+    User = get_user_model()
+    emails = _bootstrap.create_users(count)
+    cohort = Cohort.objects.create(
+        name="Bench", start_date="2026-01-01", end_date="2026-12-31"
+    )
+    teams = Team.objects.bulk_create(
+        [Team(name=f"Team {i}", cohort=cohort) for i in range(max(1, count // 5))]
+    )
+    today = timezone.localdate()
+    users = User.objects.filter(email__in=emails).only("id").iterator(chunk_size=5000)
+    StudentProfile.objects.bulk_create(
+        (
+            StudentProfile(
+                user=user,
+                student_id=f"S{i:07d}",
+                cohort=cohort,
+                team=teams[i % len(teams)],
+                enrollment_date=today,
+            )
+            for i, user in enumerate(users)
+        ),
+        batch_size=5000,
+    )
+
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--students", type=int, default=100_000)
+    parser.add_argument("--pages", default="1,10,100,500")
+    args = parser.parse_args()
+    pages = sorted(int(page) for page in args.pages.split(","))
+
+    teardown = _bootstrap.setup_database()
+    try:
+        populate(args.students)
+        admin = get_user_model().objects.create(
+            email="admin@bench.local", username="admin", role="admin"
+        )
+        client = APIClient()
+        client.force_authenticate(admin)
+
+        keyset = {}
+        url = "/api/students/"
+        for page in range(1, pages[-1] + 1):
+            response, elapsed = timed(lambda: client.get(url))
+            if page in pages:
+                keyset[page] = elapsed
+            url = response.data["next"]
+            if url is None:
+                break
+
+        view = OffsetStudentListView.as_view()
+        factory = APIRequestFactory()
+        offset = {}
+        for page in pages:
+            request = factory.get("/api/students/", {"page": page})
+            force_authenticate(request, admin)
+            _, elapsed = timed(lambda: view(request).render())
+            offset[page] = elapsed
+
+        rows = [
+            {
+                "page": page,
+                "keyset_ms": keyset.get(page, float("nan")),
+                "offset_ms": offset[page],
+            }
+            for page in pages
+        ]
+        _bootstrap.report(f"{args.students} students, 20 per page", rows)
+    finally:
+        teardown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Solve time of the team formation engine as cohort size grows.
+
+The pure solver (apps.students.team_formation.solve) is timed on synthetic
+cohorts with a mix of graduation years and a sprinkling of keep-together /
+keep-apart pairs; the largest size is also run end to end through
+form_teams() to include the bulk_create/bulk_update writes.
+
+    python benchmarks/team_formation.py --sizes 500,2000,5000,10000
+"""
+
+import argparse
+import random
+import time
+
+import _bootstrap
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from apps.students.models import Cohort, StudentProfile
+from apps.students.team_formation import FormationConstraints, form_teams, solve
+
+YEARS = [2026, 2027, 2028, 2029, None]
+
+
+def synthetic(count, rng):
+    ids = list(range(1, count + 1))
+    years = [rng.choice(YEARS) for _ in ids]
+    shuffled = rng.sample(ids, min(count, 200))
+    together = [tuple(shuffled[i : i + 2]) for i in range(0, 100, 2)]
+    apart = [tuple(shuffled[i : i + 2]) for i in range(100, 200, 2)]
+    return ids, years, together, apart
+
+
+def populate(count, rng):
+    User = get_user_model()
+    emails = _bootstrap.create_users(count)
+    cohort = Cohort.objects.create(
+        name="Bench", start_date="2026-01-01", end_date="2026-12-31"
+    )
+    today = timezone.localdate()
+    users = User.objects.filter(email__in=emails).only("id").iterator(chunk_size=5000)
+    StudentProfile.objects.bulk_create(
+        (
+            StudentProfile(
+                user=user,
+                student_id=f"S{i:07d}",
+                cohort=cohort,
+                graduation_year=rng.choice(YEARS),
+                enrollment_date=today,
+            )
+            for i, user in enumerate(users)
+        ),
+        batch_size=5000,
+    )
+    return cohort
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="500,2000,5000,10000")
+    parser.add_argument("--min-size", type=int, default=3)
+    parser.add_argument("--max-size", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    rng = random.Random(42)
+
+    rows = []
+    for size in sizes:
+        ids, years, together, apart = synthetic(size, rng)
+        constraints = FormationConstraints(
+            args.min_size, args.max_size, together, apart
+        )
+        timings = []
+        for _ in range(args.repeat):
+            _, team_sizes, imbalance, elapsed = solve(ids, years, constraints)
+            timings.append(elapsed)
+        rows.append(
+            {
+                "students": size,
+                "teams": len(team_sizes),
+                "best_ms": min(timings) * 1000,
+                "imbalance": imbalance,
+            }
+        )
+    _bootstrap.report(f"solve(), teams of {args.min_size}-{args.max_size}", rows)
+
+    teardown = _bootstrap.setup_database()
+    try:
+        cohort = populate(sizes[-1], rng)
+        constraints = FormationConstraints(args.min_size, args.max_size)
+        started = time.perf_counter()
+        result = form_teams(cohort, constraints)
+        total = time.perf_counter() - started
+        _bootstrap.report(
+            "form_teams() end to end",
+            [
+                {
+                    "students": sizes[-1],
+                    "teams": len(result.teams),
+                    "solve_ms": result.solve_seconds * 1000,
+                    "total_ms": total * 1000,
+                }
+            ],
+        )
+    finally:
+        teardown()
+
+
+if __name__ == "__main__":
+    main()
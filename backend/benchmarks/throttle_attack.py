@@ -0,0 +1,159 @@
+"""
+Password-hashing load under login attack patterns, with and without the
+token-bucket throttles from apps/authentication/throttles.py.
+
+Every attempt uses a wrong password, so each one that gets past the
+throttles costs a full password hash. Patterns:
+
+* stuffing: one client IP cycling through many emails (login_ip bucket)
+* spraying: many client IPs all targeting one email (login_email bucket)
+* distributed: a fresh IP and email per attempt; no per-key bucket can
+  bound this one, the async view's hashing pool (503s) is the backstop
+
+"hashes" counts attempts that reached the hasher; "budget" is the most the
+bucket allows over the run (burst + refill for the elapsed time).
+"hash_cores" is hashes x the measured cost of one hash / wall time, i.e.
+how many CPU cores the attack keeps busy hashing. The attacking clients
+run in this process too, so total process CPU would not separate the two.
+
+The defaults are the configured rates; a small burst makes the refill
+regime visible in a short run:
+
+    python benchmarks/throttle_attack.py --seconds 30 --login-ip 10/min
+"""
+
+import argparse
+import json
+import logging
+import threading
+import time
+from itertools import count
+
+import _bootstrap
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.cache import caches
+from django.test import Client
+from django.test.utils import override_settings
+
+from apps.authentication.throttles import LoginEmailThrottle, LoginIPThrottle
+
+
+def _ip(n):
+    return f"10.{n >> 16 & 255}.{n >> 8 & 255}.{n & 255}"
+
+
+PATTERNS = {
+    # attempt number -> (client ip, email)
+    "stuffing": lambda n: ("10.0.0.1", f"victim{n}@example.com"),
+    "spraying": lambda n: (_ip(n), "victim@example.com"),
+    "distributed": lambda n: (_ip(n), f"victim{n}@example.com"),
+}
+BUDGET_THROTTLE = {"stuffing": LoginIPThrottle, "spraying": LoginEmailThrottle}
+
+
+def attack(pattern, threads, seconds):
+    make = PATTERNS[pattern]
+    sequence = count()
+    lock = threading.Lock()
+    statuses = {}
+    deadline = time.monotonic() + seconds
+
+    def worker():
+        client = Client()
+        while time.monotonic() < deadline:
+            with lock:
+                n = next(sequence)
+            ip, email = make(n)
+            response = client.post(
+                "/api/auth/login/",
+                json.dumps({"email": email, "password": "wrong-password"}),
+                content_type="application/json",
+                REMOTE_ADDR=ip,
+            )
+            with lock:
+                statuses[response.status_code] = (
+                    statuses.get(response.status_code, 0) + 1
+                )
+
+    started = time.monotonic()
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return statuses, time.monotonic() - started
+
+
+def budget(pattern, elapsed):
+    throttle_class = BUDGET_THROTTLE.get(pattern)
+    throttle = throttle_class() if throttle_class else None
+    if throttle is None or throttle.rate is None:
+        return "-"
+    num, duration = throttle.num_requests, throttle.duration
+    return int(num + elapsed * num / duration)
+
+
+def hash_cost(samples=3):
+    started = time.perf_counter()
+    for _ in range(samples):
+        make_password("wrong-password")
+    return (time.perf_counter() - started) / samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--patterns", default=",".join(PATTERNS))
+    parser.add_argument("--login-ip", help="override the login_ip rate")
+    parser.add_argument("--login-email", help="override the login_email rate")
+    args = parser.parse_args()
+    # Every failed attempt would otherwise log a warning
+    logging.getLogger("django.request").setLevel(logging.ERROR)
+
+    rates = dict(settings.REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"])
+    if args.login_ip:
+        rates["login_ip"] = args.login_ip
+    if args.login_email:
+        rates["login_email"] = args.login_email
+    override_settings(
+        REST_FRAMEWORK={**settings.REST_FRAMEWORK, "DEFAULT_THROTTLE_RATES": rates}
+    ).enable()
+
+    teardown = _bootstrap.setup_database()
+    try:
+        cost = hash_cost()
+        rows = []
+        for pattern in args.patterns.split(","):
+            for throttled in (False, True):
+                caches[settings.AUTH_THROTTLE_CACHE].clear()
+                if throttled:
+                    statuses, elapsed = attack(pattern, args.threads, args.seconds)
+                else:
+                    with _bootstrap.without_auth_throttles():
+                        statuses, elapsed = attack(pattern, args.threads, args.seconds)
+                hashes = statuses.get(401, 0)
+                rows.append(
+                    {
+                        "pattern": pattern,
+                        "throttles": "on" if throttled else "off",
+                        "attempts": sum(statuses.values()),
+                        "rejected_429": statuses.get(429, 0),
+                        "hashes": hashes,
+                        "budget": budget(pattern, elapsed) if throttled else "-",
+                        "hash_cores": hashes * cost / elapsed,
+                    }
+                )
+        _bootstrap.report(
+            f"{args.threads} attacking threads, {args.seconds:g}s per run, "
+            f"{cost * 1000:.0f} ms per hash",
+            rows,
+        )
+    finally:
+        teardown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Refresh-token rotation throughput per blacklist backend, and RevokedToken
+table size before/after ``purge_revoked_tokens``.
+
+Each refresh verifies the presented token against the blacklist and revokes
+it (ROTATE_REFRESH_TOKENS + BLACKLIST_AFTER_ROTATION). Rows are then aged
+past their expiry to show what the purge command reclaims.
+
+    python benchmarks/token_refresh.py --refreshes 2000
+"""
+
+import argparse
+import time
+from datetime import timedelta
+
+import _bootstrap
+
+from django.core.management import call_command
+from django.test import Client
+from django.utils import timezone
+
+from apps.authentication import blacklist
+from apps.authentication.models import RevokedToken
+from apps.authentication.tokens import PlatformRefreshToken
+
+BACKENDS = {
+    "database": blacklist.DatabaseBlacklist,
+    "bloom": blacklist.BufferedBloomBlacklist,
+}
+
+
+def run(backend_name, user, refreshes):
+    blacklist._blacklist = BACKENDS[backend_name]()
+    RevokedToken.objects.all().delete()
+    client = Client()
+    token = str(PlatformRefreshToken.for_user(user))
+
+    started = time.perf_counter()
+    for _ in range(refreshes):
+        response = client.post(
+            "/api/auth/token/refresh/", {"refresh": token}, content_type="application/json"
+        )
+        token = response.json()["refresh"]
+    blacklist.get_blacklist().flush()
+    elapsed = time.perf_counter() - started
+
+    rows_before = RevokedToken.objects.count()
+    RevokedToken.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+    call_command("purge_revoked_tokens", stdout=open("/dev/null", "w"))
+    return {
+        "backend": backend_name,
+        "refresh/s": refreshes / elapsed,
+        "rows_after_run": rows_before,
+        "rows_after_purge": RevokedToken.objects.count(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--refreshes", type=int, default=1000)
+    args = parser.parse_args()
+
+    teardown = _bootstrap.setup_database()
+    try:
+        _bootstrap.create_users(1)
+        from django.contrib.auth import get_user_model
+
+        user = get_user_model().objects.get()
+        rows = [run(name, user, args.refreshes) for name in BACKENDS]
+        _bootstrap.report(f"{args.refreshes} sequential refreshes", rows)
+    finally:
+        teardown()
+
+
+if __name__ == "__main__":
+    main()
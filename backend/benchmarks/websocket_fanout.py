@@ -0,0 +1,157 @@
+"""
+WebSocket notification fan-out: messages/sec to thousands of connected
+clients, with and without per-channel batching.
+
+Clients connect to ``config.asgi.application`` in-process through the ASGI
+websocket protocol (JWT handshake included) and each follows one cohort
+channel. A burst of events is then published from a separate thread, as
+the model signals would, and the run ends once every client has drained
+its queue. ``delivered`` counts events that reached a reading client;
+events dropped by an overflow are not in it. A fraction of clients never read (``--stalled``) to show that
+backpressure keeps them from holding up the rest; they end with an
+overflow frame instead of an unbounded backlog.
+
+    python benchmarks/websocket_fanout.py --clients 5000 --events 5000
+"""
+
+import argparse
+import asyncio
+import time
+
+import _bootstrap
+
+from django.contrib.auth import get_user_model
+
+from apps.authentication.tokens import PlatformRefreshToken
+from apps.notifications import websocket
+from apps.notifications.hub import cohort_group, get_hub
+
+PATH = "/ws/notifications/"
+
+
+class BenchSocket(websocket.NotificationSocket):
+    async def _pump(self, subscriber, send):
+        send.subscriber = subscriber
+        await super()._pump(subscriber, send)
+
+
+class FakeClient:
+    """Both ends of one in-memory ASGI websocket connection"""
+
+    def __init__(self, token, cohort, stalled=False):
+        self.scope = {
+            "type": "websocket",
+            "path": PATH,
+            "query_string": b"",
+            "headers": [(b"authorization", f"Bearer {token}".encode())],
+        }
+        self.cohort = cohort
+        self.stalled = stalled
+        self.subscriber = None
+        self.connected = False
+        self.frames = 0
+        self.events = 0
+        self.inbox = asyncio.Queue()
+        self.replies = asyncio.Queue()
+
+    async def __call__(self, message):
+        if not self.connected:
+            await self.replies.put(message)
+            return
+        self.frames += 1
+        self.events += message["text"].count('"model"')
+        if self.stalled:
+            await asyncio.Event().wait()
+
+    async def connect(self, app):
+        await self.inbox.put({"type": "websocket.connect"})
+        self.task = asyncio.create_task(app(self.scope, self.inbox.get, self))
+        assert (await self.replies.get())["type"] == "websocket.accept"
+        await self.inbox.put(
+            {
+                "type": "websocket.receive",
+                "text": f'{{"action": "subscribe", "channel": "cohort:{self.cohort}"}}',
+            }
+        )
+        assert (await self.replies.get())["text"].startswith('{"type": "subscribed"')
+        self.connected = True
+
+
+def publish_burst(hub, events, cohorts):
+    for index in range(events):
+        hub.publish(cohort_group(index % cohorts + 1), {"model": "team", "id": index})
+
+
+async def run(tokens, args, batched):
+    hub = get_hub()
+    hub.batch_window = 0.05 if batched else 0
+    hub.batch_size = 100 if batched else 1
+    app = BenchSocket()
+    stalled_every = int(1 / args.stalled) if args.stalled else 0
+    clients = [
+        FakeClient(
+            token,
+            cohort=index % args.cohorts + 1,
+            stalled=bool(stalled_every) and index % stalled_every == 0,
+        )
+        for index, token in enumerate(tokens)
+    ]
+
+    started = time.perf_counter()
+    for offset in range(0, len(clients), 500):
+        await asyncio.gather(*(c.connect(app) for c in clients[offset : offset + 500]))
+    connect_elapsed = time.perf_counter() - started
+
+    live = [c for c in clients if not c.stalled]
+    started = time.perf_counter()
+    await asyncio.to_thread(publish_burst, hub, args.events, args.cohorts)
+    while hub._pending or any(c.subscriber._frames for c in live):
+        await asyncio.sleep(0.005)
+    elapsed = time.perf_counter() - started
+
+    frames = sum(c.frames for c in live)
+    delivered = sum(c.events for c in live)
+    overflowed = sum(1 for c in clients if c.subscriber and c.subscriber.dropped)
+    for client in clients:
+        client.task.cancel()
+    await asyncio.gather(*(c.task for c in clients), return_exceptions=True)
+
+    return {
+        "batching": "on" if batched else "off",
+        "connect/s": len(clients) / connect_elapsed,
+        "frames": frames,
+        "frames/s": frames / elapsed,
+        "delivered": delivered,
+        "events/s": delivered / elapsed,
+        "drain_ms": elapsed * 1000,
+        "overflowed": overflowed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=5000)
+    parser.add_argument("--cohorts", type=int, default=50)
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--stalled", type=float, default=0.01)
+    args = parser.parse_args()
+
+    teardown = _bootstrap.setup_database()
+    try:
+        _bootstrap.create_users(args.clients, role="professor")
+        tokens = [
+            str(PlatformRefreshToken.for_user(user).access_token)
+            for user in get_user_model().objects.all()
+        ]
+        rows = [asyncio.run(run(tokens, args, batched)) for batched in (False, True)]
+        _bootstrap.report(
+            f"{args.clients} clients over {args.cohorts} cohort channels, "
+            f"{args.events} events ({args.stalled:.0%} of clients stalled)",
+            rows,
+        )
+    finally:
+        teardown()
+
+
+if __name__ == "__main__":
+    main()
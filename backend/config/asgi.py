@@ -1,5 +1,8 @@
 """
 ASGI config for capstone management platform project.
+
+Serves the API over HTTP and the notification WebSocket
+(apps/notifications) from one process.
 """
 
 import os
@@ -8,4 +11,23 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Imported after the Django app is set up
+from apps.notifications import websocket  # noqa: E402
+
+websocket_routes = {
+    "/ws/notifications/": websocket.NotificationSocket(),
+}
+
+
+async def application(scope, receive, send):
+    """HTTP goes to Django; WebSocket paths to the handlers above"""
+    if scope["type"] == "websocket":
+        handler = websocket_routes.get(scope["path"])
+        if handler is None:
+            await receive()
+            await send({"type": "websocket.close", "code": websocket.CLOSE_NOT_FOUND})
+            return
+        return await handler(scope, receive, send)
+    return await django_application(scope, receive, send)
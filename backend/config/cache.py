@@ -0,0 +1,60 @@
+"""
+Builds ``CACHES["default"]`` from the environment.
+
+``CACHE_URL`` selects the backend:
+
+    locmem://                            (per-process memory, the default)
+    file:///cache                        (relative to backend/)
+    file:////var/tmp/capstone-cache
+    redis://localhost:6379/0             (or rediss://; needs the redis package)
+    dummy://                             (caching off)
+
+Anything speaking the Redis protocol can serve a ``redis://`` URL (Redis,
+Valkey, KeyDB, or a local stand-in during development). Query string
+parameters on a Redis URL are passed through as OPTIONS.
+"""
+
+from pathlib import Path
+from urllib.parse import parse_qsl, unquote, urlsplit, urlunsplit
+
+from django.core.exceptions import ImproperlyConfigured
+
+BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+    "rediss": "django.core.cache.backends.redis.RedisCache",
+    "dummy": "django.core.cache.backends.dummy.DummyCache",
+}
+
+
+def parse_cache_url(url, base_dir):
+    """Translate a cache URL into a Django cache settings dict"""
+    parts = urlsplit(url)
+    backend = BACKENDS.get(parts.scheme)
+    if backend is None:
+        raise ImproperlyConfigured(f"Unsupported CACHE_URL scheme: {parts.scheme}")
+
+    if parts.scheme == "locmem":
+        return {"BACKEND": backend, "LOCATION": parts.netloc or "default"}
+    if parts.scheme == "file":
+        # file:///name is relative, file:////abs/name is absolute
+        path = unquote(parts.path)[1:]
+        if not path:
+            raise ImproperlyConfigured("CACHE_URL file:// needs a directory")
+        return {"BACKEND": backend, "LOCATION": str(Path(base_dir) / path)}
+    if parts.scheme in ("redis", "rediss"):
+        return {
+            "BACKEND": backend,
+            "LOCATION": urlunsplit(parts._replace(query="")),
+            "OPTIONS": dict(parse_qsl(parts.query)),
+        }
+    return {"BACKEND": backend}
+
+
+def cache_config(url, base_dir, timeout=300, key_prefix=""):
+    """Settings for one cache; ``timeout`` is the default entry lifetime"""
+    cache = parse_cache_url(url, base_dir)
+    cache["TIMEOUT"] = timeout
+    cache["KEY_PREFIX"] = key_prefix
+    return cache
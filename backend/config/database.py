@@ -0,0 +1,81 @@
+"""
+Builds ``DATABASES["default"]`` from the environment.
+
+``DATABASE_URL`` selects the engine:
+
+    sqlite:///db.sqlite3                 (relative to backend/)
+    sqlite:////var/lib/capstone/db.sqlite3
+    postgresql://user:password@db:5432/capstone_db?sslmode=require
+
+Query string parameters on a Postgres URL are passed through as OPTIONS.
+"""
+
+from pathlib import Path
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import django
+from django.core.exceptions import ImproperlyConfigured
+
+ENGINES = {
+    "sqlite": "django.db.backends.sqlite3",
+    "postgres": "django.db.backends.postgresql",
+    "postgresql": "django.db.backends.postgresql",
+    "pgsql": "django.db.backends.postgresql",
+}
+
+
+def parse_database_url(url, base_dir):
+    """Translate a database URL into a Django database settings dict"""
+    parts = urlsplit(url)
+    engine = ENGINES.get(parts.scheme)
+    if engine is None:
+        raise ImproperlyConfigured(f"Unsupported DATABASE_URL scheme: {parts.scheme}")
+
+    if engine.endswith("sqlite3"):
+        # sqlite:///name is relative, sqlite:////abs/name is absolute
+        path = unquote(parts.path)[1:]
+        if path in ("", ":memory:"):
+            return {"ENGINE": engine, "NAME": ":memory:"}
+        return {"ENGINE": engine, "NAME": Path(base_dir) / path}
+
+    return {
+        "ENGINE": engine,
+        "NAME": unquote(parts.path.lstrip("/")),
+        "USER": unquote(parts.username or ""),
+        "PASSWORD": unquote(parts.password or ""),
+        "HOST": parts.hostname or "",
+        "PORT": str(parts.port or ""),
+        "OPTIONS": dict(parse_qsl(parts.query)),
+    }
+
+
+def database_config(
+    url,
+    base_dir,
+    conn_max_age=0,
+    conn_health_checks=False,
+    pool=False,
+    pool_min_size=2,
+    pool_max_size=10,
+):
+    """
+    Settings for one database. ``conn_max_age`` keeps connections open
+    across requests (None = forever), with ``conn_health_checks`` pinging
+    a reused connection before handing it out. ``pool`` switches Postgres
+    to psycopg's connection pool, which Django supports from 5.1 on;
+    Django requires persistent connections to be off in that case.
+    """
+    db = parse_database_url(url, base_dir)
+    db["CONN_MAX_AGE"] = conn_max_age
+    db["CONN_HEALTH_CHECKS"] = conn_health_checks
+    if pool:
+        if not db["ENGINE"].endswith("postgresql"):
+            raise ImproperlyConfigured("DB_POOL is only supported on PostgreSQL")
+        if django.VERSION < (5, 1):
+            raise ImproperlyConfigured(
+                "DB_POOL needs Django 5.1+ and psycopg 3; use DB_CONN_MAX_AGE "
+                "(or PgBouncer) on this version"
+            )
+        db["OPTIONS"]["pool"] = {"min_size": pool_min_size, "max_size": pool_max_size}
+        db["CONN_MAX_AGE"] = 0
+    return db
@@ -6,6 +6,9 @@ from pathlib import Path
 from datetime import timedelta
 from decouple import config
 
+from .cache import cache_config
+from .database import database_config
+
 # Build paths inside the project
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -36,6 +39,9 @@ INSTALLED_APPS = [
     "apps.professors",
     "apps.admin",
     "apps.common",
+    "apps.search",
+    "apps.jobs",
+    "apps.notifications",
 ]
 
 MIDDLEWARE = [
@@ -49,6 +55,23 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Per-route request metrics served at /metrics (apps/common/middleware.py).
+# Request counts are exact; timings, sizes and DB figures are recorded for
+# METRICS_SAMPLE_RATE of requests
+METRICS_ENABLED = config("METRICS_ENABLED", default=True, cast=bool)
+METRICS_SAMPLE_RATE = config("METRICS_SAMPLE_RATE", default=1.0, cast=float)
+if METRICS_ENABLED:
+    MIDDLEWARE.insert(0, "apps.common.middleware.MetricsMiddleware")
+
+# N+1 query detection (apps/common/nplusone.py): queries repeated
+# NPLUSONE_THRESHOLD times in one request are logged with their call site,
+# or raise with NPLUSONE_STRICT (e.g. in CI test runs)
+NPLUSONE_ENABLED = config("NPLUSONE_ENABLED", default=DEBUG, cast=bool)
+NPLUSONE_STRICT = config("NPLUSONE_STRICT", default=False, cast=bool)
+NPLUSONE_THRESHOLD = config("NPLUSONE_THRESHOLD", default=3, cast=int)
+if NPLUSONE_ENABLED:
+    MIDDLEWARE.append("apps.common.middleware.NPlusOneMiddleware")
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
@@ -69,14 +92,50 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "config.wsgi.application"
 
-# Database
+# Database (config/database.py): SQLite by default, PostgreSQL via DATABASE_URL
 DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
+    "default": database_config(
+        config("DATABASE_URL", default="sqlite:///db.sqlite3"),
+        BASE_DIR,
+        # Seconds to keep a connection between requests; 0 closes it each time
+        conn_max_age=config("DB_CONN_MAX_AGE", default=0, cast=int),
+        conn_health_checks=config("DB_CONN_HEALTH_CHECKS", default=False, cast=bool),
+        pool=config("DB_POOL", default=False, cast=bool),
+        pool_min_size=config("DB_POOL_MIN_SIZE", default=2, cast=int),
+        pool_max_size=config("DB_POOL_MAX_SIZE", default=10, cast=int),
+    )
+}
+
+# Tuned SQLite connections (apps/common/db.py): WAL lets readers run
+# alongside the single writer, and busy_timeout makes writers wait for the
+# lock instead of failing with "database is locked"
+SQLITE_TUNED = config("SQLITE_TUNED", default=False, cast=bool)
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "busy_timeout": config("SQLITE_BUSY_TIMEOUT", default=5000, cast=int),
+    "synchronous": "NORMAL",
+    "mmap_size": config("SQLITE_MMAP_SIZE", default=256 * 1024 * 1024, cast=int),
+}
+
+# Cache (config/cache.py): locmem://, file:///<dir>, redis://host:port/db.
+# The token_version checks and auth throttles share it across workers
+# only on a shared backend (file or Redis)
+CACHES = {
+    "default": cache_config(
+        config("CACHE_URL", default="locmem://"),
+        BASE_DIR,
+        timeout=config("CACHE_TIMEOUT", default=300, cast=int),
+        key_prefix=config("CACHE_KEY_PREFIX", default="capstone"),
+    )
 }
 
+# Read-through cache for cohorts, teams and courses (apps/common/cache.py),
+# invalidated by the signals in apps/students/signals.py
+CATALOG_CACHE = config("CATALOG_CACHE", default="default")
+CATALOG_CACHE_TIMEOUT = config("CATALOG_CACHE_TIMEOUT", default=600, cast=int)
+# How long concurrent readers wait for one recompute before doing their own
+CATALOG_CACHE_LOCK_TIMEOUT = config("CATALOG_CACHE_LOCK_TIMEOUT", default=10, cast=int)
+
 # Custom User Model
 AUTH_USER_MODEL = "authentication.User"
 
@@ -110,20 +169,81 @@ STATIC_ROOT = BASE_DIR / "static"
 MEDIA_URL = "media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Private files handed to or produced by background jobs (roster uploads,
+# exports). Web and worker processes must see the same location
+JOBS_FILES_ROOT = config("JOBS_FILES_ROOT", default=str(BASE_DIR / "job_files"))
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    "jobs": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+        "OPTIONS": {"location": JOBS_FILES_ROOT, "base_url": None},
+    },
+}
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Stateless JWT mode: build request.user from token claims instead of
+# querying the User table on every authenticated request
+JWT_STATELESS_AUTH = config("JWT_STATELESS_AUTH", default=False, cast=bool)
+JWT_USER_CACHE_SIZE = config("JWT_USER_CACHE_SIZE", default=2048, cast=int)
+JWT_USER_CACHE_TTL = config("JWT_USER_CACHE_TTL", default=60, cast=int)
+# How long another worker may keep accepting tokens after a revocation
+TOKEN_VERSION_CACHE_TTL = config("TOKEN_VERSION_CACHE_TTL", default=30, cast=int)
+
+# orjson renderer/parser (apps/common/renderers.py, parsers.py); they fall
+# back to the stdlib json module when orjson isn't installed
+API_FAST_JSON = config("API_FAST_JSON", default=False, cast=bool)
+
 # REST Framework settings
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        (
+            "apps.authentication.authentication.StatelessJWTAuthentication"
+            if JWT_STATELESS_AUTH
+            else "apps.authentication.authentication.VersionedJWTAuthentication"
+        ),
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
-    "DEFAULT_RENDERER_CLASSES": ("rest_framework.renderers.JSONRenderer",),
+    "DEFAULT_RENDERER_CLASSES": (
+        (
+            "apps.common.renderers.FastJSONRenderer"
+            if API_FAST_JSON
+            else "rest_framework.renderers.JSONRenderer"
+        ),
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        (
+            "apps.common.parsers.FastJSONParser"
+            if API_FAST_JSON
+            else "rest_framework.parsers.JSONParser"
+        ),
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
+    # Reverse proxies in front of the app: throttles take the client IP from
+    # that many entries back in X-Forwarded-For. With 0 the header is ignored
+    # and REMOTE_ADDR is used, so clients cannot pick their own bucket.
+    "NUM_PROXIES": config("NUM_PROXIES", default=0, cast=int),
+    # Token buckets for login/registration (apps/authentication/throttles.py);
+    # an empty value disables that bucket
+    "DEFAULT_THROTTLE_RATES": {
+        "login_ip": config("AUTH_THROTTLE_LOGIN_IP", default="30/min") or None,
+        "login_email": config("AUTH_THROTTLE_LOGIN_EMAIL", default="10/min") or None,
+        "register_ip": config("AUTH_THROTTLE_REGISTER_IP", default="20/hour") or None,
+        "register_email": (
+            config("AUTH_THROTTLE_REGISTER_EMAIL", default="5/hour") or None
+        ),
+    },
 }
 
+# Cache alias holding the throttle buckets; use a shared cache so every
+# worker draws from the same budget
+AUTH_THROTTLE_CACHE = config("AUTH_THROTTLE_CACHE", default="default")
+
 # JWT Settings
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(
@@ -139,8 +259,64 @@ SIMPLE_JWT = {
     "SIGNING_KEY": SECRET_KEY,
     "AUTH_HEADER_TYPES": ("Bearer",),
     "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
+    "TOKEN_REFRESH_SERIALIZER": "apps.authentication.serializers.PlatformTokenRefreshSerializer",
+}
+
+# Refresh token blacklist (apps/authentication/blacklist.py)
+TOKEN_BLACKLIST = {
+    "BACKEND": config(
+        "TOKEN_BLACKLIST_BACKEND",
+        default="apps.authentication.blacklist.BufferedBloomBlacklist",
+    ),
+    "OPTIONS": {
+        "flush_interval": 2.0,
+        "flush_batch": 500,
+        "sync_interval": 5.0,
+        "sync_overlap": 60.0,
+        "bloom_capacity": 100_000,
+        "bloom_error_rate": 0.001,
+    },
 }
 
+# Password hashing pool for the async login view (apps/authentication/hashing.py)
+AUTH_HASH_EXECUTOR = config("AUTH_HASH_EXECUTOR", default="thread")  # or "process"
+AUTH_HASH_WORKERS = config("AUTH_HASH_WORKERS", default=4, cast=int)
+AUTH_HASH_MAX_PENDING = config("AUTH_HASH_MAX_PENDING", default=32, cast=int)
+AUTH_HASH_RETRY_AFTER = config("AUTH_HASH_RETRY_AFTER", default=2, cast=int)
+
+# Background job queue (apps/jobs); run workers with `manage.py runworker`
+JOBS_WORKER_PROCESSES = config("JOBS_WORKER_PROCESSES", default=2, cast=int)
+JOBS_POLL_INTERVAL = config("JOBS_POLL_INTERVAL", default=1.0, cast=float)
+JOBS_MAX_ATTEMPTS = config("JOBS_MAX_ATTEMPTS", default=3, cast=int)
+# Retry n waits JOBS_RETRY_BACKOFF * 2**(n-1) seconds, capped at the max
+JOBS_RETRY_BACKOFF = config("JOBS_RETRY_BACKOFF", default=10.0, cast=float)
+JOBS_RETRY_BACKOFF_MAX = config("JOBS_RETRY_BACKOFF_MAX", default=3600.0, cast=float)
+# Running jobs refresh their lock this often; a job whose worker has been
+# silent for JOBS_LOCK_TIMEOUT is requeued, however long it has been running
+JOBS_HEARTBEAT_INTERVAL = config("JOBS_HEARTBEAT_INTERVAL", default=60.0, cast=float)
+JOBS_LOCK_TIMEOUT = config("JOBS_LOCK_TIMEOUT", default=300, cast=int)
+
+# WebSocket notifications (apps/notifications); LocalLayer for a single
+# ASGI process, PostgresLayer (LISTEN/NOTIFY) to fan out across processes
+NOTIFICATIONS_LAYER = {
+    "BACKEND": config(
+        "NOTIFICATIONS_LAYER_BACKEND",
+        default="apps.notifications.layers.LocalLayer",
+    ),
+    "OPTIONS": {},
+}
+# Events are batched per channel for this many seconds (or this many events)
+NOTIFICATIONS_BATCH_WINDOW = config(
+    "NOTIFICATIONS_BATCH_WINDOW", default=0.05, cast=float
+)
+NOTIFICATIONS_BATCH_SIZE = config("NOTIFICATIONS_BATCH_SIZE", default=100, cast=int)
+# Frames queued for a socket before its backlog is replaced by an overflow
+NOTIFICATIONS_MAX_PENDING = config("NOTIFICATIONS_MAX_PENDING", default=64, cast=int)
+
+# Write-behind buffer for last_login (apps/authentication/last_login.py)
+LAST_LOGIN_FLUSH_INTERVAL = config("LAST_LOGIN_FLUSH_INTERVAL", default=5.0, cast=float)
+LAST_LOGIN_FLUSH_MAX = config("LAST_LOGIN_FLUSH_MAX", default=500, cast=int)
+
 # CORS Settings
 CORS_ALLOWED_ORIGINS = config(
     "CORS_ALLOWED_ORIGINS", default="http://localhost:3000,http://127.0.0.1:3000"
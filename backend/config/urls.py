@@ -7,13 +7,20 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
+from apps.common.views import MetricsView
+
 urlpatterns = [
     path("admin/", admin.site.urls),
+    # Prometheus scrape endpoint (admin JWT required)
+    path("metrics", MetricsView.as_view(), name="metrics"),
     # API routes - Three separate registration endpoints
     path("api/auth/", include("apps.authentication.urls")),
     path("api/users/", include("apps.users.urls")),
     path("api/students/", include("apps.students.urls")),
     path("api/professors/", include("apps.professors.urls")),
+    path("api/search/", include("apps.search.urls")),
+    path("api/admin/", include("apps.admin.urls")),
+    path("api/jobs/", include("apps.jobs.urls")),
 ]
 
 # Serve media files in development